@@ -5,6 +5,12 @@ from flask import Flask, jsonify
 from flask_cors import CORS
 from routes.projects import projects_bp
 from routes.contact import contact_bp
+from config.settings import METRICS, PROFILING, RATE_LIMIT
+from utils import compression
+from utils.metrics import Metrics
+from utils.profiling import Profiler
+from utils.rate_limit import RateLimiter
+from utils.serialization import FastJSONProvider
 
 # Configurar encoding UTF-8 para Windows
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
@@ -12,9 +18,28 @@ sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 # Crear app
 app = Flask(__name__)
 
+# Serialización JSON (orjson si está instalado, compacta en producción)
+app.json = FastJSONProvider(app)
+
 # Habilitar CORS
 CORS(app)
 
+# Métricas por endpoint (GET /api/v1/metrics)
+if METRICS['enabled']:
+    Metrics.from_settings().init_app(app)
+
+# Compresión gzip/brotli según Accept-Encoding (después de las métricas,
+# para que registren el tamaño comprimido)
+compression.init_app(app)
+
+# Profiling opcional (sin hooks si está desactivado)
+if PROFILING['enabled']:
+    Profiler.from_settings().init_app(app)
+
+# Limitar peticiones por cliente
+if RATE_LIMIT['enabled']:
+    RateLimiter.from_settings().init_app(app)
+
 # Registrar blueprints
 app.register_blueprint(projects_bp)
 app.register_blueprint(contact_bp)
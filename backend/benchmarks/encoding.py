@@ -0,0 +1,85 @@
+"""
+Benchmark: Codificación JSON
+Compara el tiempo de codificar listados grandes de proyectos y mensajes
+
+Uso (desde backend/):
+    python -m benchmarks.encoding [--count N] [--repeat R]
+
+Variantes medidas:
+    json-pretty:  json estándar con indent=2 (salida previa en DEBUG)
+    json:         json estándar compacto
+    orjson:       codificador en C (si está instalado)
+    fragments:    concatenación de fragmentos memoizados por registro
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.memory import _make_message, _make_project  # noqa: E402
+from utils import serialization  # noqa: E402
+
+
+def _time(func, repeat):
+    """Mejor tiempo de R ejecuciones en milisegundos"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def bench(name, records, repeat):
+    """
+    Mide las variantes de codificación para un listado
+    
+    Args:
+        name: Nombre del modelo
+        records: Lista de Project o Message
+        repeat: Repeticiones por variante
+        
+    Returns:
+        dict: Milisegundos por variante
+    """
+    payload = {'status': 'success', 'count': len(records), 'data': [r.to_dict() for r in records]}
+    envelope = {'status': 'success', 'count': len(records)}
+    
+    results = {
+        'json-pretty': _time(lambda: json.dumps(payload, ensure_ascii=False, indent=2), repeat),
+        'json': _time(lambda: json.dumps(payload, ensure_ascii=False, separators=(',', ':')), repeat),
+    }
+    if serialization.orjson is not None:
+        results['orjson'] = _time(lambda: serialization.orjson.dumps(payload), repeat)
+    
+    for record in records:
+        record.to_json_bytes()
+    results['fragments'] = _time(
+        lambda: serialization.splice_list(envelope, [r.to_json_bytes() for r in records]),
+        repeat,
+    )
+    
+    print(f"{name} ({len(records)} registros)")
+    for variant, ms in results.items():
+        print(f"  {variant:<12} {ms:9.2f} ms")
+    return results
+
+
+def main():
+    """Ejecuta el benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--count', type=int, default=50_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    
+    print(f"Codificador activo: {serialization.JSON_BACKEND}")
+    bench('Project', [_make_project(i) for i in range(args.count)], args.repeat)
+    bench('Message', [_make_message(i) for i in range(args.count)], args.repeat)
+
+
+if __name__ == '__main__':
+    main()
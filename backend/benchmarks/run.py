@@ -0,0 +1,381 @@
+"""
+Benchmark: API completa
+Siembra catálogos y buzones sintéticos y mide cada endpoint con el
+cliente de pruebas de Flask
+
+Uso (desde backend/):
+    python -m benchmarks.run [--sizes 10,1000,100000] [--backend memory|sqlite]
+                             [--requests N] [--output resultados.json]
+                             [--baseline base.json] [--threshold 0.2]
+
+Cada tamaño se ejecuta en un subproceso propio, de modo que el pico de
+memoria (RSS máximo) corresponde solo a ese tamaño y los almacenes parten
+vacíos. El rate limit, las notificaciones por email y el journal se
+desactivan; la caché de respuestas queda como en producción salvo que se
+pase --no-cache.
+
+La salida es JSON: por tamaño, el tiempo de siembra, el pico de memoria y,
+por endpoint, peticiones, errores, throughput (req/s) y latencias p50/p99
+en milisegundos. Con --baseline se compara contra una ejecución guardada y
+se marca como regresión todo endpoint cuyo p50 o p99 empeore, o cuyo
+throughput caiga, más de --threshold (proporción). El código de salida es 1
+si hay regresiones.
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+CATEGORIES = ('Mobile', 'IA', 'FullStack', 'DevOps', 'Seguridad', 'Hardware', 'Embebidos')
+TECHNOLOGIES = (
+    'Python', 'Flask', 'React', 'TypeScript', 'Docker', 'Kubernetes', 'PostgreSQL',
+    'Redis', 'TensorFlow', 'PyTorch', 'Rust', 'Go', 'C', 'Arduino', 'Kotlin', 'Swift',
+)
+WORDS = (
+    'sistema', 'plataforma', 'gestión', 'inteligente', 'monitoreo', 'datos', 'tiempo',
+    'real', 'red', 'neuronal', 'aplicación', 'móvil', 'seguridad', 'sensores', 'api',
+    'automatización', 'análisis', 'visión', 'embebido', 'nube', 'despliegue', 'panel',
+)
+
+# Tamaño de los lotes usados para sembrar
+SEED_CHUNK = 10_000
+
+
+# ==========================================
+# Datos sintéticos
+# ==========================================
+
+def project_data(rng, i):
+    """Datos de un proyecto sintético válido"""
+    return {
+        'title': f"{rng.choice(WORDS).capitalize()} {rng.choice(WORDS)} {i}",
+        'description': ' '.join(rng.choice(WORDS) for _ in range(12)),
+        'technologies': rng.sample(TECHNOLOGIES, rng.randint(1, 4)),
+        'link': f'https://github.com/ejemplo/proyecto-{i}',
+        'category': rng.choice(CATEGORIES),
+        'featured': rng.random() < 0.2,
+        'image': f'/images/proyecto-{i}.png',
+        'stats': {'stars': rng.randint(0, 500)},
+    }
+
+
+def message_data(rng, i):
+    """Datos de un mensaje de contacto sintético válido"""
+    return {
+        'name': f'Persona {i}',
+        'email': f'persona{i}@example.com',
+        'subject': f"Consulta sobre {rng.choice(WORDS)}",
+        'message': ' '.join(rng.choice(WORDS) for _ in range(20)),
+        'phone': None,
+    }
+
+
+def seed(manager, store, count, rng):
+    """
+    Siembra el catálogo y el buzón con count registros cada uno
+    
+    Se usan lotes (apply_batch / create_many) para que la siembra no
+    domine el tiempo de ejecución en los tamaños grandes.
+    """
+    for start in range(0, count, SEED_CHUNK):
+        stop = min(start + SEED_CHUNK, count)
+        _, errors = manager.apply_batch([
+            {'op': 'create', 'data': project_data(rng, i)} for i in range(start, stop)
+        ])
+        if errors:
+            raise RuntimeError(f'Error al sembrar proyectos: {errors[:3]}')
+        store.create_many(message_data(rng, i) for i in range(start, stop))
+
+
+# ==========================================
+# Escenarios
+# ==========================================
+
+def scenarios(count, manager, store, rng):
+    """
+    Escenarios por endpoint
+    
+    Cada escenario es (nombre, método, generador de peticiones). El
+    generador recibe n y retorna n tuplas (ruta, body JSON o None); los
+    endpoints destructivos preparan sus propios registros antes de medir.
+    """
+    def fixed(path, body=None):
+        return lambda n: [(path, body)] * n
+    
+    def random_ids(prefix, suffix=''):
+        return lambda n: [(f'{prefix}/{rng.randint(1, count)}{suffix}', None) for _ in range(n)]
+    
+    def fresh_projects(suffix_body):
+        def build(n):
+            results, _ = manager.apply_batch([
+                {'op': 'create', 'data': project_data(rng, count + i)} for i in range(n)
+            ])
+            return [(f"/api/v1/projects/{r['id']}", suffix_body(i)) for i, r in enumerate(results)]
+        return build
+    
+    def fresh_messages(suffix):
+        def build(n):
+            created = store.create_many(message_data(rng, count + i) for i in range(n))
+            return [(f'/api/v1/contact/messages/{m.id}{suffix}', None) for m in created]
+        return build
+    
+    def new_projects(n):
+        return [('/api/v1/projects', project_data(rng, count + i)) for i in range(n)]
+    
+    def batches(n):
+        return [('/api/v1/projects/batch', [
+            {'op': 'create', 'data': project_data(rng, count + i * 10 + j)} for j in range(10)
+        ]) for i in range(n)]
+    
+    def new_messages(n):
+        return [('/api/v1/contact/send', message_data(rng, count + i)) for i in range(n)]
+    
+    def searches(n):
+        return [(f'/api/v1/projects/search?q={rng.choice(WORDS)}+{rng.choice(WORDS)}&limit=10', None)
+                for _ in range(n)]
+    
+    return [
+        ('GET /', 'GET', fixed('/')),
+        ('GET /api/v1/health', 'GET', fixed('/api/v1/health')),
+        ('GET /api/v1/projects', 'GET', fixed('/api/v1/projects')),
+        ('GET /api/v1/projects?category&tech&facets', 'GET',
+         fixed('/api/v1/projects?category=IA&tech=Python&facets=true&limit=50')),
+        ('GET /api/v1/projects?fields', 'GET', fixed('/api/v1/projects?fields=id,title&limit=100')),
+        ('GET /api/v1/projects/<id>', 'GET', random_ids('/api/v1/projects')),
+        ('GET /api/v1/projects/category/<category>', 'GET', fixed('/api/v1/projects/category/IA')),
+        ('GET /api/v1/projects/featured', 'GET', fixed('/api/v1/projects/featured')),
+        ('GET /api/v1/projects/search', 'GET', searches),
+        ('GET /api/v1/projects/stats', 'GET', fixed('/api/v1/projects/stats')),
+        ('GET /api/v1/projects/export', 'GET', fixed('/api/v1/projects/export')),
+        ('GET /api/v1/projects/health', 'GET', fixed('/api/v1/projects/health')),
+        ('POST /api/v1/projects', 'POST', new_projects),
+        ('POST /api/v1/projects/batch', 'POST', batches),
+        ('PUT /api/v1/projects/<id>', 'PUT', fresh_projects(lambda i: {'featured': bool(i % 2), 'title': f'Editado {i}'})),
+        ('DELETE /api/v1/projects/<id>', 'DELETE', fresh_projects(lambda i: None)),
+        ('POST /api/v1/contact/send', 'POST', new_messages),
+        ('GET /api/v1/contact/messages', 'GET', fixed('/api/v1/contact/messages')),
+        ('GET /api/v1/contact/messages?read=false', 'GET', fixed('/api/v1/contact/messages?read=false')),
+        ('GET /api/v1/contact/messages/export', 'GET', fixed('/api/v1/contact/messages/export')),
+        ('GET /api/v1/contact/messages/<id>', 'GET', random_ids('/api/v1/contact/messages')),
+        ('PUT /api/v1/contact/messages/<id>/read', 'PUT', fresh_messages('/read')),
+        ('DELETE /api/v1/contact/messages/<id>', 'DELETE', fresh_messages('')),
+        ('GET /api/v1/contact/stats', 'GET', fixed('/api/v1/contact/stats')),
+        ('GET /api/v1/contact/health', 'GET', fixed('/api/v1/contact/health')),
+        ('GET /api/v1/metrics', 'GET', fixed('/api/v1/metrics')),
+    ]
+
+
+def percentile(sorted_values, p):
+    """Percentil por rango más cercano de una lista ordenada"""
+    if not sorted_values:
+        return None
+    index = max(0, math.ceil(p / 100 * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+def measure(client, method, requests, max_seconds, warmup=3):
+    """
+    Ejecuta las peticiones y mide cada una
+    
+    Las respuestas en streaming se consumen completas dentro de la
+    medición. Se detiene antes si se supera max_seconds.
+    
+    Returns:
+        dict: requests, errors, rps, p50_ms y p99_ms
+    """
+    open_request = getattr(client, method.lower())
+    for path, body in requests[:warmup]:
+        open_request(path, json=body).close()
+    
+    latencies = []
+    errors = 0
+    started = time.perf_counter()
+    for path, body in requests[warmup:]:
+        t0 = time.perf_counter()
+        response = open_request(path, json=body)
+        response.get_data()
+        latencies.append(time.perf_counter() - t0)
+        if response.status_code >= 400:
+            errors += 1
+        response.close()
+        if time.perf_counter() - started > max_seconds:
+            break
+    elapsed = time.perf_counter() - started
+    
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'rps': round(len(latencies) / elapsed, 1) if elapsed else None,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 3),
+    }
+
+
+def peak_memory_mb():
+    """RSS máximo del proceso en MB (None si no está disponible)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reporta KB y macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def run_size(count, requests, max_seconds, use_cache, seed_value):
+    """
+    Siembra count registros y mide todos los endpoints (proceso hijo)
+    
+    Returns:
+        dict: Resultados del tamaño
+    """
+    sys.path.insert(0, str(BACKEND_DIR))
+    from app import app
+    from routes import contact, projects
+    
+    if not use_cache:
+        projects.response_cache.enabled = False
+        contact.response_cache.enabled = False
+    
+    rng = random.Random(seed_value)
+    started = time.perf_counter()
+    seed(projects.manager, contact.store, count, rng)
+    seed_seconds = time.perf_counter() - started
+    
+    client = app.test_client()
+    endpoints = {}
+    for name, method, build in scenarios(count, projects.manager, contact.store, rng):
+        endpoints[name] = measure(client, method, build(requests + 3), max_seconds)
+    
+    return {
+        'records': count,
+        'seed_seconds': round(seed_seconds, 3),
+        'peak_rss_mb': peak_memory_mb(),
+        'endpoints': endpoints,
+    }
+
+
+# ==========================================
+# Comparación con la línea base
+# ==========================================
+
+def compare(results, baseline, threshold):
+    """
+    Compara resultados con una línea base
+    
+    Returns:
+        list: Regresiones (dicts con tamaño, endpoint, métrica y valores)
+    """
+    regressions = []
+    for size, result in results['results'].items():
+        base_endpoints = baseline.get('results', {}).get(size, {}).get('endpoints', {})
+        for name, metrics in result['endpoints'].items():
+            base = base_endpoints.get(name)
+            if not base:
+                continue
+            for metric, worse in (('p50_ms', 1), ('p99_ms', 1), ('rps', -1)):
+                old, new = base.get(metric), metrics.get(metric)
+                if not old or new is None:
+                    continue
+                change = (new - old) / old * worse
+                if change > threshold:
+                    regressions.append({
+                        'size': size, 'endpoint': name, 'metric': metric,
+                        'baseline': old, 'current': new, 'change': round(change, 3),
+                    })
+    return regressions
+
+
+def main():
+    """Ejecuta el benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', default='10,1000,100000',
+                        help='Tamaños separados por coma (hasta 1000000)')
+    parser.add_argument('--backend', choices=('memory', 'sqlite'), default='memory')
+    parser.add_argument('--requests', type=int, default=200, help='Peticiones por endpoint')
+    parser.add_argument('--max-seconds', type=float, default=10.0,
+                        help='Tiempo máximo por endpoint')
+    parser.add_argument('--no-cache', action='store_true', help='Desactivar la caché de respuestas')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='Archivo donde guardar el JSON')
+    parser.add_argument('--baseline', help='JSON de una ejecución anterior')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='Empeoramiento tolerado antes de marcar regresión (0.2 = 20%%)')
+    parser.add_argument('--child', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.child is not None:
+        result = run_size(args.child, args.requests, args.max_seconds, not args.no_cache, args.seed)
+        print(json.dumps(result))
+        return 0
+    
+    env = dict(
+        os.environ,
+        RATE_LIMIT_ENABLED='False',
+        EMAIL_NOTIFICATIONS='False',
+        JOURNAL_ENABLED='False',
+        STORAGE_BACKEND=args.backend,
+        DEBUG='False',
+    )
+    
+    results = {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'backend': args.backend,
+            'cache': not args.no_cache,
+            'requests': args.requests,
+            'seed': args.seed,
+        },
+        'results': {},
+    }
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in (int(s) for s in args.sizes.split(',')):
+            env['DB_NAME'] = str(Path(tmp) / f'bench-{size}.db')
+            print(f"Midiendo {size} registros...", file=sys.stderr)
+            cmd = [
+                sys.executable, '-m', 'benchmarks.run', '--child', str(size),
+                '--requests', str(args.requests), '--max-seconds', str(args.max_seconds),
+                '--seed', str(args.seed),
+            ] + (['--no-cache'] if args.no_cache else [])
+            output = subprocess.run(cmd, cwd=BACKEND_DIR, env=env, check=True,
+                                    stdout=subprocess.PIPE).stdout
+            results['results'][str(size)] = json.loads(output.splitlines()[-1])
+    
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        results['regressions'] = regressions
+        for r in regressions:
+            print(f"REGRESIÓN [{r['size']}] {r['endpoint']} {r['metric']}: "
+                  f"{r['baseline']} -> {r['current']} ({r['change']:+.0%})", file=sys.stderr)
+        exit_code = 1 if regressions else 0
+    
+    text = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
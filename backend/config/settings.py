@@ -30,7 +30,13 @@ AUTHOR = 'Cristian David Durán Grimaldo'
 # ==========================================
 HOST = os.getenv('HOST', '0.0.0.0')
 PORT = int(os.getenv('PORT', 5000))
-SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
+DEFAULT_SECRET_KEY = 'dev-secret-key-change-in-production'
+SECRET_KEY = os.getenv('SECRET_KEY', DEFAULT_SECRET_KEY)
+
+# Servidor de producción multiproceso (serve.py)
+WORKERS = int(os.getenv('WEB_CONCURRENCY', os.cpu_count() or 1))
+THREADS = int(os.getenv('WEB_THREADS', 4))  # Hilos por worker (gunicorn gthread)
+BACKLOG = int(os.getenv('BACKLOG', 2048))
 
 # ==========================================
 # CORS (Cross-Origin Resource Sharing)
@@ -52,6 +58,10 @@ if not DEBUG:
 # ==========================================
 # CONFIGURACIÓN DE BASE DE DATOS
 # ==========================================
+# 'memory' mantiene los datos en el proceso (por defecto, usado en tests)
+# 'sqlite' persiste proyectos y mensajes en DATABASE['name']
+STORAGE_BACKEND = os.getenv('STORAGE_BACKEND', 'memory')
+
 DATABASE = {
     'engine': os.getenv('DB_ENGINE', 'sqlite'),
     'name': os.getenv('DB_NAME', 'portafolio.db'),
@@ -61,6 +71,15 @@ DATABASE = {
     'port': int(os.getenv('DB_PORT', 5432)),
 }
 
+# Journal de mensajes de contacto (solo STORAGE_BACKEND=memory).
+# Desactivado por defecto; al activarlo hay que indicar JOURNAL_PATH.
+JOURNAL = {
+    'enabled': os.getenv('JOURNAL_ENABLED', 'False') == 'True',
+    'path': os.getenv('JOURNAL_PATH'),
+    'flush_interval_ms': 5,  # Ventana de group commit
+    'compact_min_records': 1000,
+}
+
 # ==========================================
 # CONFIGURACIÓN DE EMAIL
 # ==========================================
@@ -71,6 +90,15 @@ EMAIL = {
     'user': os.getenv('EMAIL_USER', 'tu@email.com'),
     'password': os.getenv('EMAIL_PASSWORD', 'tu-password'),
     'from': os.getenv('EMAIL_FROM', 'noreply@portafolio.com'),
+    'to': os.getenv('EMAIL_TO', os.getenv('EMAIL_USER', 'tu@email.com')),
+    'use_tls': os.getenv('EMAIL_USE_TLS', 'True') == 'True',
+    # Envío asíncrono de notificaciones
+    'workers': 2,
+    'queue_size': 1000,
+    'batch_size': 20,  # Emails por lote sobre la misma conexión
+    'max_retries': 3,
+    'retry_backoff': 1.0,  # Segundos, se duplica en cada reintento
+    'timeout': 10,
 }
 
 # ==========================================
@@ -94,6 +122,21 @@ API_ROUTES = {
     'about': f'{API_PREFIX}/about',
 }
 
+# ==========================================
+# PAGINACIÓN
+# ==========================================
+PAGINATION = {
+    'default_limit': 20,  # Tamaño de página cuando solo se envía cursor
+    'max_limit': 100,
+}
+
+# ==========================================
+# OPERACIONES EN LOTE
+# ==========================================
+BATCH = {
+    'max_operations': 1000,  # Operaciones por petición a /projects/batch
+}
+
 # ==========================================
 # SEGURIDAD
 # ==========================================
@@ -104,9 +147,20 @@ MAX_UPLOAD_SIZE = 5 * 1024 * 1024  # 5MB
 # RATE LIMITING
 # ==========================================
 RATE_LIMIT = {
-    'enabled': True,
+    'enabled': os.getenv('RATE_LIMIT_ENABLED', 'True') == 'True',
     'calls': 100,
     'period': 3600,  # 1 hora
+    # Límites por endpoint (blueprint.función) que reemplazan al general
+    'routes': {
+        'contact.send_message': {'calls': 5, 'period': 600},
+    },
+    # Endpoints sin límite
+    'exempt': ['health', 'projects.health', 'contact.health', 'metrics', 'admin_profiles'],
+    'stripes': 16,  # Particiones de buckets (lock striping)
+    'trust_proxy': os.getenv('RATE_LIMIT_TRUST_PROXY', 'False') == 'True',
+    # 'memory': buckets por proceso; con N workers cada cliente obtiene hasta
+    # N veces el límite. 'redis': buckets compartidos en el servidor de CACHE.
+    'storage': os.getenv('RATE_LIMIT_STORAGE', 'memory'),
 }
 
 # ==========================================
@@ -114,10 +168,61 @@ RATE_LIMIT = {
 # ==========================================
 CACHE = {
     'enabled': True,
-    'type': 'redis',  # 'redis' o 'memory'
+    # 'memory' (LRU por proceso) o 'redis' (compartida; las entradas se marcan
+    # con la versión de los datos, así que con varios procesos requiere STORAGE_BACKEND='sqlite')
+    'type': os.getenv('CACHE_TYPE', 'memory'),
     'host': os.getenv('CACHE_HOST', 'localhost'),
     'port': int(os.getenv('CACHE_PORT', 6379)),
+    'db': int(os.getenv('CACHE_DB', 0)),
+    'prefix': 'portafolio:',
+    'pool_size': 8,  # Conexiones Redis reutilizables
     'ttl': 3600,  # 1 hora en segundos
+    'max_entries': 1024,  # Respuestas cacheadas en memoria (LRU)
+    'max_bytes': int(os.getenv('CACHE_MAX_BYTES', 64 * 1024 * 1024)),  # Tamaño total en memoria
+}
+
+# ==========================================
+# COMPRESIÓN
+# ==========================================
+COMPRESSION = {
+    'enabled': os.getenv('COMPRESSION_ENABLED', 'True') == 'True',
+    'min_size': 1024,  # Bytes; por debajo no compensa comprimir
+    'gzip_level': 6,
+    'brotli_quality': 5,  # Solo si el paquete brotli está instalado
+    'mimetypes': ['application/json', 'text/plain', 'text/html', 'application/x-ndjson'],
+}
+
+# ==========================================
+# MÉTRICAS
+# ==========================================
+METRICS = {
+    'enabled': os.getenv('METRICS_ENABLED', 'True') == 'True',
+    'path': '/api/v1/metrics',
+    # Límites superiores de los buckets de los histogramas
+    'latency_buckets': (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+    'size_buckets': (256, 1024, 4096, 16384, 65536, 262144, 1048576),
+    # Con varios workers (serve.py) cada uno vuelca sus totales en este
+    # directorio y /metrics los suma. Sin valor se usa uno temporal.
+    'multiprocess_dir': os.getenv('METRICS_DIR'),
+    'flush_interval': 1.0,  # Segundos entre volcados de cada worker
+}
+
+# ==========================================
+# PROFILING
+# ==========================================
+# Desactivado no registra ningún hook. Activado, perfila una fracción de
+# las peticiones (sample_rate) y toda petición con un token firmado en
+# 'header' (ver utils.profiling.sign_token). Requiere definir SECRET_KEY:
+# con el valor por defecto cualquiera podría firmar tokens.
+PROFILING = {
+    'enabled': os.getenv('PROFILING_ENABLED', 'False') == 'True',
+    'sample_rate': float(os.getenv('PROFILING_SAMPLE_RATE', 0.0)),
+    'header': 'X-Profile-Token',
+    'token_max_age': 300,  # Segundos de validez del token firmado
+    'dir': os.getenv('PROFILING_DIR', str(BASE_DIR / 'profiles')),
+    'max_files': 500,  # Se eliminan los perfiles más antiguos
+    'path': '/api/v1/admin/profiles',
+    'top': 20,
 }
 
 # ==========================================
@@ -127,7 +232,7 @@ FEATURES = {
     'projects_api': True,
     'skills_api': True,
     'contact_form': True,
-    'email_notifications': True,
+    'email_notifications': os.getenv('EMAIL_NOTIFICATIONS', 'False') == 'True',  # Requiere EMAIL configurado
     'analytics': True,
 }
 
@@ -138,7 +243,9 @@ API_RESPONSE = {
     'version': '1.0',
     'content_type': 'application/json',
     'charset': 'utf-8',
-    'pretty_print': DEBUG,
+    # JSON indentado: desactiva el JSON memoizado de los listados, solo
+    # para depurar (no depende de DEBUG, que está activo por defecto)
+    'pretty_print': os.getenv('API_PRETTY_PRINT', 'False') == 'True',
 }
 
 # ==========================================
@@ -0,0 +1,435 @@
+"""
+Model: Journal
+Journal append-only (JSONL) con group commit para mensajes de contacto
+"""
+
+import atexit
+import logging
+import os
+import threading
+import time
+
+from models.message import Message, MessageStore
+from utils.serialization import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+# Lotes fallidos que se recuerdan para informar a sus escritores
+MAX_FAILED_BATCHES = 1024
+
+
+class Journal:
+    """
+    Archivo append-only de registros JSON, uno por línea
+    
+    append() bloquea hasta que el registro es durable, pero los fsync se
+    agrupan: un hilo de commit espera flush_interval segundos, escribe
+    todos los registros pendientes y hace un único fsync para el lote.
+    
+    Cuando needs_compaction lo pide, un hilo aparte escribe el estado
+    actual en un archivo temporal mientras los commits continúan. Los
+    lotes escritos entretanto se guardan también en memoria; al terminar
+    se añaden al temporal y se sustituye el archivo, con la escritura de
+    lotes bloqueada solo durante ese intercambio.
+    """
+    
+    def __init__(self, path, flush_interval=0.005):
+        """
+        Args:
+            path: Ruta del archivo del journal
+            flush_interval: Segundos que se acumulan registros antes del fsync
+        """
+        self.path = str(path)
+        self.flush_interval = flush_interval
+        self.records = 0
+        self.snapshot = None
+        self.needs_compaction = None
+        self._file = None
+        self._pending = []
+        self._seq = 0
+        self._durable = 0
+        self._closed = False
+        self._stopped = False
+        self._failed = []  # (primera, última secuencia, error) de lotes fallidos
+        self._cond = threading.Condition()
+        self._thread = None
+        self._file_lock = threading.Lock()
+        self._carry = None
+        self._compactor = None
+    
+    # ==========================================
+    # Lectura
+    # ==========================================
+    
+    def replay(self):
+        """
+        Lee los registros existentes
+        
+        Una última línea incompleta (escritura interrumpida) se descarta y
+        se trunca el archivo para que los nuevos registros no queden
+        pegados a ella.
+        
+        Returns:
+            list: Registros decodificados en orden
+        """
+        try:
+            with open(self.path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return []
+        
+        records = []
+        offset = 0
+        for line in data.splitlines(keepends=True):
+            end = offset + len(line)
+            try:
+                if not line.endswith(b'\n'):
+                    raise ValueError('registro incompleto')
+                records.append(loads(line))
+            except ValueError:
+                if end == len(data):
+                    logger.warning('Journal %s: se descarta un registro incompleto al final', self.path)
+                    with open(self.path, 'r+b') as f:
+                        f.truncate(offset)
+                    break
+                logger.error('Journal %s: registro corrupto en el byte %d, se ignora', self.path, offset)
+            offset = end
+        
+        self.records = len(records)
+        return records
+    
+    # ==========================================
+    # Escritura
+    # ==========================================
+    
+    def open(self):
+        """Abre el archivo para añadir registros e inicia el hilo de commit"""
+        if self._file is not None:
+            return
+        self._file = open(self.path, 'ab')
+        self._thread = threading.Thread(target=self._run, name='journal-commit', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+    
+    def append(self, record):
+        """
+        Añade un registro y espera a que sea durable
+        
+        Args:
+            record: dict serializable a JSON
+        """
+        self.wait(self.submit(record))
+    
+    def submit(self, record):
+        """
+        Encola un registro sin esperar al fsync
+        
+        El orden de los registros en el archivo es el orden de submit.
+        
+        Args:
+            record: dict serializable a JSON
+            
+        Returns:
+            int: Secuencia a pasar a wait()
+        """
+        line = dumps(record) + b'\n'
+        with self._cond:
+            if self._closed:
+                raise RuntimeError('Journal cerrado')
+            self._pending.append(line)
+            self._seq += 1
+            self._cond.notify_all()
+            return self._seq
+    
+    def wait(self, seq, first=None):
+        """
+        Espera a que los registros first..seq sean durables
+        
+        Solo informa de errores de los lotes que contenían esos registros,
+        no de los de otros escritores.
+        
+        Args:
+            seq: Secuencia retornada por submit()
+            first: Primera secuencia a comprobar (por defecto seq)
+            
+        Raises:
+            OSError: Si alguno de esos registros no se pudo escribir
+        """
+        first = seq if first is None else first
+        with self._cond:
+            while self._durable < seq and not self._stopped:
+                self._cond.wait()
+            if self._durable < seq:
+                raise OSError('Journal cerrado antes de escribir el registro')
+            for failed_first, failed_last, error in self._failed:
+                if failed_first <= seq and first <= failed_last:
+                    raise OSError(f'No se pudo escribir el journal: {error}')
+    
+    def close(self):
+        """Escribe los registros pendientes y cierra el archivo"""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+        if self._compactor is not None:
+            self._compactor.join()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def _run(self):
+        """Bucle del hilo de commit"""
+        try:
+            self._commit_loop()
+        finally:
+            with self._cond:
+                self._stopped = True
+                self._cond.notify_all()
+    
+    def _commit_loop(self):
+        """Escribe lotes hasta que se cierra el journal"""
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                closed = self._closed
+            
+            if not closed:
+                # Acumular los registros que lleguen durante la ventana
+                time.sleep(self.flush_interval)
+            
+            with self._cond:
+                batch, self._pending = self._pending, []
+                first, seq = self._durable + 1, self._seq
+            
+            error = None
+            if batch:
+                with self._file_lock:
+                    try:
+                        if self._file.closed:
+                            # Una compactación fallida no pudo reabrirlo
+                            self._file = open(self.path, 'ab')
+                        self._file.write(b''.join(batch))
+                        self._file.flush()
+                        os.fsync(self._file.fileno())
+                        self.records += len(batch)
+                        if self._carry is not None:
+                            self._carry.extend(batch)
+                    except OSError as e:
+                        logger.error('Journal %s: error de escritura: %s', self.path, e)
+                        error = e
+            
+            with self._cond:
+                if error is not None:
+                    self._failed.append((first, seq, error))
+                    # Los escritores esperan en cuanto se escribe su lote;
+                    # basta con recordar los fallos recientes
+                    del self._failed[:-MAX_FAILED_BATCHES]
+                self._durable = seq
+                self._cond.notify_all()
+            
+            if closed:
+                return
+            if (self.needs_compaction is not None
+                    and (self._compactor is None or not self._compactor.is_alive())
+                    and self.needs_compaction(self.records)):
+                self._compactor = threading.Thread(
+                    target=self._run_compaction, name='journal-compact', daemon=True)
+                self._compactor.start()
+    
+    def _run_compaction(self):
+        """Hilo de compactación"""
+        try:
+            self._compact()
+        except Exception as e:
+            logger.error('Journal %s: error al compactar: %s', self.path, e)
+    
+    def _compact(self):
+        """
+        Reescribe el journal con el estado actual
+        
+        snapshot() devuelve los registros que reconstruyen el estado y se
+        toma después de empezar a guardar los lotes escritos, así que todo
+        registro posterior a la foto acaba en el archivo nuevo. Los que ya
+        estén reflejados en ella se repiten; la reproducción es idempotente.
+        Si algo falla, el archivo original sigue intacto.
+        """
+        started = time.perf_counter()
+        with self._file_lock:
+            self._carry = []
+        tmp_path = self.path + '.tmp'
+        try:
+            records = self.snapshot()
+            with open(tmp_path, 'wb') as f:
+                f.write(b''.join(dumps(r) + b'\n' for r in records))
+                
+                # Intercambio: los commits esperan solo a los lotes recientes
+                with self._file_lock:
+                    carry = self._carry
+                    f.write(b''.join(carry))
+                    f.flush()
+                    os.fsync(f.fileno())
+                    self._file.close()
+                    try:
+                        os.replace(tmp_path, self.path)
+                        self._fsync_dir()
+                    finally:
+                        self._file = open(self.path, 'ab')
+                    previous = self.records
+                    self.records = len(records) + len(carry)
+        finally:
+            with self._file_lock:
+                self._carry = None
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        
+        logger.info('Journal %s compactado: %d -> %d registros (%.1f ms)',
+                    self.path, previous, self.records, (time.perf_counter() - started) * 1000)
+    
+    def _fsync_dir(self):
+        """Hace durable el renombrado del archivo (POSIX)"""
+        try:
+            fd = os.open(os.path.dirname(os.path.abspath(self.path)), os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+class JournaledMessageStore(MessageStore):
+    """
+    MessageStore en memoria respaldado por un Journal
+    
+    Cada mutación se aplica en memoria y se registra en el journal antes
+    de retornar. El registro se encola dentro del lock del almacén, para
+    que el orden del journal coincida con el de las mutaciones, y el fsync
+    se espera fuera de él, de modo que escrituras concurrentes comparten
+    el mismo commit. Si el registro no llega al disco, la mutación se
+    deshace en memoria y el error se propaga. Al iniciar se reproduce el
+    journal; la compactación reemplaza el historial por un registro por
+    mensaje vivo, descartando los eliminados y las marcas de lectura ya
+    aplicadas.
+    """
+    
+    def __init__(self, path, flush_interval=0.005, compact_min_records=1000):
+        """
+        Args:
+            path: Ruta del archivo del journal
+            flush_interval: Ventana de group commit en segundos
+            compact_min_records: Registros obsoletos mínimos para compactar
+        """
+        super().__init__()
+        self.compact_min_records = compact_min_records
+        self.journal = Journal(path, flush_interval=flush_interval)
+        self.journal.snapshot = self._snapshot
+        self.journal.needs_compaction = self._needs_compaction
+        self._replay(self.journal.replay())
+        self.journal.open()
+    
+    def _replay(self, records):
+        """Reconstruye el estado a partir de los registros del journal"""
+        state = self._state.copy()
+        for record in records:
+            op = record.get('op')
+            if op == 'create':
+                msg = Message(**record['message'])
+                state.add(msg)
+                self.id_counter = max(self.id_counter, msg.id)
+            elif op == 'read':
+                current = state.by_id.get(record['id'])
+                if current is not None and not current.read:
+                    msg = Message(**current.to_dict())
+                    msg.read = True
+                    state.add(msg)
+            elif op == 'delete':
+                state.remove(record['id'])
+            elif op == 'meta':
+                self.id_counter = max(self.id_counter, record['id_counter'])
+        self._state = state
+    
+    def _snapshot(self):
+        """Registros mínimos que reconstruyen el estado actual"""
+        with self._lock:
+            state = self._state
+            id_counter = self.id_counter
+        records = [{'op': 'meta', 'id_counter': id_counter}]
+        records.extend(
+            {'op': 'create', 'message': state.by_id[i].to_dict()} for i in state.order
+        )
+        return records
+    
+    def _needs_compaction(self, records):
+        """Compactar cuando los registros obsoletos superan a los vivos"""
+        live = self.count() + 1
+        return records - live >= max(self.compact_min_records, live)
+    
+    def _commit(self, seq, undo, first=None):
+        """
+        Espera a que el registro sea durable; si falla, deshace la mutación
+        
+        La mutación ya es visible mientras se espera el fsync. Si el
+        registro no llega al disco, undo(state) la revierte sobre el
+        estado actual y se publica antes de propagar el error.
+        """
+        try:
+            self.journal.wait(seq, first)
+        except OSError:
+            with self._lock:
+                state = self._state.copy()
+                undo(state)
+                self._publish(state)
+            raise
+    
+    def create(self, name, email, subject, message, phone=None):
+        with self._lock:
+            msg = self._create(name, email, subject, message, phone)
+            seq = self.journal.submit({'op': 'create', 'message': msg.to_dict()})
+        self._commit(seq, lambda state: state.remove(msg.id))
+        return msg
+    
+    def create_many(self, items):
+        with self._lock:
+            created = self._create_many(items)
+            seqs = [self.journal.submit({'op': 'create', 'message': msg.to_dict()})
+                    for msg in created]
+        
+        def undo(state):
+            for msg in created:
+                state.remove(msg.id)
+        
+        if seqs:
+            self._commit(seqs[-1], undo, first=seqs[0])
+        return created
+    
+    def mark_read(self, message_id):
+        with self._lock:
+            msg, changed = self._mark_read(message_id)
+            if not changed:
+                return msg
+            seq = self.journal.submit({'op': 'read', 'id': message_id})
+        
+        def undo(state):
+            current = state.by_id.get(message_id)
+            if current is not None and current.read:
+                restored = Message(**current.to_dict())
+                restored.read = False
+                state.add(restored)
+        
+        self._commit(seq, undo)
+        return msg
+    
+    def delete(self, message_id):
+        with self._lock:
+            msg = self._state.by_id.get(message_id)
+            if not self._delete(message_id):
+                return False
+            seq = self.journal.submit({'op': 'delete', 'id': message_id})
+        self._commit(seq, lambda state: state.add(msg))
+        return True
@@ -0,0 +1,351 @@
+"""
+Model: Message
+Modelo de datos para mensajes de contacto
+"""
+
+import threading
+from datetime import datetime
+from itertools import islice
+
+from models.persistent import ChunkedMap, SortedIds
+from utils.serialization import dumps
+
+
+class Message:
+    """
+    Modelo de mensaje de contacto
+    
+    El diccionario y el JSON se memoizan; el único campo mutable es read,
+    cuyo cambio invalida la forma serializada.
+    """
+    
+    __slots__ = (
+        'id', 'name', 'email', 'subject', 'message', 'phone', 'created_at', '_read',
+        '_dict_cache', '_json_cache',
+    )
+    
+    # Campos expuestos por to_dict, en orden
+    FIELDS = ('id', 'name', 'email', 'subject', 'message', 'phone', 'created_at', 'read')
+    
+    def __init__(self, name, email, subject, message, phone=None,
+                 id=None, created_at=None, read=False):
+        self.id = id
+        self.name = name
+        self.email = email
+        self.subject = subject
+        self.message = message
+        self.phone = phone
+        self.created_at = created_at or datetime.now().isoformat()
+        self._read = read
+        self._dict_cache = None
+        self._json_cache = None
+    
+    @property
+    def read(self):
+        """Estado de lectura del mensaje"""
+        return self._read
+    
+    @read.setter
+    def read(self, value):
+        if value != self._read:
+            self._read = value
+            self._dict_cache = None
+            self._json_cache = None
+    
+    def to_dict(self, fields=None):
+        """
+        Convierte mensaje a diccionario
+        
+        Args:
+            fields: Campos a incluir (None para todos)
+        """
+        if fields is not None:
+            return {field: getattr(self, field) for field in fields}
+        
+        if self._dict_cache is None:
+            self._dict_cache = self._build_dict()
+        return self._dict_cache
+    
+    def _build_dict(self):
+        """Construye el diccionario completo del mensaje"""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'email': self.email,
+            'subject': self.subject,
+            'message': self.message,
+            'phone': self.phone,
+            'created_at': self.created_at,
+            'read': self._read
+        }
+    
+    def to_json_bytes(self):
+        """
+        JSON compacto memoizado, listo para concatenar en un listado
+        
+        Returns:
+            bytes: Mensaje en formato JSON
+        """
+        if self._json_cache is None:
+            self._json_cache = dumps(self.to_dict())
+        return self._json_cache
+
+
+class _Inbox:
+    """
+    Estado del buzón publicado a los lectores
+    
+    Una instancia publicada no se modifica nunca; los escritores trabajan
+    sobre copy() y publican el resultado. by_id (ChunkedMap) y los
+    SortedIds comparten sus cubetas y bloques con el original, así que
+    una escritura no copia el buzón entero.
+    """
+    
+    __slots__ = ('by_id', 'order', 'partitions', 'version')
+    
+    def __init__(self):
+        self.by_id = ChunkedMap()
+        self.order = SortedIds()
+        self.partitions = {False: SortedIds(), True: SortedIds()}
+        self.version = 0
+    
+    def copy(self):
+        """
+        Copia modificable del estado
+        
+        Returns:
+            _Inbox: Nuevo estado que comparte los índices internos
+        """
+        clone = _Inbox.__new__(_Inbox)
+        clone.by_id = self.by_id.copy()
+        clone.order = self.order.copy()
+        clone.partitions = {False: self.partitions[False].copy(), True: self.partitions[True].copy()}
+        clone.version = self.version
+        return clone
+    
+    def add(self, msg):
+        """Agrega o reemplaza un mensaje en el mapa y en las particiones"""
+        current = self.by_id.get(msg.id)
+        if current is None:
+            self.order.add(msg.id)
+        else:
+            self.partitions[current.read].discard(msg.id)
+        self.by_id[msg.id] = msg
+        self.partitions[msg.read].add(msg.id)
+    
+    def remove(self, message_id):
+        """
+        Elimina un mensaje del mapa y de las particiones
+        
+        Returns:
+            Message: Mensaje eliminado o None si no existía
+        """
+        msg = self.by_id.pop(message_id, None)
+        if msg is not None:
+            self.order.discard(message_id)
+            self.partitions[msg.read].discard(message_id)
+        return msg
+
+
+class MessageStore:
+    """
+    Almacén en memoria de mensajes de contacto
+    
+    Los mensajes se indexan por ID en un ChunkedMap y por estado de
+    lectura en particiones SortedIds, de modo que las búsquedas,
+    eliminaciones y filtros no recorren todo el buzón. Los IDs se asignan
+    con un contador monótono y no se reutilizan tras una eliminación.
+    version se incrementa en cada mutación.
+    
+    Como en ProjectManager, las lecturas usan el estado publicado sin
+    bloqueo y las escrituras se serializan con un lock y publican una
+    copia. Marcar como leído publica un Message nuevo.
+    """
+    
+    def __init__(self):
+        """Inicializa el almacén"""
+        self._state = _Inbox()
+        self._lock = threading.Lock()
+        self.id_counter = 0
+    
+    @property
+    def version(self):
+        """Versión del buzón publicado"""
+        return self._state.version
+    
+    def _publish(self, state):
+        """Publica un nuevo estado (requiere self._lock)"""
+        state.version += 1
+        self._state = state
+    
+    def create(self, name, email, subject, message, phone=None):
+        """
+        Crea y guarda un mensaje
+        
+        Returns:
+            Message: Mensaje creado
+        """
+        with self._lock:
+            return self._create(name, email, subject, message, phone)
+    
+    def _create(self, name, email, subject, message, phone):
+        """Crea y publica un mensaje (requiere self._lock)"""
+        self.id_counter += 1
+        msg = Message(name, email, subject, message, phone=phone, id=self.id_counter)
+        state = self._state.copy()
+        state.add(msg)
+        self._publish(state)
+        return msg
+    
+    def create_many(self, items):
+        """
+        Crea varios mensajes publicando el buzón una sola vez
+        
+        Args:
+            items: Iterable de dicts con name, email, subject, message y
+                opcionalmente phone
+            
+        Returns:
+            list: Mensajes creados
+        """
+        with self._lock:
+            return self._create_many(items)
+    
+    def _create_many(self, items):
+        """Crea y publica varios mensajes (requiere self._lock)"""
+        state = self._state.copy()
+        created = []
+        for item in items:
+            self.id_counter += 1
+            msg = Message(
+                item['name'], item['email'], item['subject'], item['message'],
+                phone=item.get('phone'), id=self.id_counter,
+            )
+            state.add(msg)
+            created.append(msg)
+        if created:
+            self._publish(state)
+        return created
+    
+    def read(self, message_id):
+        """
+        Obtiene un mensaje por ID
+        
+        Args:
+            message_id: ID del mensaje
+            
+        Returns:
+            Message: Mensaje encontrado o None
+        """
+        return self._state.by_id.get(message_id)
+    
+    def mark_read(self, message_id):
+        """
+        Marca un mensaje como leído
+        
+        Args:
+            message_id: ID del mensaje
+            
+        Returns:
+            Message: Mensaje actualizado o None si no existe
+        """
+        with self._lock:
+            return self._mark_read(message_id)[0]
+    
+    def _mark_read(self, message_id):
+        """
+        Marca y publica un mensaje como leído (requiere self._lock)
+        
+        Returns:
+            tuple: (mensaje o None, True si cambió su estado)
+        """
+        current = self._state.by_id.get(message_id)
+        if current is None or current.read:
+            return current, False
+        
+        msg = Message(**current.to_dict())
+        msg.read = True
+        state = self._state.copy()
+        state.add(msg)
+        self._publish(state)
+        return msg, True
+    
+    def delete(self, message_id):
+        """
+        Elimina un mensaje
+        
+        Args:
+            message_id: ID del mensaje
+            
+        Returns:
+            bool: True si se eliminó, False si no existe
+        """
+        with self._lock:
+            return self._delete(message_id)
+    
+    def _delete(self, message_id):
+        """Elimina un mensaje y publica el estado (requiere self._lock)"""
+        if message_id not in self._state.by_id:
+            return False
+        
+        state = self._state.copy()
+        state.remove(message_id)
+        self._publish(state)
+        return True
+    
+    def get_all(self):
+        """Obtiene todos los mensajes"""
+        state = self._state
+        return [state.by_id[i] for i in state.order]
+    
+    def get_by_read(self, is_read):
+        """
+        Obtiene mensajes filtrados por estado de lectura
+        
+        Args:
+            is_read: True para leídos, False para no leídos
+        """
+        state = self._state
+        return [state.by_id[i] for i in state.partitions[bool(is_read)]]
+    
+    def paginate(self, is_read=None, after=None, limit=None, with_total=True):
+        """
+        Obtiene una página de mensajes usando paginación por cursor
+        
+        Args:
+            is_read: Filtrar por estado de lectura (None para todos)
+            after: ID del último mensaje de la página anterior
+            limit: Tamaño de página (None para todos)
+            with_total: Calcular el total filtrado
+            
+        Returns:
+            tuple: (mensajes, ID para la siguiente página o None, total
+                filtrado o None)
+        """
+        state = self._state
+        ids = state.order if is_read is None else state.partitions[bool(is_read)]
+        page_ids = list(islice(ids.iter_after(after), None if limit is None else limit + 1))
+        has_more = limit is not None and len(page_ids) > limit
+        page = [state.by_id[i] for i in page_ids[:limit]]
+        
+        next_after = page[-1].id if has_more else None
+        return page, next_after, len(ids) if with_total else None
+    
+    def count(self):
+        """Número total de mensajes"""
+        return len(self._state.by_id)
+    
+    def get_stats(self):
+        """
+        Obtiene los agregados de mensajes
+        
+        Returns:
+            dict: total, read y unread
+        """
+        state = self._state
+        read = len(state.partitions[True])
+        return {
+            'total': len(state.by_id),
+            'read': read,
+            'unread': len(state.by_id) - read,
+        }
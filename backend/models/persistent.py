@@ -0,0 +1,274 @@
+"""
+Model: Persistent
+Estructuras por bloques para los índices en memoria
+"""
+
+from bisect import bisect_left, bisect_right
+from itertools import chain
+
+# Tamaño objetivo de cada bloque de SortedIds; un bloque se divide al
+# superar el doble y se fusiona con su vecino al bajar de un cuarto.
+LOAD = 512
+
+
+class SortedIds:
+    """
+    Conjunto de IDs enteros ordenado, dividido en bloques
+    
+    Insertar o eliminar cuesta O(log n + LOAD), sin desplazar toda la
+    colección como una lista ordenada. Los recorridos por cursor
+    (iter_after) localizan el primer bloque con bisect sobre el máximo
+    de cada uno.
+    
+    copy() comparte los bloques con el original y solo copia la lista de
+    bloques; cada bloque se copia la primera vez que la copia lo modifica,
+    así que el original nunca cambia y puede seguir leyéndose sin bloqueo.
+    """
+    
+    __slots__ = ('_chunks', '_maxes', '_len', '_owned')
+    
+    def __init__(self, ids=()):
+        """
+        Args:
+            ids: IDs iniciales (en cualquier orden, sin duplicados)
+        """
+        ids = sorted(ids)
+        self._chunks = [ids[i:i + LOAD] for i in range(0, len(ids), LOAD)]
+        self._maxes = [chunk[-1] for chunk in self._chunks]
+        self._len = len(ids)
+        self._owned = None
+    
+    def copy(self):
+        """
+        Copia con bloques compartidos (copy-on-write)
+        
+        Returns:
+            SortedIds: Conjunto modificable sin afectar al original
+        """
+        clone = SortedIds.__new__(SortedIds)
+        clone._chunks = list(self._chunks)
+        clone._maxes = list(self._maxes)
+        clone._len = self._len
+        clone._owned = set()
+        return clone
+    
+    def __len__(self):
+        return self._len
+    
+    def __iter__(self):
+        return chain.from_iterable(self._chunks)
+    
+    def __contains__(self, value):
+        i = bisect_left(self._maxes, value)
+        if i == len(self._maxes):
+            return False
+        chunk = self._chunks[i]
+        return chunk[bisect_left(chunk, value)] == value
+    
+    def __repr__(self):
+        return f'SortedIds({list(self)!r})'
+    
+    def iter_after(self, after=None):
+        """
+        Recorre en orden los IDs mayores que after
+        
+        Args:
+            after: Último ID ya visto (None para empezar desde el principio)
+        
+        Yields:
+            int: IDs en orden ascendente
+        """
+        if after is None:
+            yield from self
+            return
+        
+        chunks = self._chunks
+        i = bisect_right(self._maxes, after)
+        if i == len(chunks):
+            return
+        chunk = chunks[i]
+        yield from chunk[bisect_right(chunk, after):]
+        for i in range(i + 1, len(chunks)):
+            yield from chunks[i]
+    
+    def _own(self, i):
+        """Bloque modificable en la posición i (lo copia si es compartido)"""
+        chunk = self._chunks[i]
+        if self._owned is not None and id(chunk) not in self._owned:
+            chunk = self._chunks[i] = list(chunk)
+            self._owned.add(id(chunk))
+        return chunk
+    
+    def _replace(self, i, j, chunks):
+        """Sustituye los bloques i..j-1 por chunks (nuevos, ya propios)"""
+        self._chunks[i:j] = chunks
+        self._maxes[i:j] = [chunk[-1] for chunk in chunks]
+        if self._owned is not None:
+            self._owned.update(id(chunk) for chunk in chunks)
+    
+    def add(self, value):
+        """
+        Inserta un ID (sin efecto si ya está)
+        
+        Returns:
+            bool: True si se insertó
+        """
+        maxes = self._maxes
+        if not maxes:
+            self._replace(0, 0, [[value]])
+            self._len = 1
+            return True
+        
+        i = bisect_left(maxes, value)
+        if i == len(maxes):
+            i -= 1
+            chunk = self._own(i)
+            chunk.append(value)
+            maxes[i] = value
+        else:
+            chunk = self._chunks[i]
+            j = bisect_left(chunk, value)
+            if chunk[j] == value:
+                return False
+            self._own(i).insert(j, value)
+        
+        self._len += 1
+        chunk = self._chunks[i]
+        if len(chunk) > 2 * LOAD:
+            self._replace(i, i + 1, [chunk[:LOAD], chunk[LOAD:]])
+        return True
+    
+    def discard(self, value):
+        """
+        Elimina un ID si está presente
+        
+        Returns:
+            bool: True si se eliminó
+        """
+        maxes = self._maxes
+        i = bisect_left(maxes, value)
+        if i == len(maxes):
+            return False
+        chunk = self._chunks[i]
+        j = bisect_left(chunk, value)
+        if chunk[j] != value:
+            return False
+        
+        chunk = self._own(i)
+        del chunk[j]
+        self._len -= 1
+        if not chunk:
+            del self._chunks[i]
+            del maxes[i]
+        else:
+            maxes[i] = chunk[-1]
+            if len(chunk) < LOAD // 4 and len(self._chunks) > 1:
+                # Fusionar con un vecino para no acumular bloques pequeños
+                k = i if i + 1 < len(self._chunks) else i - 1
+                merged = self._chunks[k] + self._chunks[k + 1]
+                parts = [merged] if len(merged) <= 2 * LOAD else [merged[:LOAD], merged[LOAD:]]
+                self._replace(k, k + 2, parts)
+        return True
+
+
+# Número de cubetas de ChunkedMap (potencia de dos)
+BUCKETS = 1024
+_MASK = BUCKETS - 1
+_MISSING = object()
+
+
+class ChunkedMap:
+    """
+    Diccionario repartido en BUCKETS cubetas por hash de la clave
+    
+    Las lecturas cuestan lo mismo que en un dict. copy() solo copia la
+    lista de cubetas; cada cubeta se copia la primera vez que la copia la
+    modifica, así que una escritura cuesta O(n / BUCKETS) en lugar de
+    O(n) y el original puede seguir leyéndose sin bloqueo.
+    
+    El orden de iteración no es el de inserción.
+    """
+    
+    __slots__ = ('_buckets', '_len', '_owned')
+    
+    def __init__(self):
+        self._buckets = [None] * BUCKETS
+        self._len = 0
+        self._owned = None
+    
+    def copy(self):
+        """
+        Copia con cubetas compartidas (copy-on-write)
+        
+        Returns:
+            ChunkedMap: Mapa modificable sin afectar al original
+        """
+        clone = ChunkedMap.__new__(ChunkedMap)
+        clone._buckets = list(self._buckets)
+        clone._len = self._len
+        clone._owned = set()
+        return clone
+    
+    def __len__(self):
+        return self._len
+    
+    def __contains__(self, key):
+        bucket = self._buckets[hash(key) & _MASK]
+        return bucket is not None and key in bucket
+    
+    def __getitem__(self, key):
+        bucket = self._buckets[hash(key) & _MASK]
+        if bucket is None:
+            raise KeyError(key)
+        return bucket[key]
+    
+    def get(self, key, default=None):
+        bucket = self._buckets[hash(key) & _MASK]
+        if bucket is None:
+            return default
+        return bucket.get(key, default)
+    
+    def _own(self, i):
+        """Cubeta modificable i (la crea o la copia si es compartida)"""
+        bucket = self._buckets[i]
+        if self._owned is None:
+            if bucket is None:
+                bucket = self._buckets[i] = {}
+        elif i not in self._owned:
+            bucket = self._buckets[i] = dict(bucket) if bucket is not None else {}
+            self._owned.add(i)
+        return bucket
+    
+    def __setitem__(self, key, value):
+        bucket = self._own(hash(key) & _MASK)
+        if key not in bucket:
+            self._len += 1
+        bucket[key] = value
+    
+    def pop(self, key, default=_MISSING):
+        i = hash(key) & _MASK
+        bucket = self._buckets[i]
+        if bucket is None or key not in bucket:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        self._len -= 1
+        return self._own(i).pop(key)
+    
+    def __delitem__(self, key):
+        self.pop(key)
+    
+    def __iter__(self):
+        for bucket in self._buckets:
+            if bucket:
+                yield from bucket
+    
+    def values(self):
+        for bucket in self._buckets:
+            if bucket:
+                yield from bucket.values()
+    
+    def items(self):
+        for bucket in self._buckets:
+            if bucket:
+                yield from bucket.items()
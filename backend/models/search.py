@@ -0,0 +1,190 @@
+"""
+Model: Search
+Índice invertido en memoria para búsqueda de texto completo en proyectos
+"""
+
+import heapq
+import math
+import re
+import unicodedata
+
+from models.persistent import ChunkedMap, SortedIds
+
+_TOKEN_RE = re.compile(r'\w+')
+
+# Peso de cada campo en la puntuación
+FIELD_WEIGHTS = (
+    ('title', 3.0),
+    ('technologies', 2.0),
+    ('description', 1.0),
+)
+
+
+def normalize(text):
+    """
+    Normaliza texto para indexar: sin tildes y en minúsculas
+    
+    Args:
+        text: Texto original
+        
+    Returns:
+        str: Texto normalizado ("Programación" -> "programacion")
+    """
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def tokenize(text):
+    """
+    Divide un texto normalizado en términos
+    
+    Args:
+        text: Texto original
+        
+    Returns:
+        list: Términos normalizados
+    """
+    return _TOKEN_RE.findall(normalize(text))
+
+
+def project_terms(project):
+    """
+    Calcula el peso de cada término de un proyecto
+    
+    Args:
+        project: Instancia de Project
+        
+    Returns:
+        dict: término -> peso (suma de pesos de campo por aparición)
+    """
+    weights = {}
+    for field, weight in FIELD_WEIGHTS:
+        value = getattr(project, field)
+        if isinstance(value, list):
+            value = ' '.join(str(v) for v in value)
+        for term in tokenize(value or ''):
+            weights[term] = weights.get(term, 0.0) + weight
+    return weights
+
+
+class SearchIndex:
+    """
+    Índice invertido término -> SortedIds de proyectos
+    
+    Se actualiza de forma incremental con add/remove, por lo que el costo
+    de una búsqueda depende del número de coincidencias y no del tamaño
+    del catálogo. El peso de cada término se guarda por proyecto en
+    _doc_terms (id -> {término: peso}).
+    
+    copy() comparte los postings y los mapas (ChunkedMap) con el original;
+    add/remove copian cada posting la primera vez que lo modifican, así
+    que el índice original nunca cambia y puede seguir leyéndose sin
+    bloqueo.
+    """
+    
+    def __init__(self):
+        """Inicializa el índice vacío"""
+        self._postings = ChunkedMap()
+        self._doc_terms = ChunkedMap()
+        self._owned = None
+    
+    def copy(self):
+        """
+        Copia del índice con postings compartidos (copy-on-write)
+        
+        Returns:
+            SearchIndex: Índice modificable sin afectar al original
+        """
+        clone = SearchIndex.__new__(SearchIndex)
+        clone._postings = self._postings.copy()
+        clone._doc_terms = self._doc_terms.copy()
+        clone._owned = set()
+        return clone
+    
+    def _posting(self, term):
+        """Posting modificable de un término (lo copia si es compartido)"""
+        posting = self._postings.get(term)
+        if self._owned is not None and term not in self._owned:
+            posting = posting.copy() if posting is not None else SortedIds()
+            self._postings[term] = posting
+            self._owned.add(term)
+        elif posting is None:
+            posting = self._postings[term] = SortedIds()
+        return posting
+    
+    def __len__(self):
+        """Número de proyectos indexados"""
+        return len(self._doc_terms)
+    
+    def add(self, project):
+        """
+        Indexa un proyecto (reemplaza la entrada anterior si existe)
+        
+        Args:
+            project: Instancia de Project
+        """
+        self.remove(project.id)
+        terms = project_terms(project)
+        for term in terms:
+            self._posting(term).add(project.id)
+        self._doc_terms[project.id] = terms
+    
+    def remove(self, project_id):
+        """
+        Elimina un proyecto del índice
+        
+        Args:
+            project_id: ID del proyecto
+        """
+        for term in self._doc_terms.pop(project_id, ()):
+            if term not in self._postings:
+                continue
+            posting = self._posting(term)
+            posting.discard(project_id)
+            if not posting:
+                del self._postings[term]
+    
+    def search(self, query, limit=None):
+        """
+        Busca proyectos que contengan todos los términos de la consulta
+        
+        La puntuación suma, por término, el peso del campo ponderado por
+        su rareza en el catálogo (idf).
+        
+        Args:
+            query: Texto de búsqueda
+            limit: Número máximo de resultados (None para todos)
+            
+        Returns:
+            tuple: (lista de (id, puntuación) ordenada, total de coincidencias)
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        postings = [self._postings.get(term) for term in terms]
+        if not postings or any(p is None for p in postings):
+            return [], 0
+        
+        # Se recorre la lista de postings más corta; el resto de términos
+        # se comprueba en los pesos del propio proyecto
+        ranked = sorted(zip(terms, postings), key=lambda pair: len(pair[1]))
+        total_docs = len(self._doc_terms)
+        idfs = [(term, math.log(1 + total_docs / len(p))) for term, p in ranked]
+        doc_terms = self._doc_terms
+        
+        scored = []
+        for project_id in ranked[0][1]:
+            weights = doc_terms[project_id]
+            score = 0.0
+            for term, idf in idfs:
+                weight = weights.get(term)
+                if weight is None:
+                    break
+                score += weight * idf
+            else:
+                scored.append((project_id, score))
+        
+        rank = lambda item: (-item[1], item[0])  # noqa: E731
+        if limit is not None and limit < len(scored):
+            results = heapq.nsmallest(limit, scored, key=rank)
+        else:
+            results = sorted(scored, key=rank)
+        return results, len(scored)
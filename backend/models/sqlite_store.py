@@ -0,0 +1,878 @@
+"""
+Model: SQLite Store
+Backend de persistencia SQLite para proyectos y mensajes de contacto
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+from models.message import Message
+from models.project import Project, ValidationError, batch_result, prepare_batch
+from models.search import tokenize
+
+logger = logging.getLogger(__name__)
+
+
+# ==========================================
+# Esquema
+# ==========================================
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    technologies TEXT NOT NULL,
+    link TEXT NOT NULL,
+    category TEXT NOT NULL,
+    featured INTEGER NOT NULL DEFAULT 0,
+    date TEXT,
+    image TEXT,
+    stats TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_projects_category ON projects (category, id);
+CREATE INDEX IF NOT EXISTS idx_projects_featured ON projects (featured, id);
+
+-- Postings de tecnologías para filtros por faceta
+CREATE TABLE IF NOT EXISTS project_technologies (
+    project_id INTEGER NOT NULL,
+    technology TEXT NOT NULL,
+    PRIMARY KEY (project_id, technology)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_project_technologies_technology
+    ON project_technologies (technology, project_id);
+
+-- Índice de texto completo (sin tildes), mismo orden de pesos que models.search
+CREATE VIRTUAL TABLE IF NOT EXISTS projects_fts USING fts5(
+    title, technologies, description,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    message TEXT NOT NULL,
+    phone TEXT,
+    created_at TEXT NOT NULL,
+    read INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_messages_read ON messages (read, id);
+CREATE INDEX IF NOT EXISTS idx_messages_created_at ON messages (created_at);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+
+-- Proyectos por categoría, mantenido junto a los contadores de meta
+CREATE TABLE IF NOT EXISTS category_counts (
+    category TEXT PRIMARY KEY,
+    count INTEGER NOT NULL
+) WITHOUT ROWID;
+INSERT OR IGNORE INTO meta (key, value) VALUES ('catalog_version', 0);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('messages_version', 0);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('catalog_modified', CAST(strftime('%s', 'now') AS INTEGER));
+"""
+
+# Sentencias constantes: sqlite3 las prepara una vez y las reutiliza
+# desde la caché de sentencias de cada conexión.
+PROJECT_COLUMNS = (
+    'id, title, description, technologies, link, category, featured, '
+    'date, image, stats, created_at, updated_at'
+)
+SQL_PROJECT_INSERT = (
+    'INSERT INTO projects (title, description, technologies, link, category, '
+    'featured, date, image, stats, created_at, updated_at) '
+    'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)'
+)
+SQL_PROJECT_UPDATE = (
+    'UPDATE projects SET title = ?, description = ?, technologies = ?, link = ?, '
+    'category = ?, featured = ?, date = ?, image = ?, stats = ?, updated_at = ? '
+    'WHERE id = ?'
+)
+SQL_PROJECT_BY_ID = f'SELECT {PROJECT_COLUMNS} FROM projects WHERE id = ?'
+SQL_PROJECT_ALL = f'SELECT {PROJECT_COLUMNS} FROM projects ORDER BY id'
+SQL_PROJECT_BY_CATEGORY = f'SELECT {PROJECT_COLUMNS} FROM projects WHERE category = ? ORDER BY id'
+SQL_PROJECT_FEATURED = f'SELECT {PROJECT_COLUMNS} FROM projects WHERE featured = 1 ORDER BY id'
+SQL_PROJECT_PAGE = f'SELECT {PROJECT_COLUMNS} FROM projects WHERE {{where}} ORDER BY id LIMIT ?'
+# Página filtrada por tecnología: recorre el posting de la primera desde el
+# cursor con el índice (technology, project_id) y se detiene en LIMIT
+SQL_PROJECT_PAGE_BY_TECH = (
+    'SELECT ' + ', '.join('p.' + c for c in PROJECT_COLUMNS.split(', ')) + ' '
+    'FROM project_technologies t JOIN projects p ON p.id = t.project_id '
+    'WHERE t.technology = ? AND t.project_id > ? AND {where} ORDER BY t.project_id LIMIT ?'
+)
+SQL_TECH_EXISTS = (
+    'EXISTS (SELECT 1 FROM project_technologies x WHERE x.project_id = p.id AND x.technology = ?)'
+)
+SQL_PROJECT_COUNT = 'SELECT COUNT(*) FROM projects WHERE {where}'
+SQL_TECH_MATCH = (
+    'id IN (SELECT project_id FROM project_technologies WHERE technology IN ({placeholders}) '
+    'GROUP BY project_id HAVING COUNT(*) = ?)'
+)
+SQL_FACET_CATEGORIES = 'SELECT category, COUNT(*) FROM projects WHERE {where} GROUP BY category'
+SQL_FACET_TECHNOLOGIES = (
+    'SELECT technology, COUNT(*) FROM project_technologies WHERE project_id IN '
+    '(SELECT id FROM projects WHERE {where}) GROUP BY technology'
+)
+SQL_FACET_FEATURED = 'SELECT COUNT(*) FROM projects WHERE {where} AND featured = 1'
+SQL_TECH_INSERT = 'INSERT OR IGNORE INTO project_technologies (project_id, technology) VALUES (?, ?)'
+SQL_TECH_DELETE = 'DELETE FROM project_technologies WHERE project_id = ?'
+SQL_TECH_BACKFILL = (
+    'INSERT OR IGNORE INTO project_technologies (project_id, technology) '
+    'SELECT p.id, j.value FROM projects p, json_each(p.technologies) j '
+    'WHERE p.id NOT IN (SELECT project_id FROM project_technologies)'
+)
+SQL_PROJECT_DELETE = 'DELETE FROM projects WHERE id = ?'
+SQL_FTS_INSERT = 'INSERT INTO projects_fts (rowid, title, technologies, description) VALUES (?, ?, ?, ?)'
+SQL_FTS_DELETE = 'DELETE FROM projects_fts WHERE rowid = ?'
+SQL_FTS_BACKFILL = (
+    'INSERT INTO projects_fts (rowid, title, technologies, description) '
+    "SELECT p.id, p.title, (SELECT group_concat(value, ' ') FROM json_each(p.technologies)), "
+    'p.description FROM projects p WHERE p.id NOT IN (SELECT rowid FROM projects_fts)'
+)
+SQL_PROJECT_SEARCH = (
+    'SELECT ' + ', '.join('p.' + c for c in PROJECT_COLUMNS.split(', ')) + ' '
+    'FROM projects_fts JOIN projects p ON p.id = projects_fts.rowid '
+    'WHERE projects_fts MATCH ? '
+    'ORDER BY bm25(projects_fts, 3.0, 2.0, 1.0), p.id LIMIT ?'
+)
+SQL_PROJECT_SEARCH_COUNT = 'SELECT COUNT(*) FROM projects_fts WHERE projects_fts MATCH ?'
+SQL_PROJECT_COUNTED = 'SELECT category, featured FROM projects WHERE id = ?'
+
+# Agregados (total, destacados, por categoría, leídos) mantenidos por cada
+# escritura en su misma transacción, para que las estadísticas no recorran
+# las tablas. Se inicializan una vez desde las tablas si aún no existen.
+SQL_COUNTERS_READY = "SELECT 1 FROM meta WHERE key = 'projects_total'"
+SQL_COUNTERS_INIT = (
+    "INSERT OR REPLACE INTO meta (key, value) SELECT 'projects_total', COUNT(*) FROM projects",
+    "INSERT OR REPLACE INTO meta (key, value) "
+    "SELECT 'projects_featured', COUNT(*) FROM projects WHERE featured = 1",
+    "INSERT OR REPLACE INTO meta (key, value) SELECT 'messages_total', COUNT(*) FROM messages",
+    "INSERT OR REPLACE INTO meta (key, value) "
+    "SELECT 'messages_read', COUNT(*) FROM messages WHERE read = 1",
+    'DELETE FROM category_counts',
+    'INSERT INTO category_counts (category, count) '
+    'SELECT category, COUNT(*) FROM projects GROUP BY category',
+)
+SQL_COUNTER_ADD = 'UPDATE meta SET value = value + ? WHERE key = ?'
+SQL_CATEGORY_COUNT_ADD = (
+    'INSERT INTO category_counts (category, count) VALUES (?, ?) '
+    'ON CONFLICT (category) DO UPDATE SET count = count + excluded.count'
+)
+SQL_PROJECT_TOTALS = "SELECT key, value FROM meta WHERE key IN ('projects_total', 'projects_featured')"
+SQL_PROJECT_CATEGORIES = 'SELECT category, count FROM category_counts WHERE count > 0'
+
+SQL_VERSION_GET = "SELECT value FROM meta WHERE key = 'catalog_version'"
+SQL_VERSION_BUMP = (
+    "UPDATE meta SET value = CASE key WHEN 'catalog_version' THEN value + 1 "
+    "ELSE CAST(strftime('%s', 'now') AS INTEGER) END "
+    "WHERE key IN ('catalog_version', 'catalog_modified')"
+)
+SQL_MODIFIED_GET = "SELECT value FROM meta WHERE key = 'catalog_modified'"
+SQL_MESSAGES_VERSION_GET = "SELECT value FROM meta WHERE key = 'messages_version'"
+SQL_MESSAGES_VERSION_BUMP = "UPDATE meta SET value = value + 1 WHERE key = 'messages_version'"
+
+MESSAGE_COLUMNS = 'id, name, email, subject, message, phone, created_at, read'
+SQL_MESSAGE_INSERT = (
+    'INSERT INTO messages (name, email, subject, message, phone, created_at, read) '
+    'VALUES (?, ?, ?, ?, ?, ?, 0)'
+)
+SQL_MESSAGE_BY_ID = f'SELECT {MESSAGE_COLUMNS} FROM messages WHERE id = ?'
+SQL_MESSAGE_ALL = f'SELECT {MESSAGE_COLUMNS} FROM messages ORDER BY id'
+SQL_MESSAGE_BY_READ = f'SELECT {MESSAGE_COLUMNS} FROM messages WHERE read = ? ORDER BY id'
+SQL_MESSAGE_PAGE = f'SELECT {MESSAGE_COLUMNS} FROM messages WHERE id > ? ORDER BY id LIMIT ?'
+SQL_MESSAGE_PAGE_BY_READ = (
+    f'SELECT {MESSAGE_COLUMNS} FROM messages WHERE read = ? AND id > ? ORDER BY id LIMIT ?'
+)
+SQL_MESSAGE_READ_GET = 'SELECT read FROM messages WHERE id = ?'
+SQL_MESSAGE_MARK_READ = 'UPDATE messages SET read = 1 WHERE id = ?'
+SQL_MESSAGE_DELETE = 'DELETE FROM messages WHERE id = ?'
+SQL_MESSAGE_TOTALS = "SELECT key, value FROM meta WHERE key IN ('messages_total', 'messages_read')"
+
+
+def _page_limit(limit):
+    """Límite SQL que pide un elemento extra para detectar más páginas"""
+    return -1 if limit is None else limit + 1
+
+
+def _split_page(items, limit):
+    """Separa el elemento extra y calcula el cursor siguiente"""
+    if limit is not None and len(items) > limit:
+        items = items[:limit]
+        return items, items[-1].id
+    return items, None
+
+
+# ==========================================
+# Conexiones
+# ==========================================
+
+class SQLiteDatabase:
+    """
+    Acceso a un archivo SQLite compartido
+    
+    Cada hilo reutiliza su propia conexión. La base se abre en modo WAL
+    para que las lecturas no bloqueen a las escrituras.
+    """
+    
+    def __init__(self, path):
+        """
+        Inicializa el acceso a la base de datos
+        
+        Args:
+            path: Ruta del archivo SQLite
+        """
+        self.path = str(path)
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+    
+    def connection(self):
+        """
+        Obtiene la conexión del hilo actual
+        
+        Returns:
+            sqlite3.Connection: Conexión reutilizable del hilo
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, isolation_level=None, cached_statements=256)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA busy_timeout=5000')
+            self._ensure_schema(conn)
+            self._local.conn = conn
+        return conn
+    
+    def _ensure_schema(self, conn):
+        """Crea las tablas e índices la primera vez"""
+        with self._schema_lock:
+            if not self._schema_ready:
+                conn.executescript(SCHEMA)
+                conn.execute(SQL_FTS_BACKFILL)
+                conn.execute(SQL_TECH_BACKFILL)
+                self._init_counters(conn)
+                self._schema_ready = True
+    
+    @staticmethod
+    def _init_counters(conn):
+        """Calcula los agregados desde las tablas si la base aún no los tiene"""
+        if conn.execute(SQL_COUNTERS_READY).fetchone():
+            return
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            if not conn.execute(SQL_COUNTERS_READY).fetchone():
+                for sql in SQL_COUNTERS_INIT:
+                    conn.execute(sql)
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Ejecuta un bloque dentro de una transacción de escritura
+        
+        Yields:
+            sqlite3.Connection: Conexión con la transacción abierta
+        """
+        conn = self.connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+    
+    def close(self):
+        """Cierra la conexión del hilo actual"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+# ==========================================
+# Proyectos
+# ==========================================
+
+def _project_from_row(row):
+    """Construye un Project desde una fila"""
+    project = Project(
+        id=row['id'],
+        title=row['title'],
+        description=row['description'],
+        technologies=json.loads(row['technologies']),
+        link=row['link'],
+        category=row['category'],
+        featured=bool(row['featured']),
+        date=row['date'],
+        image=row['image'],
+        stats=json.loads(row['stats']),
+    )
+    project.created_at = datetime.fromisoformat(row['created_at'])
+    project.updated_at = datetime.fromisoformat(row['updated_at'])
+    return project
+
+
+def _project_values(project):
+    """Valores de las columnas editables de un Project"""
+    return (
+        project.title,
+        project.description,
+        json.dumps(project.technologies, ensure_ascii=False),
+        project.link,
+        project.category,
+        int(bool(project.featured)),
+        project.date,
+        project.image,
+        json.dumps(project.stats, ensure_ascii=False),
+    )
+
+
+def _fts_values(project):
+    """Valores indexados en projects_fts para un Project"""
+    return (
+        project.id,
+        project.title,
+        ' '.join(str(t) for t in project.technologies),
+        project.description,
+    )
+
+
+def _index_project(conn, project):
+    """Agrega un proyecto a las tablas de texto completo y tecnologías"""
+    conn.execute(SQL_FTS_INSERT, _fts_values(project))
+    conn.executemany(SQL_TECH_INSERT, [(project.id, tech) for tech in project.technologies])
+
+
+def _unindex_project(conn, project_id):
+    """Elimina un proyecto de las tablas de texto completo y tecnologías"""
+    conn.execute(SQL_FTS_DELETE, (project_id,))
+    conn.execute(SQL_TECH_DELETE, (project_id,))
+
+
+def _reindex_project(conn, project):
+    """Reemplaza las entradas de índice de un proyecto"""
+    _unindex_project(conn, project.id)
+    _index_project(conn, project)
+
+
+def _counted(project):
+    """Campos de un Project que afectan a los agregados"""
+    return (project.category, bool(project.featured))
+
+
+def _stored_counted(conn, project_id):
+    """(categoría, destacado) guardados de un proyecto o None si no existe"""
+    row = conn.execute(SQL_PROJECT_COUNTED, (project_id,)).fetchone()
+    return (row['category'], bool(row['featured'])) if row else None
+
+
+def _update_counters(conn, old, new):
+    """
+    Ajusta los agregados del catálogo dentro de la transacción actual
+    
+    Args:
+        conn: Conexión con la transacción abierta
+        old: (categoría, destacado) antes del cambio o None si no existía
+        new: (categoría, destacado) después del cambio o None si se eliminó
+    """
+    if old == new:
+        return
+    total = (new is not None) - (old is not None)
+    featured = bool(new and new[1]) - bool(old and old[1])
+    if total:
+        conn.execute(SQL_COUNTER_ADD, (total, 'projects_total'))
+    if featured:
+        conn.execute(SQL_COUNTER_ADD, (featured, 'projects_featured'))
+    if old is not None and (new is None or old[0] != new[0]):
+        conn.execute(SQL_CATEGORY_COUNT_ADD, (old[0], -1))
+    if new is not None and (old is None or old[0] != new[0]):
+        conn.execute(SQL_CATEGORY_COUNT_ADD, (new[0], 1))
+
+
+def _project_filters(category=None, featured=False, technologies=()):
+    """
+    Cláusula WHERE (sin cursor) para los filtros combinados con AND
+    
+    Returns:
+        tuple: (sql, parámetros)
+    """
+    clauses = ['1 = 1']
+    params = []
+    if category:
+        clauses.append('category = ?')
+        params.append(category)
+    if featured:
+        clauses.append('featured = 1')
+    technologies = list(dict.fromkeys(technologies))
+    if technologies:
+        placeholders = ', '.join('?' * len(technologies))
+        clauses.append(SQL_TECH_MATCH.format(placeholders=placeholders))
+        params.extend(technologies)
+        params.append(len(technologies))
+    return ' AND '.join(clauses), params
+
+
+class SQLiteProjectManager:
+    """
+    Gestor de proyectos persistido en SQLite
+    Implementa las mismas operaciones que ProjectManager
+    """
+    
+    def __init__(self, db):
+        """
+        Inicializa el gestor
+        
+        Args:
+            db: Instancia de SQLiteDatabase
+        """
+        self.db = db
+    
+    @property
+    def version(self):
+        """Versión del catálogo compartida entre procesos"""
+        return self.db.connection().execute(SQL_VERSION_GET).fetchone()[0]
+    
+    @property
+    def last_modified(self):
+        """Momento (epoch) de la última modificación del catálogo"""
+        return self.db.connection().execute(SQL_MODIFIED_GET).fetchone()[0]
+    
+    @property
+    def projects(self):
+        """Lista de proyectos en orden de inserción (compatibilidad)"""
+        return self.get_all()
+    
+    def create(self, **kwargs):
+        """
+        Crea un nuevo proyecto
+        
+        Args:
+            **kwargs: Datos del proyecto
+            
+        Returns:
+            Project: Proyecto creado o None si hay errores
+        """
+        kwargs.pop('id', None)
+        project = Project(**kwargs)
+        is_valid, errors = project.validate()
+        
+        if not is_valid:
+            logger.warning('Errores de validación: %s', errors)
+            return None
+        
+        with self.db.transaction() as conn:
+            cursor = conn.execute(SQL_PROJECT_INSERT, _project_values(project) + (
+                project.created_at.isoformat(),
+                project.updated_at.isoformat(),
+            ))
+            project.id = cursor.lastrowid
+            _index_project(conn, project)
+            _update_counters(conn, None, _counted(project))
+            conn.execute(SQL_VERSION_BUMP)
+        return project
+    
+    def apply_batch(self, operations):
+        """
+        Aplica un lote de operaciones en una sola transacción
+        
+        Args:
+            operations: Lista de operaciones (ver prepare_batch)
+            
+        Returns:
+            tuple: (resultados por operación, errores)
+        """
+        with self.db.transaction() as conn:
+            plan, errors = prepare_batch(operations, self.read)
+            if errors:
+                return [], errors
+            
+            results = []
+            for index, (op, target) in enumerate(plan):
+                if op == 'create':
+                    cursor = conn.execute(SQL_PROJECT_INSERT, _project_values(target) + (
+                        target.created_at.isoformat(),
+                        target.updated_at.isoformat(),
+                    ))
+                    target.id = cursor.lastrowid
+                    _index_project(conn, target)
+                    _update_counters(conn, None, _counted(target))
+                    results.append(batch_result(index, op, target.id, target))
+                elif op == 'update':
+                    old = _stored_counted(conn, target.id)
+                    conn.execute(SQL_PROJECT_UPDATE, _project_values(target) + (
+                        target.updated_at.isoformat(),
+                        target.id,
+                    ))
+                    _reindex_project(conn, target)
+                    _update_counters(conn, old, _counted(target))
+                    results.append(batch_result(index, op, target.id, target))
+                else:
+                    old = _stored_counted(conn, target)
+                    conn.execute(SQL_PROJECT_DELETE, (target,))
+                    _unindex_project(conn, target)
+                    _update_counters(conn, old, None)
+                    results.append(batch_result(index, op, target))
+            
+            if plan:
+                conn.execute(SQL_VERSION_BUMP)
+        return results, []
+    
+    def read(self, project_id):
+        """
+        Lee un proyecto por ID
+        
+        Args:
+            project_id: ID del proyecto
+            
+        Returns:
+            Project: Proyecto encontrado o None
+        """
+        row = self.db.connection().execute(SQL_PROJECT_BY_ID, (project_id,)).fetchone()
+        return _project_from_row(row) if row else None
+    
+    def update(self, project_id, **kwargs):
+        """
+        Actualiza un proyecto
+        
+        Args:
+            project_id: ID del proyecto
+            **kwargs: Datos a actualizar
+            
+        Returns:
+            Project: Proyecto actualizado o None
+            
+        Raises:
+            ValidationError: Si el proyecto resultante no es válido
+        """
+        with self.db.transaction() as conn:
+            row = conn.execute(SQL_PROJECT_BY_ID, (project_id,)).fetchone()
+            if not row:
+                return None
+            
+            project = _project_from_row(row)
+            old = _counted(project)
+            if project.update(**kwargs):
+                is_valid, errors = project.validate()
+                if not is_valid:
+                    raise ValidationError(errors)
+                conn.execute(SQL_PROJECT_UPDATE, _project_values(project) + (
+                    project.updated_at.isoformat(),
+                    project_id,
+                ))
+                _reindex_project(conn, project)
+                _update_counters(conn, old, _counted(project))
+                conn.execute(SQL_VERSION_BUMP)
+        return project
+    
+    def delete(self, project_id):
+        """
+        Elimina un proyecto
+        
+        Args:
+            project_id: ID del proyecto
+            
+        Returns:
+            bool: True si se eliminó, False si no existe
+        """
+        with self.db.transaction() as conn:
+            old = _stored_counted(conn, project_id)
+            if old is None:
+                return False
+            conn.execute(SQL_PROJECT_DELETE, (project_id,))
+            _unindex_project(conn, project_id)
+            _update_counters(conn, old, None)
+            conn.execute(SQL_VERSION_BUMP)
+        return True
+    
+    def _query(self, sql, params=()):
+        """Ejecuta una consulta y construye los proyectos"""
+        rows = self.db.connection().execute(sql, params).fetchall()
+        return [_project_from_row(row) for row in rows]
+    
+    def get_all(self):
+        """Obtiene todos los proyectos"""
+        return self._query(SQL_PROJECT_ALL)
+    
+    def get_by_category(self, category):
+        """Obtiene proyectos por categoría"""
+        return self._query(SQL_PROJECT_BY_CATEGORY, (category,))
+    
+    def get_featured(self):
+        """Obtiene proyectos destacados"""
+        return self._query(SQL_PROJECT_FEATURED)
+    
+    def query(self, category=None, featured=False, technologies=(), after=None,
+              limit=None, facets=False, with_total=False):
+        """
+        Consulta con filtros combinados, paginación por cursor y facetas
+        
+        La página solo lee filas a partir del cursor; el COUNT y las
+        facetas recorren el resultado completo y se ejecutan solo si se
+        piden.
+        
+        Returns:
+            dict: items, next_after, total (None si no se pidió) y facets
+                (None si no se pidieron)
+        """
+        conn = self.db.connection()
+        rows = self._page_rows(conn, category, featured, technologies, after, limit)
+        page, next_after = _split_page([_project_from_row(row) for row in rows], limit)
+        
+        where, params = _project_filters(category, featured, technologies)
+        total = None
+        if with_total:
+            total = conn.execute(SQL_PROJECT_COUNT.format(where=where), params).fetchone()[0]
+        
+        facet_counts = None
+        if facets:
+            facet_counts = {
+                'category': dict(conn.execute(SQL_FACET_CATEGORIES.format(where=where), params).fetchall()),
+                'technologies': dict(conn.execute(SQL_FACET_TECHNOLOGIES.format(where=where), params).fetchall()),
+                'featured': conn.execute(SQL_FACET_FEATURED.format(where=where), params).fetchone()[0],
+            }
+        
+        return {
+            'items': page,
+            'next_after': next_after,
+            'total': total,
+            'facets': facet_counts,
+        }
+    
+    @staticmethod
+    def _page_rows(conn, category, featured, technologies, after, limit):
+        """Filas de una página de proyectos a partir del cursor"""
+        technologies = list(dict.fromkeys(technologies))
+        if not technologies:
+            where, params = _project_filters(category, featured)
+            return conn.execute(
+                SQL_PROJECT_PAGE.format(where=where + ' AND id > ?'),
+                params + [after or 0, _page_limit(limit)],
+            )
+        
+        where, params = _project_filters(category, featured)
+        for tech in technologies[1:]:
+            where += ' AND ' + SQL_TECH_EXISTS
+            params.append(tech)
+        return conn.execute(
+            SQL_PROJECT_PAGE_BY_TECH.format(where=where),
+            [technologies[0], after or 0] + params + [_page_limit(limit)],
+        )
+    
+    def paginate(self, category=None, featured=False, after=None, limit=None, technologies=(),
+                 with_total=True):
+        """
+        Obtiene una página de proyectos usando paginación por cursor
+        
+        Returns:
+            tuple: (proyectos, ID para la siguiente página o None, total
+                filtrado o None si with_total es False)
+        """
+        result = self.query(category, featured, technologies, after, limit, with_total=with_total)
+        return result['items'], result['next_after'], result['total']
+    
+    def search(self, query, limit=None):
+        """
+        Busca proyectos por texto usando el índice FTS5
+        
+        Returns:
+            tuple: (proyectos ordenados por relevancia, total de coincidencias)
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return [], 0
+        
+        match = ' '.join(f'"{term}"' for term in terms)
+        conn = self.db.connection()
+        rows = conn.execute(SQL_PROJECT_SEARCH, (match, -1 if limit is None else limit))
+        projects = [_project_from_row(row) for row in rows]
+        total = conn.execute(SQL_PROJECT_SEARCH_COUNT, (match,)).fetchone()[0]
+        return projects, total
+    
+    def get_stats(self):
+        """
+        Obtiene los agregados del catálogo
+        
+        Los conteos se leen de meta y category_counts, que cada escritura
+        actualiza en su transacción, por lo que no se recorre la tabla.
+        
+        Returns:
+            dict: total_projects, featured_projects y conteo por categoría
+        """
+        conn = self.db.connection()
+        totals = dict(conn.execute(SQL_PROJECT_TOTALS).fetchall())
+        categories = dict(conn.execute(SQL_PROJECT_CATEGORIES).fetchall())
+        return {
+            'total_projects': totals['projects_total'],
+            'featured_projects': totals['projects_featured'],
+            'categories': categories,
+        }
+    
+    def to_dict_list(self):
+        """Convierte todos los proyectos a lista de diccionarios"""
+        return [p.to_dict() for p in self.get_all()]
+
+
+# ==========================================
+# Mensajes
+# ==========================================
+
+def _message_from_row(row):
+    """Construye un Message desde una fila"""
+    return Message(
+        name=row['name'],
+        email=row['email'],
+        subject=row['subject'],
+        message=row['message'],
+        phone=row['phone'],
+        id=row['id'],
+        created_at=row['created_at'],
+        read=bool(row['read']),
+    )
+
+
+class SQLiteMessageStore:
+    """
+    Almacén de mensajes persistido en SQLite
+    Implementa las mismas operaciones que MessageStore
+    """
+    
+    def __init__(self, db):
+        """
+        Inicializa el almacén
+        
+        Args:
+            db: Instancia de SQLiteDatabase
+        """
+        self.db = db
+    
+    @property
+    def version(self):
+        """Versión del buzón compartida entre procesos"""
+        return self.db.connection().execute(SQL_MESSAGES_VERSION_GET).fetchone()[0]
+    
+    def create(self, name, email, subject, message, phone=None):
+        """Crea y guarda un mensaje"""
+        msg = Message(name, email, subject, message, phone=phone)
+        with self.db.transaction() as conn:
+            cursor = conn.execute(SQL_MESSAGE_INSERT, (
+                msg.name, msg.email, msg.subject, msg.message, msg.phone, msg.created_at,
+            ))
+            conn.execute(SQL_COUNTER_ADD, (1, 'messages_total'))
+            conn.execute(SQL_MESSAGES_VERSION_BUMP)
+        msg.id = cursor.lastrowid
+        return msg
+    
+    def create_many(self, items):
+        """Crea varios mensajes en una sola transacción"""
+        created = []
+        with self.db.transaction() as conn:
+            for item in items:
+                msg = Message(item['name'], item['email'], item['subject'], item['message'],
+                              phone=item.get('phone'))
+                msg.id = conn.execute(SQL_MESSAGE_INSERT, (
+                    msg.name, msg.email, msg.subject, msg.message, msg.phone, msg.created_at,
+                )).lastrowid
+                created.append(msg)
+            if created:
+                conn.execute(SQL_COUNTER_ADD, (len(created), 'messages_total'))
+                conn.execute(SQL_MESSAGES_VERSION_BUMP)
+        return created
+    
+    def read(self, message_id):
+        """Obtiene un mensaje por ID"""
+        row = self.db.connection().execute(SQL_MESSAGE_BY_ID, (message_id,)).fetchone()
+        return _message_from_row(row) if row else None
+    
+    def mark_read(self, message_id):
+        """Marca un mensaje como leído"""
+        with self.db.transaction() as conn:
+            row = conn.execute(SQL_MESSAGE_BY_ID, (message_id,)).fetchone()
+            if not row:
+                return None
+            if not row['read']:
+                conn.execute(SQL_MESSAGE_MARK_READ, (message_id,))
+                conn.execute(SQL_COUNTER_ADD, (1, 'messages_read'))
+                conn.execute(SQL_MESSAGES_VERSION_BUMP)
+        msg = _message_from_row(row)
+        msg.read = True
+        return msg
+    
+    def delete(self, message_id):
+        """Elimina un mensaje"""
+        with self.db.transaction() as conn:
+            row = conn.execute(SQL_MESSAGE_READ_GET, (message_id,)).fetchone()
+            if not row:
+                return False
+            conn.execute(SQL_MESSAGE_DELETE, (message_id,))
+            conn.execute(SQL_COUNTER_ADD, (-1, 'messages_total'))
+            if row['read']:
+                conn.execute(SQL_COUNTER_ADD, (-1, 'messages_read'))
+            conn.execute(SQL_MESSAGES_VERSION_BUMP)
+        return True
+    
+    def get_all(self):
+        """Obtiene todos los mensajes"""
+        rows = self.db.connection().execute(SQL_MESSAGE_ALL).fetchall()
+        return [_message_from_row(row) for row in rows]
+    
+    def get_by_read(self, is_read):
+        """Obtiene mensajes filtrados por estado de lectura"""
+        rows = self.db.connection().execute(SQL_MESSAGE_BY_READ, (int(is_read),)).fetchall()
+        return [_message_from_row(row) for row in rows]
+    
+    def paginate(self, is_read=None, after=None, limit=None, with_total=True):
+        """
+        Obtiene una página de mensajes usando paginación por cursor
+        
+        Returns:
+            tuple: (mensajes, ID para la siguiente página o None, total
+                filtrado o None si with_total es False)
+        """
+        after = after or 0
+        conn = self.db.connection()
+        if is_read is None:
+            rows = conn.execute(SQL_MESSAGE_PAGE, (after, _page_limit(limit)))
+        else:
+            rows = conn.execute(SQL_MESSAGE_PAGE_BY_READ, (int(is_read), after, _page_limit(limit)))
+        page, next_after = _split_page([_message_from_row(row) for row in rows], limit)
+        if not with_total:
+            return page, next_after, None
+        
+        stats = self.get_stats()
+        total = stats['total'] if is_read is None else stats['read' if is_read else 'unread']
+        return page, next_after, total
+    
+    def count(self):
+        """Número total de mensajes"""
+        return self.get_stats()['total']
+    
+    def get_stats(self):
+        """
+        Obtiene los agregados de mensajes (contadores de meta)
+        
+        Returns:
+            dict: total, read y unread
+        """
+        totals = dict(self.db.connection().execute(SQL_MESSAGE_TOTALS).fetchall())
+        total = totals['messages_total']
+        read_count = totals['messages_read']
+        return {
+            'total': total,
+            'read': read_count,
+            'unread': total - read_count,
+        }
@@ -0,0 +1,65 @@
+"""
+Model: Storage
+Selección del backend de almacenamiento según la configuración
+"""
+
+from config.settings import BASE_DIR, DATABASE, JOURNAL, STORAGE_BACKEND
+from models.message import MessageStore
+from models.project import ProjectManager
+
+_database = None
+
+
+def get_database():
+    """
+    Obtiene la base de datos SQLite compartida
+    
+    Returns:
+        SQLiteDatabase: Instancia única por proceso
+    """
+    global _database
+    
+    if DATABASE['engine'] != 'sqlite':
+        raise ValueError(f"Motor de base de datos no soportado: {DATABASE['engine']}")
+    
+    if _database is None:
+        from models.sqlite_store import SQLiteDatabase
+        _database = SQLiteDatabase(BASE_DIR / DATABASE['name'])
+    return _database
+
+
+def create_project_manager(backend=None):
+    """
+    Crea el gestor de proyectos del backend configurado
+    
+    Args:
+        backend: 'memory' o 'sqlite' (por defecto STORAGE_BACKEND)
+    """
+    backend = backend or STORAGE_BACKEND
+    if backend == 'sqlite':
+        from models.sqlite_store import SQLiteProjectManager
+        return SQLiteProjectManager(get_database())
+    return ProjectManager()
+
+
+def create_message_store(backend=None):
+    """
+    Crea el almacén de mensajes del backend configurado
+    
+    Args:
+        backend: 'memory' o 'sqlite' (por defecto STORAGE_BACKEND)
+    """
+    backend = backend or STORAGE_BACKEND
+    if backend == 'sqlite':
+        from models.sqlite_store import SQLiteMessageStore
+        return SQLiteMessageStore(get_database())
+    if JOURNAL['enabled']:
+        if not JOURNAL['path']:
+            raise ValueError('JOURNAL_ENABLED requiere indicar JOURNAL_PATH')
+        from models.journal import JournaledMessageStore
+        return JournaledMessageStore(
+            BASE_DIR / JOURNAL['path'],
+            flush_interval=JOURNAL['flush_interval_ms'] / 1000,
+            compact_min_records=JOURNAL['compact_min_records'],
+        )
+    return MessageStore()
@@ -4,44 +4,32 @@ API endpoints para gestionar mensajes de contacto
 """
 
 from flask import Blueprint, jsonify, request
-from datetime import datetime
+from config.settings import FEATURES
+from models.message import Message
+from models.storage import create_message_store
+from services.notifications import EmailNotifier
+from utils.cache import cached, create_cache
+from utils.fields import parse_fields
+from utils.pagination import encode_cursor, iter_pages, parse_page_args
+from utils.serialization import list_response
+from utils.streaming import ndjson_response
 
 # Crear blueprint para contacto
 contact_bp = Blueprint('contact', __name__, url_prefix='/api/v1/contact')
 
-# Almacenamiento simple de mensajes (en producción usar BD)
-messages = []
+# Almacenamiento de mensajes (memoria o SQLite según STORAGE_BACKEND)
+store = create_message_store()
 
+# Notificaciones por email en segundo plano
+notifier = EmailNotifier.from_settings()
 
-# ==========================================
-# Modelo de mensaje
-# ==========================================
+# Caché de respuestas de lectura, invalidada por la versión del buzón
+response_cache = create_cache()
 
-class Message:
-    """Modelo de mensaje de contacto"""
-    
-    def __init__(self, name, email, subject, message, phone=None):
-        self.id = len(messages) + 1
-        self.name = name
-        self.email = email
-        self.subject = subject
-        self.message = message
-        self.phone = phone
-        self.created_at = datetime.now().isoformat()
-        self.read = False
-    
-    def to_dict(self):
-        """Convierte mensaje a diccionario"""
-        return {
-            'id': self.id,
-            'name': self.name,
-            'email': self.email,
-            'subject': self.subject,
-            'message': self.message,
-            'phone': self.phone,
-            'created_at': self.created_at,
-            'read': self.read
-        }
+
+def inbox_version():
+    """Retorna la versión actual del buzón"""
+    return store.version
 
 
 # ==========================================
@@ -105,7 +93,7 @@ def send_message():
             }), 400
         
         # Crear mensaje
-        msg = Message(
+        msg = store.create(
             name=data['name'],
             email=data['email'],
             subject=data['subject'],
@@ -113,7 +101,9 @@ def send_message():
             phone=data.get('phone')
         )
         
-        messages.append(msg)
+        # Notificar sin bloquear la respuesta (se envía en segundo plano)
+        if FEATURES['email_notifications']:
+            notifier.enqueue(msg)
         
         return jsonify({
             'status': 'success',
@@ -138,12 +128,16 @@ def send_message():
 # ==========================================
 
 @contact_bp.route('/messages', methods=['GET'])
+@cached(response_cache, version=inbox_version)
 def get_messages():
     """
     Obtiene todos los mensajes
     
     Query params:
         - read: 'true' o 'false' para filtrar leídos
+        - limit: Tamaño de página
+        - cursor: Cursor devuelto en next_cursor
+        - fields: Campos a incluir separados por coma
     
     Returns:
         JSON con lista de mensajes
@@ -151,20 +145,28 @@ def get_messages():
     try:
         read_filter = request.args.get('read', None)
         
+        try:
+            after, limit = parse_page_args(request.args)
+            fields = parse_fields(request.args, Message.FIELDS)
+        except ValueError as e:
+            return jsonify({
+                'status': 'error',
+                'message': str(e)
+            }), 400
+        
         # Filtrar por estado de lectura
-        if read_filter:
-            is_read = read_filter.lower() == 'true'
-            filtered_messages = [m for m in messages if m.read == is_read]
-        else:
-            filtered_messages = messages
+        is_read = read_filter.lower() == 'true' if read_filter else None
+        page, next_after, count = store.paginate(is_read=is_read, after=after, limit=limit)
         
-        return jsonify({
+        stats = store.get_stats()
+        
+        return list_response({
             'status': 'success',
-            'count': len(filtered_messages),
-            'total': len(messages),
-            'unread': len([m for m in messages if not m.read]),
-            'data': [m.to_dict() for m in filtered_messages]
-        }), 200
+            'count': count,
+            'total': stats['total'],
+            'unread': stats['unread'],
+            'next_cursor': encode_cursor(next_after),
+        }, page, fields), 200
     
     except Exception as e:
         return jsonify({
@@ -173,6 +175,40 @@ def get_messages():
         }), 500
 
 
+@contact_bp.route('/messages/export', methods=['GET'])
+def export_messages():
+    """
+    Exporta los mensajes en streaming (NDJSON, un mensaje por línea)
+    
+    Query params:
+        - read: 'true' o 'false' para filtrar leídos
+        - fields: Campos a incluir separados por coma
+    
+    Returns:
+        Respuesta application/x-ndjson (gzip si el cliente lo acepta)
+    """
+    try:
+        read_filter = request.args.get('read', None)
+        
+        try:
+            fields = parse_fields(request.args, Message.FIELDS)
+        except ValueError as e:
+            return jsonify({
+                'status': 'error',
+                'message': str(e)
+            }), 400
+        
+        is_read = read_filter.lower() == 'true' if read_filter else None
+        pages = iter_pages(store.paginate, is_read=is_read)
+        return ndjson_response(pages, fields, filename='messages.ndjson')
+    
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': f'Error al exportar mensajes: {str(e)}'
+        }), 500
+
+
 @contact_bp.route('/messages/<int:message_id>', methods=['GET'])
 def get_message(message_id):
     """
@@ -181,11 +217,23 @@ def get_message(message_id):
     Args:
         message_id: ID del mensaje
     
+    Query params:
+        - fields: Campos a incluir separados por coma
+    
     Returns:
         JSON con datos del mensaje
     """
     try:
-        msg = next((m for m in messages if m.id == message_id), None)
+        try:
+            fields = parse_fields(request.args, Message.FIELDS)
+        except ValueError as e:
+            return jsonify({
+                'status': 'error',
+                'message': str(e)
+            }), 400
+        
+        # Obtener y marcar como leído
+        msg = store.mark_read(message_id)
         
         if not msg:
             return jsonify({
@@ -193,12 +241,9 @@ def get_message(message_id):
                 'message': f'Mensaje {message_id} no encontrado'
             }), 404
         
-        # Marcar como leído
-        msg.read = True
-        
         return jsonify({
             'status': 'success',
-            'data': msg.to_dict()
+            'data': msg.to_dict(fields)
         }), 200
     
     except Exception as e:
@@ -224,7 +269,7 @@ def mark_as_read(message_id):
         JSON con confirmación
     """
     try:
-        msg = next((m for m in messages if m.id == message_id), None)
+        msg = store.mark_read(message_id)
         
         if not msg:
             return jsonify({
@@ -232,8 +277,6 @@ def mark_as_read(message_id):
                 'message': f'Mensaje {message_id} no encontrado'
             }), 404
         
-        msg.read = True
-        
         return jsonify({
             'status': 'success',
             'message': 'Mensaje marcado como leído',
@@ -263,18 +306,12 @@ def delete_message(message_id):
         JSON con confirmación
     """
     try:
-        global messages
-        
-        msg = next((m for m in messages if m.id == message_id), None)
-        
-        if not msg:
+        if not store.delete(message_id):
             return jsonify({
                 'status': 'error',
                 'message': f'Mensaje {message_id} no encontrado'
             }), 404
         
-        messages = [m for m in messages if m.id != message_id]
-        
         return jsonify({
             'status': 'success',
             'message': f'Mensaje {message_id} eliminado exitosamente'
@@ -292,6 +329,7 @@ def delete_message(message_id):
 # ==========================================
 
 @contact_bp.route('/stats', methods=['GET'])
+@cached(response_cache, version=inbox_version)
 def get_stats():
     """
     Obtiene estadísticas de mensajes
@@ -300,16 +338,17 @@ def get_stats():
         JSON con estadísticas
     """
     try:
-        unread_count = len([m for m in messages if not m.read])
-        read_count = len([m for m in messages if m.read])
+        stats = store.get_stats()
+        total = stats['total']
+        read_count = stats['read']
         
         return jsonify({
             'status': 'success',
             'stats': {
-                'total_messages': len(messages),
-                'unread': unread_count,
+                'total_messages': total,
+                'unread': stats['unread'],
                 'read': read_count,
-                'percentage_read': round((read_count / len(messages) * 100), 2) if messages else 0
+                'percentage_read': round((read_count / total * 100), 2) if total else 0
             }
         }), 200
     
@@ -336,7 +375,7 @@ def health():
         'status': 'healthy',
         'service': 'contact-api',
         'version': '1.0.0',
-        'messages': len(messages)
+        'messages': store.count()
     }), 200
 
 
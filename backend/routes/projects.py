@@ -4,13 +4,43 @@ API endpoints para gestionar proyectos
 """
 
 from flask import Blueprint, jsonify, request
-from models.project import ProjectManager, Project
+from config.settings import BATCH, PAGINATION
+from models.project import Project, ValidationError
+from models.storage import create_project_manager
+from utils.cache import cached, create_cache, request_cache_key
+from utils.conditional import conditional
+from utils.fields import parse_fields
+from utils.pagination import encode_cursor, iter_pages, parse_page_args
+from utils.serialization import list_response
+from utils.streaming import ndjson_response
 
 # Crear blueprint para proyectos
 projects_bp = Blueprint('projects', __name__, url_prefix='/api/v1/projects')
 
-# Instancia global del manager
-manager = ProjectManager()
+# Instancia global del manager (memoria o SQLite según STORAGE_BACKEND)
+manager = create_project_manager()
+
+# Caché de respuestas de lectura, invalidada por la versión del catálogo
+response_cache = create_cache()
+
+
+def catalog_version():
+    """Retorna la versión actual del catálogo"""
+    return manager.version
+
+
+def catalog_validators(**kwargs):
+    """Validadores de los listados: versión y fecha del catálogo y petición"""
+    modified = manager.last_modified
+    return f'{manager.version}:{modified}:{request_cache_key()}', modified
+
+
+def project_validators(project_id):
+    """Validadores de un proyecto: su updated_at y la petición"""
+    project = manager.read(project_id)
+    if project is None:
+        return None
+    return f'{project.updated_at.isoformat()}:{request_cache_key()}', project.updated_at.timestamp()
 
 
 # ==========================================
@@ -18,6 +48,8 @@ manager = ProjectManager()
 # ==========================================
 
 @projects_bp.route('', methods=['GET'])
+@conditional(catalog_validators)
+@cached(response_cache, version=catalog_version)
 def get_projects():
     """
     Obtiene todos los proyectos
@@ -25,6 +57,17 @@ def get_projects():
     Query params:
         - category: Filtrar por categoría
         - featured: 'true' para solo destacados
+        - tech: Tecnología requerida (repetible, se combinan con AND)
+        - facets: 'true' para incluir conteos por faceta
+        - total: 'true' para incluir el total filtrado en todas las páginas
+        - limit: Tamaño de página
+        - cursor: Cursor devuelto en next_cursor
+        - fields: Campos a incluir separados por coma
+    
+    Todos los filtros se combinan con AND. El total (count) y, con tech,
+    los conteos por faceta recorren el resultado completo, así que solo
+    se calculan en la primera página (sin cursor) o si se piden con
+    total/facets; en las demás páginas count es null.
     
     Returns:
         JSON con lista de proyectos
@@ -32,22 +75,41 @@ def get_projects():
     try:
         category = request.args.get('category', None)
         featured = request.args.get('featured', None)
+        technologies = request.args.getlist('tech')
         
-        # Filtrar por categoría si se proporciona
-        if category:
-            projects = manager.get_by_category(category)
-        # Obtener solo destacados si se proporciona
-        elif featured and featured.lower() == 'true':
-            projects = manager.get_featured()
-        # Obtener todos
-        else:
-            projects = manager.get_all()
+        try:
+            after, limit = parse_page_args(request.args)
+            fields = parse_fields(request.args, Project.FIELDS)
+        except ValueError as e:
+            return jsonify({
+                'status': 'error',
+                'message': str(e)
+            }), 400
         
-        return jsonify({
+        first_page = after is None
+        facets = (request.args.get('facets', '').lower() == 'true' or
+                  (first_page and bool(technologies)))
+        with_total = first_page or request.args.get('total', '').lower() == 'true'
+        
+        result = manager.query(
+            category=category,
+            featured=bool(featured and featured.lower() == 'true'),
+            technologies=technologies,
+            after=after,
+            limit=limit,
+            facets=facets,
+            with_total=with_total,
+        )
+        
+        envelope = {
             'status': 'success',
-            'count': len(projects),
-            'data': [p.to_dict() for p in projects]
-        }), 200
+            'count': result['total'],
+            'next_cursor': encode_cursor(result['next_after']),
+        }
+        if facets:
+            envelope['facets'] = result['facets']
+        
+        return list_response(envelope, result['items'], fields), 200
     
     except Exception as e:
         return jsonify({
@@ -57,6 +119,7 @@ def get_projects():
 
 
 @projects_bp.route('/<int:project_id>', methods=['GET'])
+@conditional(project_validators)
 def get_project(project_id):
     """
     Obtiene un proyecto específico por ID
@@ -64,10 +127,21 @@ def get_project(project_id):
     Args:
         project_id: ID del proyecto
     
+    Query params:
+        - fields: Campos a incluir separados por coma
+    
     Returns:
         JSON con datos del proyecto
     """
     try:
+        try:
+            fields = parse_fields(request.args, Project.FIELDS)
+        except ValueError as e:
+            return jsonify({
+                'status': 'error',
+                'message': str(e)
+            }), 400
+        
         project = manager.read(project_id)
         
         if not project:
@@ -78,7 +152,7 @@ def get_project(project_id):
         
         return jsonify({
             'status': 'success',
-            'data': project.to_dict()
+            'data': project.to_dict(fields)
         }), 200
     
     except Exception as e:
@@ -89,6 +163,8 @@ def get_project(project_id):
 
 
 @projects_bp.route('/category/<string:category>', methods=['GET'])
+@conditional(catalog_validators)
+@cached(response_cache, version=catalog_version)
 def get_projects_by_category(category):
     """
     Obtiene proyectos por categoría
@@ -96,10 +172,21 @@ def get_projects_by_category(category):
     Args:
         category: Categoría de proyectos
     
+    Query params:
+        - fields: Campos a incluir separados por coma
+    
     Returns:
         JSON con lista de proyectos de esa categoría
     """
     try:
+        try:
+            fields = parse_fields(request.args, Project.FIELDS)
+        except ValueError as e:
+            return jsonify({
+                'status': 'error',
+                'message': str(e)
+            }), 400
+        
         projects = manager.get_by_category(category)
         
         if not projects:
@@ -110,12 +197,11 @@ def get_projects_by_category(category):
                 'data': []
             }), 200
         
-        return jsonify({
+        return list_response({
             'status': 'success',
             'count': len(projects),
             'category': category,
-            'data': [p.to_dict() for p in projects]
-        }), 200
+        }, projects, fields), 200
     
     except Exception as e:
         return jsonify({
@@ -125,21 +211,33 @@ def get_projects_by_category(category):
 
 
 @projects_bp.route('/featured', methods=['GET'])
+@conditional(catalog_validators)
+@cached(response_cache, version=catalog_version)
 def get_featured_projects():
     """
     Obtiene proyectos destacados
     
+    Query params:
+        - fields: Campos a incluir separados por coma
+    
     Returns:
         JSON con lista de proyectos destacados
     """
     try:
+        try:
+            fields = parse_fields(request.args, Project.FIELDS)
+        except ValueError as e:
+            return jsonify({
+                'status': 'error',
+                'message': str(e)
+            }), 400
+        
         projects = manager.get_featured()
         
-        return jsonify({
+        return list_response({
             'status': 'success',
             'count': len(projects),
-            'data': [p.to_dict() for p in projects]
-        }), 200
+        }, projects, fields), 200
     
     except Exception as e:
         return jsonify({
@@ -148,6 +246,57 @@ def get_featured_projects():
         }), 500
 
 
+@projects_bp.route('/search', methods=['GET'])
+@conditional(catalog_validators)
+@cached(response_cache, version=catalog_version)
+def search_projects():
+    """
+    Busca proyectos por texto en título, descripción y tecnologías
+    
+    Query params:
+        - q: Texto de búsqueda (sin distinguir tildes ni mayúsculas)
+        - limit: Número máximo de resultados (por defecto y como máximo
+          PAGINATION['max_limit'])
+        - fields: Campos a incluir separados por coma
+    
+    count es el total de coincidencias aunque data venga recortada.
+    
+    Returns:
+        JSON con proyectos ordenados por relevancia
+    """
+    try:
+        query = request.args.get('q', '').strip()
+        
+        if not query:
+            return jsonify({
+                'status': 'error',
+                'message': 'El parámetro q es obligatorio'
+            }), 400
+        
+        try:
+            _, limit = parse_page_args(request.args)
+            fields = parse_fields(request.args, Project.FIELDS)
+        except ValueError as e:
+            return jsonify({
+                'status': 'error',
+                'message': str(e)
+            }), 400
+        
+        projects, total = manager.search(query, limit or PAGINATION['max_limit'])
+        
+        return list_response({
+            'status': 'success',
+            'query': query,
+            'count': total,
+        }, projects, fields), 200
+    
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': f'Error al buscar proyectos: {str(e)}'
+        }), 500
+
+
 # ==========================================
 # POST - Crear proyecto
 # ==========================================
@@ -203,6 +352,65 @@ def create_project():
         }), 500
 
 
+@projects_bp.route('/batch', methods=['POST'])
+def batch_projects():
+    """
+    Aplica un lote de operaciones sobre proyectos
+    
+    El lote se valida completo antes de aplicarse y es atómico: si una
+    operación es inválida no se aplica ninguna.
+    
+    Body JSON:
+        {
+            "operations": [
+                {"op": "create", "data": {...}},
+                {"op": "update", "id": 3, "data": {"featured": true}},
+                {"op": "delete", "id": 4}
+            ]
+        }
+    
+    Returns:
+        JSON con el resultado de cada operación
+    """
+    try:
+        data = request.get_json()
+        operations = data.get('operations') if isinstance(data, dict) else data
+        
+        if not isinstance(operations, list) or not operations:
+            return jsonify({
+                'status': 'error',
+                'message': 'Se requiere una lista de operaciones'
+            }), 400
+        
+        if len(operations) > BATCH['max_operations']:
+            return jsonify({
+                'status': 'error',
+                'message': f'Máximo {BATCH["max_operations"]} operaciones por lote'
+            }), 413
+        
+        results, errors = manager.apply_batch(operations)
+        
+        if errors:
+            return jsonify({
+                'status': 'error',
+                'message': 'El lote no se aplicó: hay operaciones inválidas',
+                'errors': errors
+            }), 400
+        
+        return jsonify({
+            'status': 'success',
+            'message': 'Lote aplicado exitosamente',
+            'count': len(results),
+            'results': results
+        }), 200
+    
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': f'Error al aplicar el lote: {str(e)}'
+        }), 500
+
+
 # ==========================================
 # PUT - Actualizar proyecto
 # ==========================================
@@ -235,7 +443,14 @@ def update_project(project_id):
             }), 400
         
         # Actualizar proyecto
-        project = manager.update(project_id, **data)
+        try:
+            project = manager.update(project_id, **data)
+        except ValidationError as e:
+            return jsonify({
+                'status': 'error',
+                'message': 'Error al validar los datos del proyecto',
+                'errors': e.errors
+            }), 400
         
         if not project:
             return jsonify({
@@ -297,6 +512,8 @@ def delete_project(project_id):
 # ==========================================
 
 @projects_bp.route('/stats', methods=['GET'])
+@conditional(catalog_validators)
+@cached(response_cache, version=catalog_version)
 def get_stats():
     """
     Obtiene estadísticas de los proyectos
@@ -305,21 +522,9 @@ def get_stats():
         JSON con estadísticas
     """
     try:
-        all_projects = manager.get_all()
-        featured = manager.get_featured()
-        
-        categories = {}
-        for project in all_projects:
-            cat = project.category
-            categories[cat] = categories.get(cat, 0) + 1
-        
         return jsonify({
             'status': 'success',
-            'stats': {
-                'total_projects': len(all_projects),
-                'featured_projects': len(featured),
-                'categories': categories
-            }
+            'stats': manager.get_stats()
         }), 200
     
     except Exception as e:
@@ -329,6 +534,47 @@ def get_stats():
         }), 500
 
 
+@projects_bp.route('/export', methods=['GET'])
+def export_projects():
+    """
+    Exporta el catálogo en streaming (NDJSON, un proyecto por línea)
+    
+    Query params:
+        - category: Filtrar por categoría
+        - featured: 'true' para solo destacados
+        - tech: Tecnología requerida (repetible)
+        - fields: Campos a incluir separados por coma
+    
+    Returns:
+        Respuesta application/x-ndjson (gzip si el cliente lo acepta)
+    """
+    try:
+        category = request.args.get('category', None)
+        featured = request.args.get('featured', None)
+        
+        try:
+            fields = parse_fields(request.args, Project.FIELDS)
+        except ValueError as e:
+            return jsonify({
+                'status': 'error',
+                'message': str(e)
+            }), 400
+        
+        pages = iter_pages(
+            manager.paginate,
+            category=category,
+            featured=bool(featured and featured.lower() == 'true'),
+            technologies=request.args.getlist('tech'),
+        )
+        return ndjson_response(pages, fields, filename='projects.ndjson')
+    
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': f'Error al exportar proyectos: {str(e)}'
+        }), 500
+
+
 @projects_bp.route('/health', methods=['GET'])
 def health():
     """
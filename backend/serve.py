@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+"""
+Servidor de producción
+Ejecuta la API en N procesos preforkeados que comparten el socket de
+escucha y el estado (SQLite)
+
+Si gunicorn está instalado se usa como servidor (workers gthread con la
+app precargada). Si no, los workers son procesos creados con fork que
+atienden con el servidor de Werkzeug; sirve para Linux/macOS sin
+dependencias extra, pero gunicorn es la opción recomendada.
+
+En ambos casos la app se importa una sola vez en el proceso principal y
+los workers arrancan ya cargados. El almacenamiento se fuerza a SQLite:
+proyectos, mensajes y versiones del catálogo viven en el mismo archivo,
+así que cualquier worker responde lo mismo y las cachés por proceso se
+invalidan con la versión compartida. /metrics suma los contadores de
+todos los workers (ver Metrics.share). El rate limit solo se comparte
+entre workers con RATE_LIMIT_STORAGE=redis; con 'memory' cada worker
+aplica el límite por su cuenta.
+
+Uso:
+    python serve.py [--workers N] [--threads N] [--host HOST] [--port PORT]
+                    [--server auto|gunicorn|werkzeug]
+"""
+
+import argparse
+import atexit
+import glob
+import importlib.util
+import os
+import shutil
+import signal
+import socket
+import sys
+import tempfile
+import threading
+import time
+
+# El estado en memoria es por proceso; SQLite es visible para todos los
+# workers. Debe fijarse antes de importar la configuración.
+os.environ['STORAGE_BACKEND'] = 'sqlite'
+
+from config.settings import BACKLOG, HOST, METRICS, PORT, RATE_LIMIT, THREADS, WORKERS  # noqa: E402
+
+
+def parse_args():
+    """Lee los argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(description='Servidor de producción de la API')
+    parser.add_argument('--host', default=HOST)
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--workers', type=int, default=WORKERS)
+    parser.add_argument('--threads', type=int, default=THREADS)
+    parser.add_argument('--backlog', type=int, default=BACKLOG)
+    parser.add_argument('--server', choices=('auto', 'gunicorn', 'werkzeug'), default='auto')
+    return parser.parse_args()
+
+
+def prepare_database():
+    """Crea el esquema antes del fork y no hereda conexiones abiertas"""
+    from models.storage import get_database
+    
+    db = get_database()
+    db.connection()
+    db.close()
+
+
+def share_metrics(app, workers):
+    """
+    Hace que /metrics sume los contadores de todos los workers
+    
+    Usa METRICS['multiprocess_dir'] o un directorio temporal que se
+    elimina al terminar el proceso principal.
+    """
+    metrics = app.extensions.get('metrics')
+    if metrics is None or workers <= 1:
+        return
+    
+    directory = METRICS.get('multiprocess_dir')
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+        for path in glob.glob(os.path.join(directory, 'metrics-*.json')):
+            os.remove(path)
+    else:
+        directory = tempfile.mkdtemp(prefix='portafolio-metrics-')
+        master = os.getpid()
+        atexit.register(lambda: os.getpid() == master and shutil.rmtree(directory, ignore_errors=True))
+    metrics.share(directory)
+
+
+def flush_metrics(app):
+    """Vuelca las métricas del worker al terminar (ver Metrics.flush)"""
+    metrics = app.extensions.get('metrics')
+    if metrics is not None:
+        metrics.flush()
+
+
+def warn_per_worker_limits(workers):
+    """Avisa si el rate limit queda multiplicado por el número de workers"""
+    if workers > 1 and RATE_LIMIT['enabled'] and RATE_LIMIT.get('storage') != 'redis':
+        print(f"⚠️  Rate limit por worker: cada cliente puede hacer hasta {workers} veces "
+              f"el límite configurado (usa RATE_LIMIT_STORAGE=redis para compartirlo)",
+              file=sys.stderr, flush=True)
+
+
+def serve_gunicorn(host, port, workers, threads, backlog):
+    """Ejecuta la app con gunicorn (workers gthread, app precargada)"""
+    from gunicorn.app.base import BaseApplication
+    
+    def worker_exit(server, worker):
+        # La app ya está importada: preload_app la carga antes del fork
+        from app import app
+        flush_metrics(app)
+    
+    class Application(BaseApplication):
+        def load_config(self):
+            bind = f'[{host}]:{port}' if ':' in host else f'{host}:{port}'
+            for key, value in {
+                'bind': bind,
+                'workers': workers,
+                'worker_class': 'gthread',
+                'threads': threads,
+                'backlog': backlog,
+                'preload_app': True,
+                'worker_exit': worker_exit,
+            }.items():
+                self.cfg.set(key, value)
+        
+        def load(self):
+            from app import app
+            prepare_database()
+            share_metrics(app, workers)
+            return app
+    
+    warn_per_worker_limits(workers)
+    Application().run()
+
+
+def listen(host, port, backlog):
+    """
+    Crea el socket de escucha compartido por los workers
+    
+    Returns:
+        socket.socket: Socket heredable en estado listen
+    """
+    family = socket.AF_INET6 if ':' in host else socket.AF_INET
+    sock = socket.create_server((host, port), family=family, backlog=backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def run_worker(app, sock, host, port):
+    """
+    Atiende peticiones sobre el socket compartido hasta recibir SIGTERM
+    
+    Args:
+        app: Aplicación WSGI
+        sock: Socket de escucha heredado
+        host: Host (solo determina la familia de direcciones)
+        port: Puerto
+    """
+    from werkzeug.serving import make_server
+    
+    server = make_server(host, port, app, threaded=True, fd=sock.fileno())
+    
+    def stop(signum, frame):
+        # shutdown() espera a serve_forever, por eso se llama desde otro hilo
+        threading.Thread(target=server.shutdown, daemon=True).start()
+    
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        flush_metrics(app)
+
+
+def spawn(app, sock, host, port):
+    """
+    Crea un worker con fork
+    
+    Returns:
+        int: PID del worker
+    """
+    pid = os.fork()
+    if pid == 0:
+        code = 0
+        try:
+            run_worker(app, sock, host, port)
+        except Exception as e:
+            print(f"Worker {os.getpid()} terminó con error: {e}", file=sys.stderr)
+            code = 1
+        finally:
+            os._exit(code)
+    return pid
+
+
+def serve(host, port, workers, backlog):
+    """
+    Arranca el proceso principal y supervisa a los workers
+    
+    Los workers que terminan inesperadamente se reemplazan. SIGTERM o
+    SIGINT detienen a todos los workers y luego al proceso principal.
+    """
+    from app import app
+    
+    sock = listen(host, port, backlog)
+    
+    if workers <= 1 or not hasattr(os, 'fork'):
+        print(f"🚀 Backend en http://{host}:{port} (1 proceso)", flush=True)
+        run_worker(app, sock, host, port)
+        return
+    
+    prepare_database()
+    share_metrics(app, workers)
+    warn_per_worker_limits(workers)
+    children = {spawn(app, sock, host, port) for _ in range(workers)}
+    print(f"🚀 Backend en http://{host}:{port} ({workers} workers, pid {os.getpid()})", flush=True)
+    
+    stopping = False
+    
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+    
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        children.discard(pid)
+        if not stopping:
+            print(f"Worker {pid} terminó (estado {status}), reiniciando", file=sys.stderr)
+            time.sleep(0.1)
+            children.add(spawn(app, sock, host, port))
+    
+    sock.close()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    has_gunicorn = importlib.util.find_spec('gunicorn') is not None
+    if args.server == 'gunicorn' and not has_gunicorn:
+        sys.exit('gunicorn no está instalado (pip install gunicorn)')
+    if args.server == 'gunicorn' or (args.server == 'auto' and has_gunicorn):
+        serve_gunicorn(args.host, args.port, args.workers, args.threads, args.backlog)
+    else:
+        serve(args.host, args.port, args.workers, args.backlog)
@@ -0,0 +1,292 @@
+"""
+Service: Notifications
+Envío asíncrono de notificaciones por email de los mensajes de contacto
+"""
+
+import logging
+import queue
+import smtplib
+import threading
+import time
+from email.message import EmailMessage
+
+from config.settings import APP_NAME, EMAIL
+
+logger = logging.getLogger(__name__)
+
+# Marca de parada para los workers
+_STOP = object()
+
+
+def _header(value):
+    """Valor de cabecera en una sola línea (sin CR/LF que permitan inyectar cabeceras)"""
+    return ' '.join(str(value).split())
+
+
+def build_email(msg, sender, recipient):
+    """
+    Construye el email de notificación de un mensaje de contacto
+    
+    Los campos del mensaje que van en cabeceras se reducen a una línea.
+    
+    Args:
+        msg: Message recibido
+        sender: Remitente del email
+        recipient: Destinatario de la notificación
+        
+    Returns:
+        EmailMessage: Email listo para enviar
+    """
+    email = EmailMessage()
+    email['Subject'] = _header(f'[{APP_NAME}] Nuevo mensaje: {msg.subject}')
+    email['From'] = sender
+    email['To'] = recipient
+    email['Reply-To'] = _header(msg.email)
+    email.set_content(
+        f"Nombre: {msg.name}\n"
+        f"Email: {msg.email}\n"
+        f"Teléfono: {msg.phone or '-'}\n"
+        f"Fecha: {msg.created_at}\n"
+        f"\n{msg.message}\n"
+    )
+    return email
+
+
+class EmailNotifier:
+    """
+    Pipeline de notificaciones en segundo plano
+    
+    Los mensajes se encolan en una cola acotada y un pool de workers
+    construye los emails y los envía. Cada worker reutiliza su conexión
+    SMTP entre mensajes, agrupa los que estén en cola en lotes y reintenta
+    con backoff exponencial. Los workers se inician con el primer mensaje
+    encolado.
+    
+    Ningún error de una notificación llega a quien llama a enqueue ni
+    detiene un worker: se registra en el log y cuenta como fallida.
+    """
+    
+    def __init__(self, host, port, user=None, password=None, sender=None, recipient=None,
+                 use_tls=True, workers=2, queue_size=1000, batch_size=20, max_retries=3,
+                 retry_backoff=1.0, timeout=10, idle_timeout=30, smtp_factory=smtplib.SMTP):
+        """
+        Args:
+            host: Servidor SMTP
+            port: Puerto SMTP
+            user: Usuario SMTP (None para no autenticar)
+            password: Contraseña SMTP
+            sender: Remitente de las notificaciones
+            recipient: Destinatario de las notificaciones
+            use_tls: Usar STARTTLS
+            workers: Número de hilos de envío
+            queue_size: Capacidad máxima de la cola
+            batch_size: Mensajes enviados por lote y conexión
+            max_retries: Reintentos por mensaje
+            retry_backoff: Espera base entre reintentos (se duplica en cada uno)
+            timeout: Timeout de socket SMTP en segundos
+            idle_timeout: Segundos de inactividad antes de cerrar la conexión
+            smtp_factory: Clase/función que crea la conexión SMTP
+        """
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.sender = sender
+        self.recipient = recipient or user
+        self.use_tls = use_tls
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.smtp_factory = smtp_factory
+        self.stats = {'queued': 0, 'sent': 0, 'failed': 0, 'dropped': 0}
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._threads = []
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+    
+    @classmethod
+    def from_settings(cls, settings=EMAIL):
+        """Crea el notificador a partir de EMAIL"""
+        return cls(
+            host=settings['host'],
+            port=settings['port'],
+            user=settings.get('user'),
+            password=settings.get('password'),
+            sender=settings['from'],
+            recipient=settings.get('to'),
+            use_tls=settings.get('use_tls', True),
+            workers=settings.get('workers', 2),
+            queue_size=settings.get('queue_size', 1000),
+            batch_size=settings.get('batch_size', 20),
+            max_retries=settings.get('max_retries', 3),
+            retry_backoff=settings.get('retry_backoff', 1.0),
+            timeout=settings.get('timeout', 10),
+        )
+    
+    # ==========================================
+    # API pública
+    # ==========================================
+    
+    def enqueue(self, msg):
+        """
+        Encola la notificación de un mensaje sin bloquear
+        
+        El email se construye en el worker, fuera de la petición.
+        
+        Args:
+            msg: Message recibido
+            
+        Returns:
+            bool: True si se encoló, False si la cola está llena o falló
+        """
+        try:
+            self.start()
+            self._queue.put_nowait(msg)
+        except queue.Full:
+            self._count('dropped')
+            logger.warning('Cola de notificaciones llena, se descarta el mensaje %s', msg.id)
+            return False
+        except Exception as e:
+            self._count('failed')
+            logger.error('No se pudo encolar la notificación del mensaje %s: %s', msg.id, e)
+            return False
+        self._count('queued')
+        return True
+    
+    def start(self):
+        """Inicia los workers si aún no están corriendo"""
+        if self._threads:
+            return
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._run, name=f'email-notifier-{i}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+    
+    def stop(self, timeout=None):
+        """
+        Detiene los workers tras vaciar la cola
+        
+        Args:
+            timeout: Segundos máximos de espera por worker
+        """
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(_STOP)
+        for thread in threads:
+            thread.join(timeout)
+    
+    def join(self):
+        """Espera a que se procesen todos los mensajes encolados"""
+        self._queue.join()
+    
+    # ==========================================
+    # Workers
+    # ==========================================
+    
+    def _count(self, key):
+        """Incrementa un contador de stats"""
+        with self._stats_lock:
+            self.stats[key] += 1
+    
+    def _connect(self):
+        """Abre una conexión SMTP autenticada"""
+        smtp = self.smtp_factory(self.host, self.port, timeout=self.timeout)
+        if self.use_tls:
+            smtp.starttls()
+        if self.user and self.password:
+            smtp.login(self.user, self.password)
+        return smtp
+    
+    @staticmethod
+    def _close(smtp):
+        """Cierra una conexión SMTP ignorando errores"""
+        if smtp is None:
+            return
+        try:
+            smtp.quit()
+        except Exception:
+            pass
+    
+    def _next_batch(self):
+        """
+        Espera el siguiente mensaje y agrupa los que ya estén en cola
+        
+        Returns:
+            list: Lote de mensajes (puede incluir _STOP al final) o None si
+                se superó idle_timeout sin mensajes
+        """
+        try:
+            batch = [self._queue.get(timeout=self.idle_timeout)]
+        except queue.Empty:
+            return None
+        while len(batch) < self.batch_size and batch[-1] is not _STOP:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+    
+    def _run(self):
+        """Bucle de un worker"""
+        smtp = None
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                # Sin actividad: liberar la conexión
+                self._close(smtp)
+                smtp = None
+                continue
+            
+            stop = batch[-1] is _STOP
+            messages = batch[:-1] if stop else batch
+            try:
+                smtp = self._send_batch(smtp, messages)
+            except Exception as e:
+                logger.exception('Error inesperado en el worker de notificaciones: %s', e)
+                self._close(smtp)
+                smtp = None
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            
+            if stop:
+                self._close(smtp)
+                return
+    
+    def _send_batch(self, smtp, messages):
+        """
+        Envía un lote reutilizando la conexión y reintentando con backoff
+        
+        Returns:
+            smtplib.SMTP: Conexión a reutilizar en el siguiente lote (o None)
+        """
+        for msg in messages:
+            try:
+                email = build_email(msg, self.sender, self.recipient)
+            except Exception as e:
+                self._count('failed')
+                logger.error('No se pudo construir la notificación del mensaje %s: %s', msg.id, e)
+                continue
+            for attempt in range(self.max_retries + 1):
+                try:
+                    if smtp is None:
+                        smtp = self._connect()
+                    smtp.send_message(email)
+                    self._count('sent')
+                    break
+                except Exception as e:
+                    self._close(smtp)
+                    smtp = None
+                    if attempt == self.max_retries:
+                        self._count('failed')
+                        logger.error('No se pudo enviar la notificación "%s": %s', email['Subject'], e)
+                    else:
+                        time.sleep(self.retry_backoff * (2 ** attempt))
+        return smtp
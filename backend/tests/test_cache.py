@@ -0,0 +1,229 @@
+"""
+Pruebas de utils.cache: MemoryCache y RedisCache contra un servidor RESP falso
+"""
+
+import fnmatch
+import socket
+import socketserver
+import threading
+import unittest
+
+from utils.cache import MemoryCache, RedisCache
+
+
+class FakeRedis(socketserver.ThreadingTCPServer):
+    """
+    Servidor mínimo que habla RESP y entiende GET, SET, DEL, SCAN y SELECT
+    
+    Registra cada comando recibido y cuántas conexiones se abrieron.
+    """
+    
+    allow_reuse_address = True
+    daemon_threads = True
+    
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), _FakeRedisHandler)
+        self.data = {}
+        self.ttls = {}
+        self.commands = []
+        self.connections = 0
+        self.lock = threading.Lock()
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+    
+    @property
+    def port(self):
+        return self.server_address[1]
+    
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class _FakeRedisHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+        while True:
+            args = self._read_command()
+            if args is None:
+                return
+            with server.lock:
+                server.commands.append(args)
+                reply = self._dispatch(server, args)
+            self.wfile.write(reply)
+    
+    def _read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        args = []
+        for _ in range(int(line[1:-2])):
+            length = int(self.rfile.readline()[1:-2])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+    
+    @staticmethod
+    def _bulk(value):
+        return b'$-1\r\n' if value is None else b'$%d\r\n%s\r\n' % (len(value), value)
+    
+    def _dispatch(self, server, args):
+        cmd = args[0].upper()
+        if cmd == b'GET':
+            return self._bulk(server.data.get(args[1]))
+        if cmd == b'SET':
+            server.data[args[1]] = args[2]
+            if len(args) == 5 and args[3].upper() == b'EX':
+                server.ttls[args[1]] = int(args[4])
+            return b'+OK\r\n'
+        if cmd == b'DEL':
+            removed = sum(server.data.pop(key, None) is not None for key in args[1:])
+            return b':%d\r\n' % removed
+        if cmd == b'SCAN':
+            pattern = args[args.index(b'MATCH') + 1].decode() if b'MATCH' in args else '*'
+            keys = [key for key in server.data if fnmatch.fnmatchcase(key.decode(), pattern)]
+            return b'*2\r\n$1\r\n0\r\n*%d\r\n%s' % (len(keys), b''.join(self._bulk(k) for k in keys))
+        if cmd == b'SELECT':
+            return b'+OK\r\n'
+        return b'-ERR unknown command\r\n'
+
+
+class MemoryCacheTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.now = 0.0
+        self.cache = MemoryCache(max_entries=100, max_bytes=1000, ttl=60, clock=lambda: self.now)
+    
+    def test_set_get_delete(self):
+        self.cache.set('a', b'1')
+        self.assertEqual(self.cache.get('a'), b'1')
+        self.cache.delete('a')
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(self.cache.nbytes, 0)
+    
+    def test_expires_after_ttl(self):
+        self.cache.set('a', b'1', ttl=5)
+        self.now = 4.9
+        self.assertEqual(self.cache.get('a'), b'1')
+        self.now = 5.0
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(len(self.cache), 0)
+    
+    def test_bounded_by_bytes(self):
+        for i in range(10):
+            self.cache.set(f'k{i}', b'x' * 198)
+        self.assertLessEqual(self.cache.nbytes, 1000)
+        self.assertEqual(len(self.cache), 5)
+        self.assertIsNone(self.cache.get('k4'))
+        self.assertEqual(self.cache.get('k9'), b'x' * 198)
+    
+    def test_evicts_least_recently_used(self):
+        for i in range(5):
+            self.cache.set(f'k{i}', b'x' * 198)
+        self.cache.get('k0')
+        self.cache.set('k5', b'x' * 198)
+        self.assertIsNotNone(self.cache.get('k0'))
+        self.assertIsNone(self.cache.get('k1'))
+    
+    def test_skips_values_larger_than_limit(self):
+        self.cache.set('a', b'1')
+        self.cache.set('big', b'x' * 2000)
+        self.assertIsNone(self.cache.get('big'))
+        self.assertEqual(self.cache.get('a'), b'1')
+    
+    def test_bounded_by_entries(self):
+        cache = MemoryCache(max_entries=3, max_bytes=1000)
+        for i in range(5):
+            cache.set(f'k{i}', b'1')
+        self.assertEqual(len(cache), 3)
+        self.assertIsNone(cache.get('k1'))
+    
+    def test_new_version_replaces_entry(self):
+        self.cache.set('a', b'old' * 50, version=1)
+        self.cache.set('a', b'new', version=2)
+        self.assertEqual(len(self.cache), 1)
+        self.assertLess(self.cache.nbytes, 20)
+        self.assertEqual(self.cache.get('a', version=2), b'new')
+    
+    def test_other_version_is_a_miss(self):
+        self.cache.set('a', b'body', version=1)
+        self.assertEqual(self.cache.get('a', version=1), b'body')
+        self.assertIsNone(self.cache.get('a', version=2))
+        self.assertEqual(self.cache.stats()['hits'], 1)
+        self.assertEqual(self.cache.stats()['misses'], 1)
+
+
+class RedisCacheTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.server = FakeRedis()
+        self.addCleanup(self.server.stop)
+        self.cache = RedisCache(host='127.0.0.1', port=self.server.port, prefix='t:', ttl=60)
+    
+    def test_set_get_delete(self):
+        self.cache.set('a', b'1', ttl=10)
+        self.assertEqual(self.server.data[b't:a'], b'1')
+        self.assertEqual(self.server.ttls[b't:a'], 10)
+        self.assertEqual(self.cache.get('a'), b'1')
+        self.cache.delete('a')
+        self.assertIsNone(self.cache.get('a'))
+    
+    def test_binary_values_round_trip(self):
+        value = bytes(range(256)) + b'\r\n$-1\r\n'
+        self.cache.set('bin', value)
+        self.assertEqual(self.cache.get('bin'), value)
+    
+    def test_get_many_uses_one_pipeline_and_pooled_connection(self):
+        self.cache.set('a', b'1')
+        self.cache.set('b', b'2')
+        self.assertEqual(self.cache.get_many(['a', 'missing', 'b']), [b'1', None, b'2'])
+        self.assertEqual(self.cache.get_many([]), [])
+        self.assertEqual(self.server.connections, 1)
+        self.assertEqual([c[0] for c in self.server.commands], [b'SET', b'SET', b'GET', b'GET', b'GET'])
+        self.assertEqual(self.cache.stats()['hits'], 2)
+        self.assertEqual(self.cache.stats()['misses'], 1)
+    
+    def test_versions(self):
+        self.cache.set('a', b'body', version=3)
+        self.assertEqual(self.cache.get('a', version=3), b'body')
+        self.assertIsNone(self.cache.get('a', version=4))
+        self.assertEqual(list(self.server.data), [b't:a'])
+    
+    def test_clear_only_removes_own_prefix(self):
+        self.server.data[b'other:x'] = b'1'
+        self.cache.set('a', b'1')
+        self.cache.set('b', b'2')
+        self.cache.clear()
+        self.assertEqual(list(self.server.data), [b'other:x'])
+    
+    def test_unavailable_server_is_a_miss(self):
+        with socket.socket() as s:
+            s.bind(('127.0.0.1', 0))
+            port = s.getsockname()[1]
+        cache = RedisCache(host='127.0.0.1', port=port, timeout=0.2, retry_interval=30)
+        cache.set('a', b'1')
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get_many(['a', 'b']), [None, None])
+        cache.delete('a')
+        cache.clear()
+    
+    def test_backs_off_after_failure(self):
+        self.cache.client.retry_interval = 30
+        self.server.stop()
+        self.assertIsNone(self.cache.get('a'))
+        self.server = FakeRedis()
+        self.cache.client.port = self.server.port
+        self.addCleanup(self.server.stop)
+        self.cache.set('a', b'1')
+        self.assertEqual(self.server.commands, [])
+    
+    def test_selects_database(self):
+        self.cache.client.db = 1
+        self.server.data[b't:a'] = b'1'
+        self.assertEqual(self.cache.get('a'), b'1')
+        self.assertIn([b'SELECT', b'1'], self.server.commands)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Pruebas de utils.compression junto con cached y conditional: cada
+codificación lleva su propio ETag y los 304 funcionan con cualquiera
+"""
+
+import gzip
+import json
+import unittest
+
+from flask import Flask, jsonify
+
+from utils import compression
+from utils.cache import MemoryCache, cached
+from utils.conditional import conditional
+
+GZIP = {'Accept-Encoding': 'gzip'}
+
+
+class CompressionTest(unittest.TestCase):
+    """Vistas con y sin caché detrás de conditional y compresión gzip"""
+    
+    def setUp(self):
+        self.state = {'version': 1}
+        self.calls = 0
+        self.cache = MemoryCache(ttl=60)
+        app = Flask(__name__)
+        compression.init_app(app)
+        
+        def validators():
+            return str(self.state['version']), None
+        
+        def payload():
+            self.calls += 1
+            return jsonify({'version': self.state['version'], 'items': ['proyecto'] * 500})
+        
+        cached_payload = cached(self.cache, version=lambda: self.state['version'])(payload)
+        app.add_url_rule('/cached', 'cached', conditional(validators)(cached_payload))
+        app.add_url_rule('/plain', 'plain', conditional(validators)(payload))
+        app.add_url_rule('/small', 'small', conditional(validators)(lambda: jsonify({'ok': True})))
+        self.client = app.test_client()
+    
+    def assert_gzip(self, response):
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response.headers['Vary'])
+        body = json.loads(gzip.decompress(response.get_data()))
+        self.assertEqual(body['version'], self.state['version'])
+    
+    def test_encoded_etag(self):
+        for path in ('/cached', '/plain'):
+            with self.subTest(path=path):
+                identity = self.client.get(path)
+                encoded = self.client.get(path, headers=GZIP)
+                self.assertNotIn('Content-Encoding', identity.headers)
+                self.assert_gzip(encoded)
+                self.assertEqual(encoded.get_etag(), (identity.get_etag()[0] + '-gzip', False))
+    
+    def test_cache_hit_keeps_bytes_and_etag(self):
+        first = self.client.get('/cached', headers=GZIP)
+        second = self.client.get('/cached', headers=GZIP)
+        self.assertEqual(self.calls, 1)
+        self.assert_gzip(second)
+        self.assertEqual(second.get_data(), first.get_data())
+        self.assertEqual(second.headers['ETag'], first.headers['ETag'])
+    
+    def test_not_modified_with_either_etag(self):
+        identity = self.client.get('/cached').headers['ETag']
+        encoded = self.client.get('/cached', headers=GZIP).headers['ETag']
+        for etag in (identity, encoded):
+            with self.subTest(etag=etag):
+                response = self.client.get('/cached', headers={**GZIP, 'If-None-Match': etag})
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response.headers['ETag'], encoded)
+    
+    def test_new_version_invalidates(self):
+        etag = self.client.get('/cached', headers=GZIP).headers['ETag']
+        self.state['version'] += 1
+        response = self.client.get('/cached', headers={**GZIP, 'If-None-Match': etag})
+        self.assert_gzip(response)
+        self.assertNotEqual(response.headers['ETag'], etag)
+    
+    def test_small_body_not_compressed(self):
+        response = self.client.get('/small', headers=GZIP)
+        self.assertNotIn('Content-Encoding', response.headers)
+        self.assertFalse(response.get_etag()[0].endswith('-gzip'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Pruebas de utils.conditional: validadores con precisión de segundos
+"""
+
+import unittest
+from unittest import mock
+
+from flask import Flask
+from werkzeug.http import http_date
+
+from utils.conditional import conditional, validator_date
+
+
+class ValidatorDateTest(unittest.TestCase):
+    
+    def test_past_second(self):
+        self.assertEqual(validator_date(1000.9, now=1001.0).timestamp(), 1000)
+    
+    def test_current_second_has_no_date(self):
+        self.assertIsNone(validator_date(1000.2, now=1000.7))
+        self.assertIsNone(validator_date(None))
+
+
+class ConditionalTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.now = 1700000000.5
+        clock = mock.patch('utils.conditional.time')
+        clock.start().time.side_effect = lambda: self.now
+        self.addCleanup(clock.stop)
+        
+        self.state = {'version': 1, 'modified': self.now - 10}
+        app = Flask(__name__)
+        
+        def validators():
+            return str(self.state['version']), self.state['modified']
+        
+        @app.route('/resource')
+        @conditional(validators)
+        def resource():
+            return {'version': self.state['version']}
+        
+        self.client = app.test_client()
+    
+    def modify(self):
+        self.state['version'] += 1
+        self.state['modified'] = self.now
+    
+    def test_if_modified_since_unchanged(self):
+        first = self.client.get('/resource')
+        response = self.client.get('/resource', headers={
+            'If-Modified-Since': first.headers['Last-Modified']})
+        self.assertEqual(response.status_code, 304)
+    
+    def test_two_changes_in_the_same_second(self):
+        self.modify()
+        first = self.client.get('/resource')
+        self.assertNotIn('Last-Modified', first.headers)
+        
+        # Un cliente que envíe la fecha de este segundo no recibe un 304 viejo
+        same_second = http_date(self.state['modified'])
+        self.modify()
+        response = self.client.get('/resource', headers={'If-Modified-Since': same_second})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['version'], 3)
+    
+    def test_etag_still_validates_same_second_changes(self):
+        self.modify()
+        first = self.client.get('/resource')
+        response = self.client.get('/resource', headers={'If-None-Match': first.headers['ETag']})
+        self.assertEqual(response.status_code, 304)
+        self.modify()
+        response = self.client.get('/resource', headers={'If-None-Match': first.headers['ETag']})
+        self.assertEqual(response.status_code, 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+"""
+Pruebas de models.journal: compactación en segundo plano y reproducción
+"""
+
+import os
+import random
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from models.journal import Journal, JournaledMessageStore
+
+
+class JournaledMessageStoreTest(unittest.TestCase):
+    
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'messages.journal')
+    
+    def open_store(self, **kwargs):
+        store = JournaledMessageStore(self.path, flush_interval=0.001, **kwargs)
+        self.addCleanup(store.journal.close)
+        return store
+    
+    @staticmethod
+    def contents(store):
+        return {msg.id: msg.to_dict() for msg in store.get_all()}
+    
+    def test_writes_during_compaction_survive_replay(self):
+        store = self.open_store()
+        store.create_many([
+            dict(name='Ana', email='ana@example.com', subject='s', message='m' * 100)
+        ] * 2000)
+        store.journal.needs_compaction = lambda records: True
+        
+        def writer(seed):
+            rng = random.Random(seed)
+            for i in range(150):
+                op = rng.random()
+                if op < 0.5:
+                    store.create('Ana', 'ana@example.com', f'{seed}-{i}', 'mensaje de prueba')
+                elif op < 0.8:
+                    store.delete(rng.randint(1, store.id_counter))
+                else:
+                    store.mark_read(rng.randint(1, store.id_counter))
+        
+        threads = [threading.Thread(target=writer, args=(seed,)) for seed in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        store.journal.close()
+        
+        replayed = JournaledMessageStore(self.path)
+        self.addCleanup(replayed.journal.close)
+        self.assertEqual(self.contents(replayed), self.contents(store))
+        self.assertEqual(replayed.id_counter, store.id_counter)
+        self.assertFalse(os.path.exists(self.path + '.tmp'))
+    
+    def test_compaction_shrinks_journal(self):
+        store = self.open_store(compact_min_records=10)
+        for i in range(40):
+            msg = store.create('Ana', 'ana@example.com', f's{i}', 'mensaje de prueba')
+            store.delete(msg.id)
+        store.create('Ana', 'ana@example.com', 'final', 'mensaje de prueba')
+        
+        deadline = time.monotonic() + 5
+        while store.journal.records >= 40 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertLess(store.journal.records, 40)
+        store.journal.close()
+        
+        replayed = JournaledMessageStore(self.path)
+        self.addCleanup(replayed.journal.close)
+        self.assertEqual(self.contents(replayed), self.contents(store))
+    
+    def test_failed_compaction_keeps_journal(self):
+        store = self.open_store()
+        store.create('Ana', 'ana@example.com', 'a', 'mensaje de prueba')
+        
+        def broken():
+            raise RuntimeError('fallo al compactar')
+        
+        store.journal.snapshot = broken
+        store.journal.needs_compaction = lambda records: True
+        store.create('Ana', 'ana@example.com', 'b', 'mensaje de prueba')
+        store.journal._compactor.join()
+        store.create('Ana', 'ana@example.com', 'c', 'mensaje de prueba')
+        store.journal.close()
+        
+        replayed = JournaledMessageStore(self.path)
+        self.addCleanup(replayed.journal.close)
+        self.assertEqual([m.subject for m in replayed.get_all()], ['a', 'b', 'c'])
+
+
+
+def failing_fsync(fd):
+    raise OSError(28, 'No space left on device')
+
+
+class FailedWriteTest(unittest.TestCase):
+    
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'messages.journal')
+        self.store = JournaledMessageStore(self.path, flush_interval=0.001)
+        self.addCleanup(self.store.journal.close)
+        self.msg = self.store.create('Ana', 'ana@example.com', 'a', 'mensaje de prueba')
+    
+    def test_failed_create_is_rolled_back(self):
+        with mock.patch('models.journal.os.fsync', failing_fsync):
+            with self.assertRaises(OSError):
+                self.store.create('Ana', 'ana@example.com', 'b', 'mensaje de prueba')
+            with self.assertRaises(OSError):
+                self.store.create_many([dict(name='Ana', email='ana@example.com',
+                                             subject='c', message='mensaje de prueba')] * 3)
+        self.assertEqual([m.id for m in self.store.get_all()], [self.msg.id])
+        self.assertEqual(self.store.get_stats()['total'], 1)
+    
+    def test_failed_mark_read_is_rolled_back(self):
+        with mock.patch('models.journal.os.fsync', failing_fsync):
+            with self.assertRaises(OSError):
+                self.store.mark_read(self.msg.id)
+        self.assertFalse(self.store.read(self.msg.id).read)
+        self.assertEqual(self.store.get_stats()['unread'], 1)
+    
+    def test_failed_delete_is_rolled_back(self):
+        with mock.patch('models.journal.os.fsync', failing_fsync):
+            with self.assertRaises(OSError):
+                self.store.delete(self.msg.id)
+        self.assertIsNotNone(self.store.read(self.msg.id))
+        self.assertEqual(self.store.count(), 1)
+    
+    def test_later_writes_succeed(self):
+        with mock.patch('models.journal.os.fsync', failing_fsync):
+            with self.assertRaises(OSError):
+                self.store.create('Ana', 'ana@example.com', 'b', 'mensaje de prueba')
+        self.store.create('Ana', 'ana@example.com', 'c', 'mensaje de prueba')
+        self.assertEqual([m.subject for m in self.store.get_all()], ['a', 'c'])
+
+
+class JournalErrorTest(unittest.TestCase):
+    
+    def test_errors_belong_to_their_batch(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        journal = Journal(os.path.join(directory.name, 'j.journal'), flush_interval=0.001)
+        journal.open()
+        self.addCleanup(journal.close)
+        
+        with mock.patch('models.journal.os.fsync', failing_fsync):
+            failed = journal.submit({'op': 'meta', 'id_counter': 1})
+            with self.assertRaises(OSError):
+                journal.wait(failed)
+        ok = journal.submit({'op': 'meta', 'id_counter': 2})
+        journal.wait(ok)
+        
+        # El error del primer lote no se pierde tras un lote correcto
+        with self.assertRaises(OSError):
+            journal.wait(failed)
+        with self.assertRaises(OSError):
+            journal.wait(ok, first=failed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+"""
+Pruebas de utils.metrics: agregación de contadores entre procesos
+"""
+
+import os
+import re
+import tempfile
+import unittest
+
+from utils.metrics import Metrics
+
+
+def requests_total(text, endpoint):
+    match = re.search(r'http_requests_total\{[^}]*endpoint="%s"[^}]*\} (\d+)' % endpoint, text)
+    return int(match.group(1)) if match else 0
+
+
+@unittest.skipUnless(hasattr(os, 'fork'), 'requiere fork')
+class SharedMetricsTest(unittest.TestCase):
+    
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.metrics = Metrics((0.1, 1.0), (1024,), flush_interval=60)
+        self.metrics.share(directory.name)
+    
+    def run_worker(self, requests):
+        """Registra peticiones en un proceso hijo y vuelca sus totales"""
+        pid = os.fork()
+        if pid == 0:
+            try:
+                for _ in range(requests):
+                    self.metrics.observe('projects', 'projects.get_projects', 'GET', 200, 0.01, 100)
+                self.metrics.flush()
+            finally:
+                os._exit(0)
+        os.waitpid(pid, 0)
+    
+    def test_render_sums_all_workers(self):
+        self.run_worker(3)
+        self.run_worker(4)
+        self.metrics.observe('projects', 'projects.get_projects', 'GET', 200, 0.5, 2000)
+        
+        text = self.metrics.render()
+        self.assertEqual(requests_total(text, 'projects.get_projects'), 8)
+        self.assertIn('http_request_duration_seconds_count{blueprint="projects",'
+                      'endpoint="projects.get_projects",method="GET"} 8', text)
+    
+    def test_child_starts_empty(self):
+        self.metrics.observe('projects', 'projects.get_projects', 'GET', 200, 0.01, 100)
+        self.run_worker(2)
+        self.assertEqual(requests_total(self.metrics.render(), 'projects.get_projects'), 3)
+    
+    def test_without_directory_only_local(self):
+        metrics = Metrics((0.1,), (1024,))
+        metrics.observe('', 'health', 'GET', 200, 0.01, 10)
+        metrics.flush()
+        self.assertEqual(requests_total(metrics.render(), 'health'), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,200 @@
+"""
+Pruebas de services.notifications contra un servidor SMTP falso
+"""
+
+import email
+import email.policy
+import socketserver
+import threading
+import unittest
+
+from models.message import Message
+from services.notifications import EmailNotifier
+
+
+class FakeSMTP(socketserver.ThreadingTCPServer):
+    """
+    Servidor SMTP mínimo (sin TLS ni autenticación) que guarda los mensajes
+    
+    messages contiene (remitente, destinatarios, email parseado).
+    """
+    
+    allow_reuse_address = True
+    daemon_threads = True
+    
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), _FakeSMTPHandler)
+        self.messages = []
+        self.received = threading.Condition()
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+    
+    @property
+    def port(self):
+        return self.server_address[1]
+    
+    def wait_for(self, count, timeout=5):
+        with self.received:
+            return self.received.wait_for(lambda: len(self.messages) >= count, timeout)
+    
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class _FakeSMTPHandler(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        self.wfile.write(line.encode() + b'\r\n')
+    
+    def handle(self):
+        self.reply('220 localhost ESMTP')
+        sender, recipients = None, []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode().strip()
+            verb = command.split(' ', 1)[0].upper()
+            if verb in ('EHLO', 'HELO'):
+                self.reply('250 localhost')
+            elif verb == 'MAIL':
+                sender, recipients = command.split(':', 1)[1].strip(), []
+                self.reply('250 OK')
+            elif verb == 'RCPT':
+                recipients.append(command.split(':', 1)[1].strip())
+                self.reply('250 OK')
+            elif verb == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                data = b''.join(iter(self.rfile.readline, b'.\r\n'))
+                parsed = email.message_from_bytes(data, policy=email.policy.default)
+                with self.server.received:
+                    self.server.messages.append((sender, recipients, parsed))
+                    self.server.received.notify_all()
+                self.reply('250 OK')
+            elif verb in ('RSET', 'NOOP'):
+                self.reply('250 OK')
+            elif verb == 'QUIT':
+                self.reply('221 Bye')
+                return
+            else:
+                self.reply('502 Command not implemented')
+
+
+def make_message(id=1, **fields):
+    data = dict(name='Ana', email='ana@example.com', subject='Hola',
+                message='Quiero hablar de un proyecto', phone=None)
+    data.update(fields)
+    return Message(id=id, **data)
+
+
+class EmailNotifierTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.server = FakeSMTP()
+        self.addCleanup(self.server.stop)
+        self.notifier = EmailNotifier(
+            host='127.0.0.1', port=self.server.port, sender='noreply@example.com',
+            recipient='owner@example.com', use_tls=False, workers=1,
+            max_retries=1, retry_backoff=0, timeout=2,
+        )
+        self.addCleanup(self.notifier.stop, 5)
+    
+    def test_sends_notification(self):
+        self.assertTrue(self.notifier.enqueue(make_message()))
+        self.assertTrue(self.server.wait_for(1))
+        sender, recipients, sent = self.server.messages[0]
+        self.assertIn('noreply@example.com', sender)
+        self.assertEqual(len(recipients), 1)
+        self.assertIn('owner@example.com', recipients[0])
+        self.assertTrue(sent['Subject'].endswith('Nuevo mensaje: Hola'))
+        self.assertEqual(sent['Reply-To'], 'ana@example.com')
+        self.assertIn('Quiero hablar de un proyecto', sent.get_content())
+    
+    def test_reuses_connection_for_several_messages(self):
+        for i in range(5):
+            self.notifier.enqueue(make_message(id=i + 1))
+        self.notifier.join()
+        self.assertEqual(len(self.server.messages), 5)
+        self.assertEqual(self.notifier.stats['sent'], 5)
+    
+    def test_newlines_in_headers_do_not_raise_or_inject(self):
+        msg = make_message(subject='Hola\r\nBcc: victim@example.com',
+                           email='ana@example.com\nBcc: victim@example.com')
+        self.assertTrue(self.notifier.enqueue(msg))
+        self.notifier.join()
+        for _, recipients, sent in self.server.messages:
+            self.assertIsNone(sent['Bcc'])
+            self.assertFalse(any('victim' in r for r in recipients))
+        self.assertEqual(self.notifier.stats['sent'] + self.notifier.stats['failed'], 1)
+    
+    def test_worker_survives_unexpected_errors(self):
+        factory = self.notifier.smtp_factory
+        
+        def broken(*args, **kwargs):
+            raise RuntimeError('fallo inesperado')
+        
+        self.notifier.smtp_factory = broken
+        self.notifier.enqueue(make_message(id=1))
+        self.notifier.join()
+        self.assertEqual(self.notifier.stats['failed'], 1)
+        
+        self.notifier.smtp_factory = factory
+        self.notifier.enqueue(make_message(id=2))
+        self.assertTrue(self.server.wait_for(1))
+        self.notifier.join()
+        self.assertEqual(self.notifier.stats['sent'], 1)
+    
+    def test_full_queue_drops_without_raising(self):
+        notifier = EmailNotifier(host='127.0.0.1', port=self.server.port, workers=0, queue_size=1)
+        self.assertTrue(notifier.enqueue(make_message(id=1)))
+        self.assertFalse(notifier.enqueue(make_message(id=2)))
+        self.assertEqual(notifier.stats['dropped'], 1)
+
+
+class ContactSendTest(unittest.TestCase):
+    """POST /contact/send no falla aunque la notificación no pueda construirse"""
+    
+    def setUp(self):
+        # Solo el blueprint: importar app reemplaza sys.stdout
+        from flask import Flask
+        from config.settings import FEATURES
+        from routes import contact
+        from utils.serialization import FastJSONProvider
+        
+        app = Flask(__name__)
+        app.json = FastJSONProvider(app)
+        app.register_blueprint(contact.contact_bp)
+        
+        self.server = FakeSMTP()
+        self.addCleanup(self.server.stop)
+        notifier = EmailNotifier(
+            host='127.0.0.1', port=self.server.port, sender='noreply@example.com',
+            recipient='owner@example.com', use_tls=False, workers=1, retry_backoff=0,
+        )
+        self.addCleanup(notifier.stop, 5)
+        
+        original = contact.notifier, FEATURES['email_notifications']
+        contact.notifier = notifier
+        FEATURES['email_notifications'] = True
+        
+        def restore():
+            contact.notifier, FEATURES['email_notifications'] = original
+        
+        self.addCleanup(restore)
+        self.notifier = notifier
+        self.client = app.test_client()
+    
+    def test_newline_in_subject(self):
+        response = self.client.post('/api/v1/contact/send', json={
+            'name': 'Ana', 'email': 'ana@example.com',
+            'subject': 'Hola\nBcc: victim@example.com',
+            'message': 'Quiero hablar de un proyecto',
+        })
+        self.assertEqual(response.status_code, 201)
+        self.notifier.join()
+        self.assertEqual(len(self.server.messages), 1)
+        self.assertIsNone(self.server.messages[0][2]['Bcc'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+Pruebas de utils.pagination
+"""
+
+import unittest
+
+from werkzeug.datastructures import MultiDict
+
+from config.settings import PAGINATION
+from models.project import ProjectManager
+from utils.pagination import decode_cursor, encode_cursor, iter_pages, parse_page_args
+
+
+class CursorTest(unittest.TestCase):
+    """Cursores opacos que se decodifican al mismo ID"""
+    
+    def test_round_trip(self):
+        for last_id in (0, 1, 42, 10 ** 12):
+            self.assertEqual(decode_cursor(encode_cursor(last_id)), last_id)
+        self.assertIsNone(encode_cursor(None))
+    
+    def test_invalid_cursor(self):
+        for cursor in ('', '!!!', encode_cursor('abc'), 'w6k'):
+            with self.assertRaises(ValueError):
+                decode_cursor(cursor)
+
+
+class ParsePageArgsTest(unittest.TestCase):
+    """Validación de limit y cursor de la query"""
+    
+    def test_defaults(self):
+        self.assertEqual(parse_page_args(MultiDict()), (None, None))
+        cursor = encode_cursor(7)
+        self.assertEqual(parse_page_args(MultiDict({'cursor': cursor})),
+                         (7, PAGINATION['default_limit']))
+    
+    def test_limit_is_clamped(self):
+        _, limit = parse_page_args(MultiDict({'limit': str(PAGINATION['max_limit'] * 10)}))
+        self.assertEqual(limit, PAGINATION['max_limit'])
+    
+    def test_invalid_limit(self):
+        for limit in ('abc', '0', '-1'):
+            with self.assertRaises(ValueError):
+                parse_page_args(MultiDict({'limit': limit}))
+
+
+class IterPagesTest(unittest.TestCase):
+    """Recorrer por cursor devuelve cada elemento una sola vez y en orden"""
+    
+    def setUp(self):
+        self.manager = ProjectManager()
+        for i in range(23):
+            self.manager.create(title=f'Proyecto {i}', description='Descripción del proyecto',
+                                category='IA' if i % 2 else 'Mobile', technologies=['Python'],
+                                link='https://example.com')
+    
+    def test_walks_every_item(self):
+        pages = list(iter_pages(self.manager.paginate, page_size=5))
+        self.assertEqual([len(page) for page in pages], [5, 5, 5, 5, 3])
+        self.assertEqual([p.id for page in pages for p in page], list(range(1, 24)))
+    
+    def test_filters_and_concurrent_delete(self):
+        seen = []
+        for page in iter_pages(self.manager.paginate, page_size=4, category='IA'):
+            seen.extend(p.id for p in page)
+            # Eliminar un elemento ya visto no desplaza las páginas siguientes
+            self.manager.delete(page[0].id)
+        self.assertEqual(seen, list(range(2, 24, 2)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+Pruebas de models.persistent y del estado publicado del catálogo
+"""
+
+import random
+import unittest
+from unittest import mock
+
+from models import persistent
+from models.persistent import ChunkedMap, SortedIds
+from models.project import ProjectManager
+
+
+class SortedIdsTest(unittest.TestCase):
+    """Bloques pequeños (LOAD=4) para forzar divisiones y fusiones"""
+    
+    def setUp(self):
+        patcher = mock.patch.object(persistent, 'LOAD', 4)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_matches_sorted_set(self):
+        rng = random.Random(7)
+        ids, expected = SortedIds(), set()
+        for _ in range(2000):
+            value = rng.randrange(200)
+            if rng.random() < 0.6:
+                self.assertEqual(ids.add(value), value not in expected)
+                expected.add(value)
+            else:
+                self.assertEqual(ids.discard(value), value in expected)
+                expected.discard(value)
+        self.assertEqual(list(ids), sorted(expected))
+        self.assertEqual(len(ids), len(expected))
+        for after in (None, -1, 0, 57, 199, 500):
+            self.assertEqual(list(ids.iter_after(after)),
+                             sorted(v for v in expected if after is None or v > after))
+    
+    def test_copy_does_not_touch_original(self):
+        original = SortedIds(range(0, 100, 2))
+        clone = original.copy()
+        for value in range(1, 100, 2):
+            clone.add(value)
+        for value in range(0, 50):
+            clone.discard(value)
+        
+        self.assertEqual(list(original), list(range(0, 100, 2)))
+        self.assertEqual(len(original), 50)
+        self.assertEqual(list(clone), list(range(50, 100)))
+    
+    def test_copy_of_copy(self):
+        first = SortedIds(range(20)).copy()
+        first.discard(3)
+        second = first.copy()
+        second.add(3)
+        second.discard(10)
+        self.assertNotIn(3, first)
+        self.assertIn(10, first)
+        self.assertIn(3, second)
+        self.assertNotIn(10, second)
+
+
+class ChunkedMapTest(unittest.TestCase):
+    """Mismo comportamiento que un dict y copias aisladas"""
+    
+    def test_dict_semantics(self):
+        data = ChunkedMap()
+        for key in range(3000):
+            data[key] = str(key)
+        del data[5]
+        self.assertEqual(data.pop(6), '6')
+        self.assertIsNone(data.pop(6, None))
+        with self.assertRaises(KeyError):
+            data[5]
+        self.assertEqual(len(data), 2998)
+        self.assertEqual(dict(data.items()), {k: str(k) for k in range(3000) if k not in (5, 6)})
+    
+    def test_copy_does_not_touch_original(self):
+        original = ChunkedMap()
+        for key in range(100):
+            original[key] = key
+        clone = original.copy()
+        for key in range(50):
+            del clone[key]
+        clone[1000] = 'nuevo'
+        clone[99] = 'cambiado'
+        
+        self.assertEqual(dict(original.items()), {k: k for k in range(100)})
+        self.assertEqual(len(clone), 51)
+        self.assertEqual(clone[99], 'cambiado')
+
+
+class CatalogSnapshotTest(unittest.TestCase):
+    """Un estado publicado no cambia con las escrituras posteriores"""
+    
+    def setUp(self):
+        self.manager = ProjectManager()
+        for i in range(10):
+            self.manager.create(
+                title=f'Proyecto {i}', description='Aplicación de ejemplo con Python',
+                category='IA' if i % 2 else 'Mobile', technologies=['Python', 'Go' if i % 3 else 'Rust'],
+                link='https://example.com', featured=i < 3,
+            )
+    
+    def describe(self, state):
+        return {
+            'order': list(state.order),
+            'titles': {pid: p.title for pid, p in state.by_id.items()},
+            'category': {name: list(ids) for name, ids in state.by_category.items()},
+            'tech': {name: list(ids) for name, ids in state.by_tech.items()},
+            'featured': list(state.featured),
+            'search': state.search.search('python')[1],
+            'version': state.version,
+        }
+    
+    def test_writes_leave_snapshot_intact(self):
+        snapshot = self.manager._state
+        before = self.describe(snapshot)
+        
+        self.manager.update(1, title='Otro', category='IA', technologies=['Elixir'], featured=False)
+        self.manager.delete(2)
+        self.manager.create(title='Nuevo', description='Otro proyecto de Python', category='IA',
+                            technologies=['Go'], link='https://example.com', featured=True)
+        self.manager.apply_batch([{'op': 'delete', 'id': 3}])
+        
+        self.assertEqual(self.describe(snapshot), before)
+        after = self.describe(self.manager._state)
+        self.assertNotEqual(after, before)
+        self.assertEqual(after['tech']['Elixir'], [1])
+        self.assertNotIn(2, after['order'])
+
+
+if __name__ == '__main__':
+    unittest.main()
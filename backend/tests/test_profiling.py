@@ -0,0 +1,77 @@
+"""
+Pruebas de utils.profiling
+"""
+
+import tempfile
+import unittest
+from unittest import mock
+
+from flask import Flask
+
+from config.settings import DEFAULT_SECRET_KEY
+from utils import profiling
+from utils.profiling import Profiler, sign_token, verify_token
+
+SECRET = 'clave-de-prueba'
+
+
+class TokenTest(unittest.TestCase):
+    """Tokens firmados con SECRET_KEY y con caducidad"""
+    
+    def test_round_trip(self):
+        self.assertTrue(verify_token(sign_token(SECRET), SECRET))
+    
+    def test_rejected(self):
+        self.assertFalse(verify_token(sign_token('otra'), SECRET))
+        self.assertFalse(verify_token(sign_token(SECRET, timestamp=1000), SECRET, now=2000))
+        self.assertFalse(verify_token('123:bad', SECRET))
+        self.assertFalse(verify_token(None, SECRET))
+
+
+class ProfilerTest(unittest.TestCase):
+    """Endpoint de administración protegido por token"""
+    
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        
+        app = Flask(__name__)
+        app.add_url_rule('/ping', 'ping', lambda: 'pong')
+        Profiler(self.directory, secret=SECRET).init_app(app, path='/profiles')
+        self.client = app.test_client()
+        self.headers = {'X-Profile-Token': sign_token(SECRET)}
+    
+    def test_default_secret_refused(self):
+        with self.assertRaises(ValueError):
+            Profiler(self.directory, secret=DEFAULT_SECRET_KEY)
+        with self.assertRaises(ValueError):
+            Profiler(self.directory, secret='')
+    
+    def test_admin_requires_token(self):
+        self.assertEqual(self.client.get('/profiles').status_code, 403)
+        bad = {'X-Profile-Token': sign_token('otra')}
+        self.assertEqual(self.client.get('/profiles', headers=bad).status_code, 403)
+        self.assertEqual(self.client.get('/profiles', headers=self.headers).status_code, 200)
+    
+    def test_profiles_signed_requests(self):
+        self.client.get('/ping')
+        self.client.get('/ping', headers=self.headers)
+        body = self.client.get('/profiles?endpoint=ping', headers=self.headers).get_json()
+        self.assertEqual(body['profiles'], 1)
+        self.assertTrue(body['data'])
+    
+    def test_top_validation(self):
+        for top in ('abc', '0', '-3'):
+            response = self.client.get('/profiles?top=' + top, headers=self.headers)
+            self.assertEqual(response.status_code, 400)
+    
+    def test_top_is_clamped(self):
+        self.client.get('/ping', headers=self.headers)
+        with mock.patch.object(profiling, 'MAX_TOP', 2):
+            body = self.client.get('/profiles?top=1000000', headers=self.headers).get_json()
+        self.assertEqual(len(body['data']), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
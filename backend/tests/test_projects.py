@@ -0,0 +1,310 @@
+"""
+Pruebas de los gestores de proyectos (memoria y SQLite)
+"""
+
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from config.settings import PAGINATION
+from models.project import ProjectManager, ValidationError
+from models.sqlite_store import SQLiteDatabase, SQLiteProjectManager
+
+
+def project_data(**fields):
+    data = dict(title='Proyecto', description='Descripción del proyecto', category='IA',
+                technologies=['Python'], link='https://example.com', featured=False)
+    data.update(fields)
+    return data
+
+
+class MemoryBackend:
+    """Crea un ProjectManager en memoria"""
+    
+    def make_manager(self):
+        return ProjectManager()
+
+
+class SQLiteBackend:
+    """Crea un SQLiteProjectManager sobre un archivo temporal"""
+    
+    def make_manager(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        db = SQLiteDatabase(os.path.join(directory.name, 'test.db'))
+        self.addCleanup(db.close)
+        return SQLiteProjectManager(db)
+
+
+class UpdateValidationTests:
+    
+    def setUp(self):
+        self.manager = self.make_manager()
+        self.project = self.manager.create(**project_data(technologies=['Go']))
+    
+    def assert_rejected(self, **fields):
+        version = self.manager.version
+        with self.assertRaises(ValidationError) as raised:
+            self.manager.update(self.project.id, **fields)
+        self.assertTrue(raised.exception.errors)
+        self.assertEqual(self.manager.version, version)
+        self.assertEqual(self.manager.read(self.project.id).technologies, ['Go'])
+    
+    def test_technologies_as_string(self):
+        self.assert_rejected(technologies='Rust')
+        self.assertEqual(self.manager.query(technologies=['R'], with_total=True)['total'], 0)
+    
+    def test_unhashable_technology(self):
+        self.assert_rejected(technologies=[{'a': 1}])
+    
+    def test_wrong_types(self):
+        self.assert_rejected(title=5)
+        self.assert_rejected(featured='si')
+        self.assert_rejected(category='Otra')
+    
+    def test_valid_update_is_indexed(self):
+        self.manager.update(self.project.id, technologies=['Rust'])
+        self.assertEqual(self.manager.query(technologies=['Rust'], with_total=True)['total'], 1)
+        self.assertEqual(self.manager.query(technologies=['Go'], with_total=True)['total'], 0)
+
+
+class BatchTests:
+    
+    def setUp(self):
+        self.manager = self.make_manager()
+        self.project = self.manager.create(**project_data())
+    
+    def assert_batch_rejected(self, operations, index):
+        version = self.manager.version
+        results, errors = self.manager.apply_batch(operations)
+        self.assertEqual(results, [])
+        self.assertEqual([e['index'] for e in errors], [index])
+        self.assertEqual(self.manager.version, version)
+        self.assertEqual(len(self.manager.get_all()), 1)
+    
+    def test_wrongly_typed_create(self):
+        self.assert_batch_rejected([
+            {'op': 'create', 'data': project_data(title='Otro')},
+            {'op': 'create', 'data': project_data(title=5)},
+        ], 1)
+    
+    def test_technologies_as_string(self):
+        self.assert_batch_rejected([
+            {'op': 'update', 'id': self.project.id, 'data': {'technologies': 'Rust'}},
+        ], 0)
+    
+    def test_unknown_op_and_bad_data(self):
+        results, errors = self.manager.apply_batch([
+            {'op': 'merge'}, 'texto', {'op': 'update', 'id': self.project.id, 'data': [1]},
+        ])
+        self.assertEqual([e['index'] for e in errors], [0, 1, 2])
+    
+    def test_updates_of_same_project_accumulate(self):
+        results, errors = self.manager.apply_batch([
+            {'op': 'update', 'id': self.project.id, 'data': {'title': 'Nuevo'}},
+            {'op': 'update', 'id': self.project.id, 'data': {'featured': True}},
+            {'op': 'create', 'data': project_data(title='Otro')},
+        ])
+        self.assertEqual(errors, [])
+        project = self.manager.read(self.project.id)
+        self.assertEqual((project.title, project.featured), ('Nuevo', True))
+        self.assertEqual(len(self.manager.get_all()), 2)
+    
+    def test_delete_then_update_fails(self):
+        self.assert_batch_rejected([
+            {'op': 'delete', 'id': self.project.id},
+            {'op': 'update', 'id': self.project.id, 'data': {'title': 'x'}},
+        ], 1)
+
+
+class RouteTest(unittest.TestCase):
+    """Cliente sobre el blueprint de proyectos con un catálogo de 5 proyectos"""
+    
+    def setUp(self):
+        # Solo el blueprint: importar app reemplaza sys.stdout
+        from flask import Flask
+        from routes import projects
+        from utils.serialization import FastJSONProvider
+        
+        app = Flask(__name__)
+        app.json = FastJSONProvider(app)
+        app.register_blueprint(projects.projects_bp)
+        
+        self.manager = ProjectManager()
+        for i in range(5):
+            self.manager.create(**project_data(title=f'Proyecto {i}'))
+        for patcher in (mock.patch.object(projects, 'manager', self.manager),
+                        mock.patch.object(projects.response_cache, 'enabled', False)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.client = app.test_client()
+    
+    def get(self, query, path=''):
+        response = self.client.get('/api/v1/projects' + path + '?' + query)
+        self.assertEqual(response.status_code, 200)
+        return response.get_json()
+
+
+class ListingTotalTest(RouteTest):
+    """GET /projects solo calcula el total en la primera página o con total=true"""
+    
+    def test_total_only_on_first_page(self):
+        first = self.get('limit=2')
+        self.assertEqual(first['count'], 5)
+        with mock.patch.object(self.manager, '_facet_counts') as facet_counts:
+            second = self.get('limit=2&tech=Python&cursor=' + first['next_cursor'])
+        self.assertIsNone(second['count'])
+        self.assertNotIn('facets', second)
+        facet_counts.assert_not_called()
+        self.assertEqual(len(second['data']), 2)
+    
+    def test_total_on_request(self):
+        first = self.get('limit=2')
+        second = self.get('limit=2&total=true&cursor=' + first['next_cursor'])
+        self.assertEqual(second['count'], 5)
+
+
+class FieldsAndFacetsTest(RouteTest):
+    """?fields= recorta cada elemento y facets=true agrega los conteos"""
+    
+    def test_fields(self):
+        body = self.get('limit=2&fields=id,title,id')
+        self.assertEqual([sorted(item) for item in body['data']], [['id', 'title']] * 2)
+        self.assertEqual(body['data'][0]['title'], 'Proyecto 0')
+    
+    def test_unknown_field(self):
+        response = self.client.get('/api/v1/projects?fields=id,password')
+        self.assertEqual(response.status_code, 400)
+    
+    def test_facets(self):
+        self.manager.update(1, category='Mobile', technologies=['Go'], featured=True)
+        body = self.get('facets=true&tech=Python')
+        self.assertEqual(body['count'], 4)
+        self.assertEqual(body['facets'], {
+            'category': {'IA': 4}, 'technologies': {'Python': 4}, 'featured': 0})
+        body = self.get('facets=true')
+        self.assertEqual(body['facets']['category'], {'IA': 4, 'Mobile': 1})
+        self.assertEqual(body['facets']['featured'], 1)
+
+
+class SearchRouteTest(RouteTest):
+    """GET /projects/search recorta los resultados a PAGINATION['max_limit']"""
+    
+    def test_default_limit_is_capped(self):
+        with mock.patch.dict(PAGINATION, max_limit=3):
+            body = self.get('q=proyecto', path='/search')
+        self.assertEqual(len(body['data']), 3)
+        self.assertEqual(body['count'], 5)
+
+
+class QueryParityTest(SQLiteBackend, unittest.TestCase):
+    """Los gestores en memoria y SQLite responden igual a las mismas consultas"""
+    
+    CATEGORIES = ('IA', 'Mobile', 'FullStack', 'DevOps')
+    TECHNOLOGIES = ('Python', 'Go', 'React', 'Rust', 'Docker')
+    
+    def setUp(self):
+        rng = random.Random(3)
+        self.memory = ProjectManager()
+        self.sqlite = self.make_manager()
+        operations = []
+        for i in range(60):
+            operations.append({'op': 'create', 'data': project_data(
+                title=f'Proyecto {i} ' + rng.choice(('móvil', 'datos', 'nube')),
+                description=f'Aplicación {rng.choice(("web", "de escritorio", "de datos"))}',
+                category=rng.choice(self.CATEGORIES),
+                technologies=rng.sample(self.TECHNOLOGIES, rng.randint(1, 3)),
+                featured=rng.random() < 0.3,
+            )})
+        for manager in (self.memory, self.sqlite):
+            self.assertEqual(manager.apply_batch(operations)[1], [])
+            manager.delete(5)
+            manager.update(7, category='DevOps', technologies=['Rust'])
+    
+    def walk(self, manager, **filters):
+        ids, after = [], None
+        first = manager.query(limit=7, facets=True, with_total=True, **filters)
+        while True:
+            result = manager.query(after=after, limit=7, **filters)
+            ids.extend(p.id for p in result['items'])
+            after = result['next_after']
+            if after is None:
+                return ids, first['total'], first['facets']
+    
+    def test_filters(self):
+        cases = [{}, {'category': 'IA'}, {'featured': True}, {'technologies': ['Go']},
+                 {'technologies': ['Python', 'React']}, {'category': 'DevOps', 'technologies': ['Rust']},
+                 {'category': 'Mobile', 'featured': True, 'technologies': ['Docker']},
+                 {'technologies': ['Cobol']}]
+        for filters in cases:
+            with self.subTest(**filters):
+                ids, total, facets = self.walk(self.memory, **filters)
+                self.assertEqual((ids, total, facets), self.walk(self.sqlite, **filters))
+                self.assertEqual(total, len(ids))
+    
+    def test_search_matches(self):
+        for query in ('proyecto', 'móvil', 'aplicacion datos', 'rust', 'inexistente'):
+            with self.subTest(query=query):
+                memory, memory_total = self.memory.search(query, 100)
+                sqlite, sqlite_total = self.sqlite.search(query, 100)
+                self.assertEqual(memory_total, sqlite_total)
+                self.assertEqual({p.id for p in memory}, {p.id for p in sqlite})
+
+
+class SearchRankingTests:
+    """Ranking de la búsqueda: título > tecnologías > descripción"""
+    
+    def setUp(self):
+        self.manager = self.make_manager()
+        self.in_description = self.manager.create(**project_data(
+            title='Inventario', description='Sistema de gestión con kotlin en el servidor'))
+        self.in_title = self.manager.create(**project_data(
+            title='Kotlin para tiendas', description='Aplicación de ventas'))
+        self.in_technologies = self.manager.create(**project_data(
+            title='Reservas', description='Aplicación de reservas', technologies=['Kotlin']))
+        self.manager.create(**project_data(title='Otro', description='Sin relación'))
+    
+    def test_field_weights(self):
+        projects, total = self.manager.search('kotlin', 10)
+        self.assertEqual(total, 3)
+        self.assertEqual([p.id for p in projects],
+                         [self.in_title.id, self.in_technologies.id, self.in_description.id])
+    
+    def test_accents_and_limit(self):
+        projects, total = self.manager.search('APLICACIÓN', 1)
+        self.assertEqual(total, 2)
+        self.assertEqual(len(projects), 1)
+    
+    def test_all_terms_required(self):
+        projects, total = self.manager.search('kotlin tiendas', 10)
+        self.assertEqual(([p.id for p in projects], total), ([self.in_title.id], 1))
+
+
+class MemoryBatchTest(MemoryBackend, BatchTests, unittest.TestCase):
+    pass
+
+
+class SQLiteBatchTest(SQLiteBackend, BatchTests, unittest.TestCase):
+    pass
+
+
+class MemorySearchRankingTest(MemoryBackend, SearchRankingTests, unittest.TestCase):
+    pass
+
+
+class SQLiteSearchRankingTest(SQLiteBackend, SearchRankingTests, unittest.TestCase):
+    pass
+
+
+class MemoryUpdateValidationTest(MemoryBackend, UpdateValidationTests, unittest.TestCase):
+    pass
+
+
+class SQLiteUpdateValidationTest(SQLiteBackend, UpdateValidationTests, unittest.TestCase):
+    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
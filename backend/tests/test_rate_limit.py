@@ -0,0 +1,75 @@
+"""
+Pruebas de utils.rate_limit: respuestas 429 del token bucket
+"""
+
+import unittest
+
+from flask import Flask
+
+from utils.rate_limit import RateLimiter
+
+
+class RateLimiterTest(unittest.TestCase):
+    """2 peticiones cada 10 s por defecto, 1 por minuto en /login"""
+    
+    def setUp(self):
+        self.now = 1000.0
+        app = Flask(__name__)
+        app.add_url_rule('/items', 'items', lambda: 'ok')
+        app.add_url_rule('/login', 'login', lambda: 'ok', methods=['GET', 'POST'])
+        app.add_url_rule('/health', 'health', lambda: 'ok')
+        self.limiter = RateLimiter(
+            calls=2, period=10, routes={'login': {'calls': 1, 'period': 60}},
+            exempt=('health',), clock=lambda: self.now,
+        )
+        self.limiter.init_app(app)
+        self.client = app.test_client()
+    
+    def get(self, path='/items', ip='10.0.0.1', **kwargs):
+        return self.client.get(path, environ_base={'REMOTE_ADDR': ip}, **kwargs)
+    
+    def test_limit_exceeded(self):
+        self.assertEqual(self.get().status_code, 200)
+        self.assertEqual(self.get().status_code, 200)
+        response = self.get()
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response.get_json()['status'], 'error')
+        self.assertEqual(response.headers['Retry-After'], '5')
+        self.assertEqual(response.headers['X-RateLimit-Limit'], '2')
+    
+    def test_refill(self):
+        for _ in range(3):
+            self.get()
+        self.now += 5
+        self.assertEqual(self.get().status_code, 200)
+        self.assertEqual(self.get().status_code, 429)
+    
+    def test_clients_are_independent(self):
+        for _ in range(3):
+            self.get()
+        self.assertEqual(self.get(ip='10.0.0.2').status_code, 200)
+    
+    def test_route_rule_and_exempt(self):
+        self.assertEqual(self.get('/login').status_code, 200)
+        response = self.get('/login')
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response.headers['Retry-After'], '60')
+        # El bucket de /login no consume el de la regla por defecto
+        self.assertEqual(self.get().status_code, 200)
+        for _ in range(5):
+            self.assertEqual(self.get('/health').status_code, 200)
+    
+    def test_forwarded_for_ignored_by_default(self):
+        for i in range(3):
+            response = self.get(headers={'X-Forwarded-For': f'192.0.2.{i}'})
+        self.assertEqual(response.status_code, 429)
+    
+    def test_trust_proxy(self):
+        self.limiter.trust_proxy = True
+        for i in range(3):
+            response = self.get(headers={'X-Forwarded-For': f'192.0.2.{i}'})
+            self.assertEqual(response.status_code, 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
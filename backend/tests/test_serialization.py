@@ -0,0 +1,44 @@
+"""
+Pruebas de utils.serialization
+"""
+
+import unittest
+
+from flask import Flask
+
+from utils.serialization import FastJSONProvider, dumps, loads
+
+
+class BigIntegerTest(unittest.TestCase):
+    """Los enteros fuera de 64 bits no fallan ni pierden precisión"""
+    
+    def test_dumps(self):
+        self.assertEqual(loads(dumps({'n': 2 ** 70})), {'n': 2 ** 70})
+        self.assertEqual(dumps([-2 ** 64]), b'[-18446744073709551616]')
+    
+    def test_loads(self):
+        self.assertEqual(loads('{"n": 123456789012345678901234567890}'),
+                         {'n': 123456789012345678901234567890})
+        self.assertEqual(loads(b'[-9999999999999999999]'), [-9999999999999999999])
+    
+    def test_non_string_keys(self):
+        self.assertEqual(loads(dumps({1: 'a'})), {'1': 'a'})
+
+
+class ProviderTest(unittest.TestCase):
+    """FastJSONProvider respeta los argumentos de json"""
+    
+    def setUp(self):
+        app = Flask(__name__)
+        self.provider = FastJSONProvider(app)
+    
+    def test_sort_keys(self):
+        self.assertEqual(self.provider.dumps({'b': 1, 'a': 2}, sort_keys=True),
+                         '{"a": 2, "b": 1}')
+    
+    def test_compact_by_default(self):
+        self.assertEqual(self.provider.dumps({'b': 1, 'a': 2}), '{"b":1,"a":2}')
+
+
+if __name__ == '__main__':
+    unittest.main()
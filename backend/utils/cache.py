@@ -0,0 +1,537 @@
+"""
+Utils: Cache
+Capa de caché configurable (memoria LRU+TTL o Redis) y decorador para
+cachear respuestas de los endpoints de lectura
+"""
+
+import logging
+import socket
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from queue import Empty, Full, LifoQueue
+from urllib.parse import urlencode
+
+from flask import Response, make_response, request
+
+from config.settings import CACHE, COMPRESSION
+from utils.compression import compress, compressible, negotiate, set_encoded_body
+
+logger = logging.getLogger(__name__)
+
+
+class BaseCache:
+    """
+    Interfaz común de los backends de caché
+    
+    Las claves son str y los valores bytes. Un valor puede guardarse con
+    la versión de los datos de los que salió: se almacena con la versión
+    como prefijo y las lecturas que piden otra versión lo tratan como un
+    fallo. Así la clave no cambia con cada escritura y la entrada antigua
+    se reemplaza en lugar de quedar ocupando espacio hasta expirar.
+    """
+    
+    def __init__(self, ttl=None, enabled=True):
+        """
+        Args:
+            ttl: Tiempo de vida por defecto en segundos
+            enabled: Activa la caché
+        """
+        self.ttl = CACHE['ttl'] if ttl is None else ttl
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key, version=None):
+        """Obtiene un valor o None (también si es de otra versión)"""
+        return self.get_many([key], version)[0]
+    
+    def get_many(self, keys, version=None):
+        """Obtiene varios valores; retorna una lista alineada con keys"""
+        raise NotImplementedError
+    
+    def set(self, key, value, ttl=None, version=None):
+        """Guarda un valor, opcionalmente marcado con una versión"""
+        raise NotImplementedError
+    
+    def delete(self, key):
+        """Elimina un valor"""
+        raise NotImplementedError
+    
+    def clear(self):
+        """Vacía la caché"""
+        raise NotImplementedError
+    
+    @staticmethod
+    def _stamp(value, version):
+        """Antepone la versión al valor guardado"""
+        if version is None:
+            return value
+        return b'%s\n%s' % (str(version).encode(), value)
+    
+    def _unstamp(self, values, version):
+        """Quita la versión de los valores leídos y cuenta aciertos y fallos"""
+        if version is not None:
+            stamp = b'%s\n' % str(version).encode()
+            values = [
+                value[len(stamp):] if value is not None and value.startswith(stamp) else None
+                for value in values
+            ]
+        for value in values:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return values
+    
+    def stats(self):
+        """
+        Contadores de aciertos y fallos
+        
+        Returns:
+            dict: hits, misses y hit_rate
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+# ==========================================
+# Backend en memoria
+# ==========================================
+
+class MemoryCache(BaseCache):
+    """
+    Caché en proceso con expulsión LRU y expiración por TTL
+    
+    El tamaño está acotado por max_entries y por max_bytes (clave más
+    valor de todas las entradas); al superar cualquiera de los dos se
+    expulsan las entradas usadas hace más tiempo. Un valor mayor que
+    max_bytes no se guarda.
+    """
+    
+    def __init__(self, max_entries=None, max_bytes=None, ttl=None, enabled=True,
+                 clock=time.monotonic):
+        """
+        Args:
+            max_entries: Número máximo de entradas (por defecto CACHE['max_entries'])
+            max_bytes: Tamaño máximo en bytes (por defecto CACHE['max_bytes'])
+            ttl: Tiempo de vida por defecto en segundos
+            enabled: Activa la caché
+            clock: Reloj monótono (inyectable para pruebas)
+        """
+        super().__init__(ttl=ttl, enabled=enabled)
+        self.max_entries = max_entries or CACHE.get('max_entries', 1024)
+        self.max_bytes = max_bytes or CACHE.get('max_bytes', 64 * 1024 * 1024)
+        self.clock = clock
+        self.nbytes = 0
+        self._entries = OrderedDict()  # clave -> (valor, expira, tamaño)
+        self._lock = threading.Lock()
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def get_many(self, keys, version=None):
+        """Obtiene varios valores; None si no existen o expiraron"""
+        values = []
+        with self._lock:
+            now = self.clock()
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None and entry[1] <= now:
+                    self._remove(key)
+                    entry = None
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                values.append(None if entry is None else entry[0])
+            return self._unstamp(values, version)
+    
+    def set(self, key, value, ttl=None, version=None):
+        """Guarda un valor expulsando las entradas menos usadas si hace falta"""
+        value = self._stamp(value, version)
+        size = len(key) + len(value)
+        expires_at = self.clock() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._remove(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, expires_at, size)
+            self.nbytes += size
+            while len(self._entries) > self.max_entries or self.nbytes > self.max_bytes:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+    
+    def _remove(self, key):
+        """Elimina una entrada (requiere self._lock)"""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[2]
+    
+    def delete(self, key):
+        """Elimina un valor"""
+        with self._lock:
+            self._remove(key)
+    
+    def clear(self):
+        """Vacía la caché"""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+
+# ==========================================
+# Backend Redis (protocolo RESP)
+# ==========================================
+
+class CacheUnavailable(Exception):
+    """El servidor de caché no está disponible"""
+
+
+class RedisError(Exception):
+    """Error devuelto por el servidor Redis"""
+
+
+class _RedisConnection:
+    """Conexión TCP que habla el protocolo RESP de Redis"""
+    
+    def __init__(self, host, port, timeout):
+        self.sock = socket.create_connection((host, port), timeout)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.reader = self.sock.makefile('rb')
+    
+    @staticmethod
+    def _encode(commands):
+        """Codifica varios comandos en un solo buffer"""
+        buf = bytearray()
+        for args in commands:
+            buf += b'*%d\r\n' % len(args)
+            for arg in args:
+                if not isinstance(arg, bytes):
+                    arg = str(arg).encode('utf-8')
+                buf += b'$%d\r\n%s\r\n' % (len(arg), arg)
+        return bytes(buf)
+    
+    def execute(self, commands):
+        """
+        Envía los comandos en un solo write (pipeline) y lee las respuestas
+        
+        Args:
+            commands: Lista de tuplas de argumentos
+            
+        Returns:
+            list: Una respuesta por comando
+        """
+        self.sock.sendall(self._encode(commands))
+        return [self._read() for _ in commands]
+    
+    def _read(self):
+        """Lee una respuesta RESP"""
+        line = self.reader.readline()
+        if not line.endswith(b'\r\n'):
+            raise ConnectionError('Conexión cerrada por el servidor')
+        kind, rest = line[:1], line[1:-2]
+        if kind == b'+':
+            return rest
+        if kind == b'-':
+            raise RedisError(rest.decode('utf-8', 'replace'))
+        if kind == b':':
+            return int(rest)
+        if kind == b'$':
+            length = int(rest)
+            if length < 0:
+                return None
+            data = self.reader.read(length + 2)
+            if len(data) != length + 2:
+                raise ConnectionError('Respuesta incompleta')
+            return data[:-2]
+        if kind == b'*':
+            length = int(rest)
+            return None if length < 0 else [self._read() for _ in range(length)]
+        raise RedisError(f'Respuesta RESP desconocida: {line!r}')
+    
+    def close(self):
+        """Cierra la conexión"""
+        try:
+            self.reader.close()
+            self.sock.close()
+        except OSError:
+            pass
+
+
+class RedisClient:
+    """
+    Pool de conexiones a un servidor que habla el protocolo de Redis
+    
+    Si el servidor no responde, execute() lanza CacheUnavailable y no se
+    reintenta la conexión hasta pasados retry_interval segundos. Lo
+    comparten la caché y el limitador de peticiones.
+    """
+    
+    def __init__(self, host='localhost', port=6379, db=0, pool_size=8, timeout=0.5,
+                 retry_interval=30):
+        """
+        Args:
+            host: Host del servidor
+            port: Puerto del servidor
+            db: Número de base de datos
+            pool_size: Conexiones ociosas conservadas en el pool
+            timeout: Timeout de socket en segundos
+            retry_interval: Segundos sin reintentar tras un fallo de conexión
+        """
+        self.host = host
+        self.port = port
+        self.db = db
+        self.timeout = timeout
+        self.retry_interval = retry_interval
+        self._pool = LifoQueue(maxsize=pool_size)
+        self._down_until = 0.0
+    
+    @classmethod
+    def from_settings(cls, settings=CACHE):
+        """Crea el cliente con el servidor configurado en CACHE"""
+        return cls(
+            host=settings['host'],
+            port=settings['port'],
+            db=settings.get('db', 0),
+            pool_size=settings.get('pool_size', 8),
+        )
+    
+    def _connect(self):
+        """Abre una conexión nueva y selecciona la base de datos"""
+        conn = _RedisConnection(self.host, self.port, self.timeout)
+        if self.db:
+            conn.execute([('SELECT', self.db)])
+        return conn
+    
+    def execute(self, commands):
+        """
+        Ejecuta comandos en pipeline con una conexión del pool
+        
+        Args:
+            commands: Lista de tuplas de argumentos
+            
+        Returns:
+            list: Una respuesta por comando
+            
+        Raises:
+            CacheUnavailable: Si no hay conexión con el servidor
+            RedisError: Si el servidor devuelve un error
+        """
+        if time.monotonic() < self._down_until:
+            raise CacheUnavailable('Servidor Redis marcado como no disponible')
+        
+        try:
+            conn = self._pool.get_nowait()
+        except Empty:
+            conn = None
+        
+        try:
+            if conn is None:
+                conn = self._connect()
+            replies = conn.execute(commands)
+        except (OSError, ConnectionError) as e:
+            if conn is not None:
+                conn.close()
+            self._down_until = time.monotonic() + self.retry_interval
+            logger.warning('Redis no disponible en %s:%s: %s', self.host, self.port, e)
+            raise CacheUnavailable(str(e))
+        
+        try:
+            self._pool.put_nowait(conn)
+        except Full:
+            conn.close()
+        return replies
+
+
+class RedisCache(BaseCache):
+    """
+    Caché en un servidor que habla el protocolo de Redis
+    
+    Usa un RedisClient (pool de conexiones) y envía las lecturas
+    múltiples en pipeline. Si el servidor no responde, las operaciones se
+    tratan como fallos de caché.
+    """
+    
+    def __init__(self, host='localhost', port=6379, db=0, prefix='portafolio:',
+                 pool_size=8, timeout=0.5, retry_interval=30, ttl=None, enabled=True):
+        """
+        Args:
+            host: Host del servidor
+            port: Puerto del servidor
+            db: Número de base de datos
+            prefix: Prefijo de todas las claves
+            pool_size: Conexiones ociosas conservadas en el pool
+            timeout: Timeout de socket en segundos
+            retry_interval: Segundos sin reintentar tras un fallo de conexión
+            ttl: Tiempo de vida por defecto en segundos
+            enabled: Activa la caché
+        """
+        super().__init__(ttl=ttl, enabled=enabled)
+        self.prefix = prefix
+        self.client = RedisClient(host, port, db, pool_size, timeout, retry_interval)
+    
+    def _execute(self, commands):
+        """Ejecuta comandos con el cliente (ver RedisClient.execute)"""
+        return self.client.execute(commands)
+    
+    def get_many(self, keys, version=None):
+        """Obtiene varios valores con un pipeline de GET"""
+        if not keys:
+            return []
+        try:
+            values = self._execute([('GET', self.prefix + key) for key in keys])
+        except (CacheUnavailable, RedisError):
+            values = [None] * len(keys)
+        return self._unstamp(values, version)
+    
+    def set(self, key, value, ttl=None, version=None):
+        """Guarda un valor con expiración"""
+        ttl = self.ttl if ttl is None else ttl
+        value = self._stamp(value, version)
+        try:
+            self._execute([('SET', self.prefix + key, value, 'EX', max(1, int(ttl)))])
+        except (CacheUnavailable, RedisError):
+            pass
+    
+    def delete(self, key):
+        """Elimina un valor"""
+        try:
+            self._execute([('DEL', self.prefix + key)])
+        except (CacheUnavailable, RedisError):
+            pass
+    
+    def clear(self):
+        """
+        Elimina las claves con el prefijo de esta caché
+        
+        Usa SCAN para no bloquear el servidor con KEYS.
+        """
+        cursor = b'0'
+        try:
+            while True:
+                cursor, keys = self._execute([('SCAN', cursor, 'MATCH', self.prefix + '*', 'COUNT', 500)])[0]
+                if keys:
+                    self._execute([('DEL',) + tuple(keys)])
+                if cursor == b'0':
+                    return
+        except (CacheUnavailable, RedisError):
+            pass
+
+
+def create_cache(settings=CACHE):
+    """
+    Crea el backend de caché configurado en CACHE
+    
+    Args:
+        settings: Diccionario con type, host, port, ttl, enabled...
+        
+    Returns:
+        BaseCache: MemoryCache o RedisCache
+    """
+    if settings.get('type') == 'redis':
+        return RedisCache(
+            host=settings['host'],
+            port=settings['port'],
+            db=settings.get('db', 0),
+            prefix=settings.get('prefix', 'portafolio:'),
+            pool_size=settings.get('pool_size', 8),
+            ttl=settings['ttl'],
+            enabled=settings['enabled'],
+        )
+    return MemoryCache(
+        max_entries=settings.get('max_entries'),
+        max_bytes=settings.get('max_bytes'),
+        ttl=settings['ttl'],
+        enabled=settings['enabled'],
+    )
+
+
+# ==========================================
+# Decorador para endpoints
+# ==========================================
+
+def request_cache_key():
+    """
+    Construye la clave de caché de la petición actual
+    
+    Returns:
+        str: endpoint, argumentos de ruta y query args ordenados
+    """
+    view_args = urlencode(sorted((request.view_args or {}).items()))
+    query = urlencode(sorted(request.args.items(multi=True)))
+    return f'{request.endpoint}?{view_args}&{query}'
+
+
+def cached(cache, version=None, ttl=None, key=request_cache_key):
+    """
+    Decorador que cachea el cuerpo JSON de un endpoint GET
+    
+    Solo se cachean respuestas 200. En un acierto se devuelven los bytes
+    guardados sin ejecutar la vista ni tocar los modelos. Si se indica
+    version, cada entrada se guarda marcada con ella: tras una escritura
+    la entrada anterior cuenta como fallo y se reemplaza bajo la misma
+    clave, en lugar de acumular una copia por versión.
+    
+    Junto al cuerpo se guarda su versión comprimida para cada codificación
+    negociada (clave '<clave>|gzip', '<clave>|br'), de modo que un acierto
+    no vuelve a comprimir los mismos bytes.
+    
+    Args:
+        cache: Backend de caché (BaseCache)
+        version: Función que retorna la versión actual de los datos
+        ttl: Tiempo de vida en segundos (por defecto el de la caché)
+        key: Función que construye la clave de la petición
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if not cache.enabled:
+                return view(*args, **kwargs)
+            
+            cache_key = key()
+            current = version() if version is not None else None
+            encoding = negotiate()
+            
+            if encoding is None:
+                body = cache.get(cache_key, current)
+                if body is not None:
+                    return _cached_response(body)
+            else:
+                encoded_key = f'{cache_key}|{encoding}'
+                encoded, body = cache.get_many([encoded_key, cache_key], current)
+                if encoded is not None:
+                    response = _cached_response(b'')
+                    set_encoded_body(response, encoded, encoding)
+                    return response
+                if body is not None:
+                    return _encode_cached(cache, _cached_response(body), encoded_key, encoding,
+                                          ttl, current)
+            
+            response = make_response(view(*args, **kwargs))
+            if response.status_code == 200 and not response.is_streamed:
+                cache.set(cache_key, response.get_data(), ttl, current)
+                if encoding is not None:
+                    response = _encode_cached(cache, response, f'{cache_key}|{encoding}', encoding,
+                                              ttl, current)
+            return response
+        return wrapper
+    return decorator
+
+
+def _cached_response(body):
+    """Respuesta JSON a partir de bytes cacheados"""
+    return Response(body, status=200, mimetype='application/json')
+
+
+def _encode_cached(cache, response, encoded_key, encoding, ttl, version):
+    """Comprime la respuesta y guarda la variante junto al cuerpo"""
+    if not compressible(response, COMPRESSION):
+        return response
+    encoded = compress(response.get_data(), encoding)
+    cache.set(encoded_key, encoded, ttl, version)
+    set_encoded_body(response, encoded, encoding)
+    return response
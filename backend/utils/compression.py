@@ -0,0 +1,119 @@
+"""
+Utils: Compression
+Compresión de respuestas (gzip y brotli) negociada con Accept-Encoding
+"""
+
+import gzip
+
+from flask import request
+
+from config.settings import COMPRESSION
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depende del entorno
+    brotli = None
+
+# Codificaciones soportadas en orden de preferencia
+ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def negotiate(settings=COMPRESSION):
+    """
+    Elige la codificación para la petición actual
+    
+    Se toma la aceptada con mayor calidad; en empate gana el orden de
+    ENCODINGS (brotli antes que gzip).
+    
+    Returns:
+        str: 'br', 'gzip' o None si no hay ninguna aceptable
+    """
+    if not settings['enabled']:
+        return None
+    accepted = request.accept_encodings
+    best, best_quality = None, 0
+    for encoding in ENCODINGS:
+        quality = accepted[encoding]
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(data, encoding, settings=COMPRESSION):
+    """
+    Comprime un cuerpo
+    
+    Args:
+        data: bytes a comprimir
+        encoding: 'br' o 'gzip'
+        
+    Returns:
+        bytes: Cuerpo comprimido
+    """
+    if encoding == 'br':
+        return brotli.compress(data, quality=settings['brotli_quality'])
+    # mtime=0 para que el mismo cuerpo produzca siempre los mismos bytes
+    return gzip.compress(data, compresslevel=settings['gzip_level'], mtime=0)
+
+
+def compressible(response, settings=COMPRESSION):
+    """
+    Indica si una respuesta admite compresión
+    
+    Se excluyen las respuestas en streaming (se comprimen al generarse),
+    las ya codificadas, las pequeñas y los tipos que no son texto.
+    """
+    return (
+        response.status_code == 200
+        and not response.is_streamed
+        and not response.direct_passthrough
+        and 'Content-Encoding' not in response.headers
+        and response.mimetype in settings['mimetypes']
+        and 'no-transform' not in response.headers.get('Cache-Control', '')
+        and (response.content_length or 0) >= settings['min_size']
+    )
+
+
+def set_encoded_body(response, body, encoding):
+    """
+    Reemplaza el cuerpo por su versión comprimida
+    
+    Args:
+        response: Respuesta Flask
+        body: Cuerpo comprimido
+        encoding: Codificación aplicada
+    """
+    response.set_data(body)
+    response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    # Un ETag fuerte identifica los bytes: la versión comprimida lleva el suyo
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(f'{etag}-{encoding}')
+
+
+def compress_response(response):
+    """
+    Hook after_request que comprime la respuesta si corresponde
+    
+    Las respuestas servidas por el decorador cached ya llegan con
+    Content-Encoding y no se vuelven a comprimir.
+    """
+    if not compressible(response):
+        return response
+    
+    response.vary.add('Accept-Encoding')
+    encoding = negotiate()
+    if encoding is not None:
+        set_encoded_body(response, compress(response.get_data(), encoding), encoding)
+    return response
+
+
+def init_app(app):
+    """
+    Registra la compresión de respuestas en la app
+    
+    Args:
+        app: Aplicación Flask
+    """
+    app.after_request(compress_response)
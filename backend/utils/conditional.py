@@ -0,0 +1,140 @@
+"""
+Utils: Conditional
+Peticiones condicionales (ETag / Last-Modified) con respuestas 304
+"""
+
+import hashlib
+import time
+from datetime import datetime, timezone
+from functools import wraps
+
+from flask import Response, make_response, request
+
+from utils.compression import negotiate
+
+
+def make_etag(value):
+    """
+    ETag fuerte a partir de una descripción de la representación
+    
+    Args:
+        value: Texto que identifica la versión del recurso
+        
+    Returns:
+        str: ETag sin comillas
+    """
+    return hashlib.sha1(value.encode('utf-8')).hexdigest()
+
+
+def encoded_etag(etag, encoding):
+    """
+    ETag de la representación comprimida
+    
+    Un ETag fuerte identifica los bytes exactos, así que cada codificación
+    tiene el suyo.
+    """
+    return f'{etag}-{encoding}' if encoding else etag
+
+
+def http_date(timestamp):
+    """Convierte un epoch en datetime UTC con precisión de segundos"""
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(int(timestamp), timezone.utc)
+
+
+def validator_date(timestamp, now=None):
+    """
+    Fecha utilizable como Last-Modified / If-Modified-Since
+    
+    Las fechas HTTP tienen precisión de segundos: si la última
+    modificación cae en el segundo actual, otra posterior en el mismo
+    segundo tendría la misma fecha y un If-Modified-Since daría un 304
+    con datos viejos. En ese caso no hay fecha y solo vale el ETag.
+    
+    Args:
+        timestamp: Epoch de la última modificación (o None)
+        now: Epoch actual (por defecto time.time())
+        
+    Returns:
+        datetime: Fecha UTC o None
+    """
+    if timestamp is None:
+        return None
+    if int(timestamp) >= int(time.time() if now is None else now):
+        return None
+    return http_date(timestamp)
+
+
+def is_not_modified(etag, last_modified=None):
+    """
+    Evalúa If-None-Match / If-Modified-Since de la petición actual
+    
+    If-Modified-Since solo se considera si no hay If-None-Match.
+    
+    Args:
+        etag: ETag de la representación sin codificar
+        last_modified: datetime UTC de la última modificación (o None)
+        
+    Returns:
+        bool: True si el cliente ya tiene la versión actual
+    """
+    if request.if_none_match:
+        encoding = negotiate()
+        return (request.if_none_match.contains_weak(etag) or
+                (encoding is not None and request.if_none_match.contains_weak(encoded_etag(etag, encoding))))
+    if last_modified is not None and request.if_modified_since is not None:
+        return last_modified <= request.if_modified_since
+    return False
+
+
+def set_validators(response, etag, last_modified=None):
+    """
+    Agrega ETag y Last-Modified a una respuesta
+    
+    Si la respuesta ya está comprimida el ETag incluye la codificación.
+    """
+    response.set_etag(encoded_etag(etag, response.headers.get('Content-Encoding')))
+    if last_modified is not None:
+        response.last_modified = last_modified
+    return response
+
+
+def conditional(validators):
+    """
+    Decorador que responde 304 si el cliente tiene la versión actual
+    
+    validators recibe los argumentos de la ruta y solo debe consultar
+    versiones o fechas, no serializar: la comprobación se hace antes de
+    ejecutar la vista (y antes de la caché si el decorador se aplica
+    encima de cached).
+    
+    Args:
+        validators: Función que retorna (texto que identifica la versión
+            del recurso, epoch de la última modificación o None), o None
+            si no hay validadores (por ejemplo, un 404)
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            current = validators(*args, **kwargs)
+            if current is None:
+                return view(*args, **kwargs)
+            
+            value, timestamp = current
+            tag = make_etag(value)
+            modified = validator_date(timestamp)
+            if is_not_modified(tag, modified):
+                response = Response(status=304)
+                response.vary.add('Accept-Encoding')
+                response.set_etag(encoded_etag(tag, negotiate()))
+                if modified is not None:
+                    response.last_modified = modified
+                return response
+            
+            response = make_response(view(*args, **kwargs))
+            if response.status_code == 200:
+                set_validators(response, tag, modified)
+            return response
+        return wrapper
+    return decorator
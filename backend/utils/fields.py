@@ -0,0 +1,29 @@
+"""
+Utils: Fields
+Selección de campos (sparse fieldsets) con el parámetro ?fields=
+"""
+
+
+def parse_fields(args, allowed):
+    """
+    Lee el parámetro fields de la query
+    
+    Args:
+        args: request.args
+        allowed: Tupla de campos válidos del modelo
+        
+    Returns:
+        tuple: Campos pedidos sin duplicados, o None para todos
+        
+    Raises:
+        ValueError: Si se pide un campo desconocido
+    """
+    raw = args.get('fields')
+    if not raw:
+        return None
+    
+    fields = tuple(dict.fromkeys(f.strip() for f in raw.split(',') if f.strip()))
+    invalid = [f for f in fields if f not in allowed]
+    if invalid:
+        raise ValueError(f'Campos inválidos: {", ".join(invalid)}. Válidos: {", ".join(allowed)}')
+    return fields or None
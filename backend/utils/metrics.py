@@ -0,0 +1,335 @@
+"""
+Utils: Metrics
+Instrumentación de peticiones (conteos, latencia y tamaño de respuesta)
+expuesta en formato de texto de Prometheus
+"""
+
+import glob
+import logging
+import os
+import threading
+import time
+import weakref
+from bisect import bisect_left
+
+from flask import g, request
+
+from config.settings import METRICS
+from utils.serialization import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class _Shard:
+    """
+    Contadores de un hilo
+    
+    Solo el hilo dueño escribe en su shard, por lo que registrar una
+    petición no toma ningún lock. Los histogramas son listas con un
+    contador por bucket (el último es +Inf) seguidas de la suma.
+    """
+    
+    __slots__ = ('requests', 'latency', 'sizes')
+    
+    def __init__(self):
+        self.requests = {}
+        self.latency = {}
+        self.sizes = {}
+
+
+def _merge_counts(target, source):
+    """Suma los contadores de source en target"""
+    for key, value in source.items():
+        target[key] = target.get(key, 0) + value
+
+
+def _merge_histograms(target, source):
+    """Suma los histogramas de source en target"""
+    for key, values in source.items():
+        current = target.get(key)
+        if current is None:
+            target[key] = list(values)
+        else:
+            for i, value in enumerate(values):
+                current[i] += value
+
+
+def _labels(pairs):
+    """Formatea etiquetas de Prometheus"""
+    def escape(value):
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return ','.join(f'{name}="{escape(value)}"' for name, value in pairs)
+
+
+def _format_le(bound):
+    """Formatea el límite de un bucket"""
+    return repr(float(bound)) if isinstance(bound, float) else str(bound)
+
+
+class Metrics:
+    """
+    Registro de métricas por endpoint
+    
+    Cada hilo acumula en su propio shard y la exposición combina todos los
+    shards. Los shards de hilos terminados (el servidor de desarrollo crea
+    un hilo por petición) se suman a un acumulado común al recolectarse el
+    hilo, de modo que su número no crece sin límite.
+    
+    Con varios procesos (serve.py) se llama a share() con un directorio
+    común antes del fork: cada worker vuelca sus totales en un archivo
+    propio cada flush_interval segundos y la exposición suma los archivos
+    de los demás workers a los totales en vivo del que atiende la
+    petición. Los archivos de workers terminados se conservan, para que
+    los contadores no retrocedan.
+    """
+    
+    def __init__(self, latency_buckets, size_buckets, flush_interval=1.0):
+        """
+        Args:
+            latency_buckets: Límites de latencia en segundos (ordenados)
+            size_buckets: Límites de tamaño de respuesta en bytes (ordenados)
+            flush_interval: Segundos entre volcados al directorio compartido
+        """
+        self.latency_buckets = tuple(latency_buckets)
+        self.size_buckets = tuple(size_buckets)
+        self.flush_interval = flush_interval
+        self.directory = None
+        self._reset()
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._reset)
+    
+    def _reset(self):
+        """Estado vacío (al crear el registro y en cada proceso hijo)"""
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards = set()
+        self._retired = _Shard()
+        self._flusher = None
+    
+    @classmethod
+    def from_settings(cls, settings=METRICS):
+        """Crea el registro a partir de METRICS"""
+        return cls(settings['latency_buckets'], settings['size_buckets'],
+                   flush_interval=settings.get('flush_interval', 1.0))
+    
+    def init_app(self, app, path=METRICS['path']):
+        """
+        Instrumenta la app y registra el endpoint de exposición
+        
+        Args:
+            app: Aplicación Flask
+            path: Ruta del endpoint de métricas
+        """
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        app.add_url_rule(path, 'metrics', self._metrics_view, methods=['GET'])
+        app.extensions['metrics'] = self
+    
+    def share(self, directory):
+        """
+        Agrega las métricas de varios procesos a través de un directorio
+        
+        Debe llamarse en el proceso principal antes de crear los workers.
+        
+        Args:
+            directory: Directorio común (vacío al arrancar el servidor)
+        """
+        self.directory = str(directory)
+    
+    # ==========================================
+    # Registro
+    # ==========================================
+    
+    def _shard(self):
+        """Shard del hilo actual (se crea la primera vez)"""
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = _Shard()
+            self._local.shard = shard
+            with self._lock:
+                self._shards.add(shard)
+                if self.directory is not None and self._flusher is None:
+                    self._flusher = threading.Thread(
+                        target=self._flush_loop, name='metrics-flush', daemon=True)
+                    self._flusher.start()
+            weakref.finalize(threading.current_thread(), self._retire, shard)
+        return shard
+    
+    def _retire(self, shard):
+        """Suma el shard de un hilo terminado al acumulado común"""
+        with self._lock:
+            if shard not in self._shards:
+                # Shard heredado del proceso padre (ver _reset)
+                return
+            self._shards.discard(shard)
+            _merge_counts(self._retired.requests, shard.requests)
+            _merge_histograms(self._retired.latency, shard.latency)
+            _merge_histograms(self._retired.sizes, shard.sizes)
+    
+    @staticmethod
+    def _observe(histograms, key, buckets, value):
+        """Registra un valor en un histograma"""
+        values = histograms.get(key)
+        if values is None:
+            values = histograms[key] = [0] * (len(buckets) + 2)
+        values[bisect_left(buckets, value)] += 1
+        values[-1] += value
+    
+    def observe(self, blueprint, endpoint, method, status, duration, size=None):
+        """
+        Registra una petición
+        
+        Args:
+            blueprint: Blueprint que atendió la petición ('' para la app)
+            endpoint: Endpoint de Flask ('none' si no hubo ruta)
+            method: Método HTTP
+            status: Código de estado
+            duration: Latencia en segundos
+            size: Tamaño del cuerpo en bytes (None si es streaming)
+        """
+        shard = self._shard()
+        route = (blueprint, endpoint, method)
+        key = route + (status,)
+        shard.requests[key] = shard.requests.get(key, 0) + 1
+        self._observe(shard.latency, route, self.latency_buckets, duration)
+        if size is not None:
+            self._observe(shard.sizes, route, self.size_buckets, size)
+    
+    def _before_request(self):
+        g._metrics_start = time.perf_counter()
+    
+    def _after_request(self, response):
+        start = g.pop('_metrics_start', None)
+        if start is not None:
+            self.observe(
+                request.blueprint or '',
+                request.endpoint or 'none',
+                request.method,
+                response.status_code,
+                time.perf_counter() - start,
+                None if response.is_streamed else response.calculate_content_length(),
+            )
+        return response
+    
+    # ==========================================
+    # Exposición
+    # ==========================================
+    
+    def snapshot(self):
+        """
+        Combina los shards de todos los hilos
+        
+        Returns:
+            _Shard: Totales (conteos e histogramas)
+        """
+        total = _Shard()
+        with self._lock:
+            shards = [self._retired, *self._shards]
+            for shard in shards:
+                # dict() copia de forma atómica frente al hilo dueño
+                _merge_counts(total.requests, dict(shard.requests))
+                _merge_histograms(total.latency, dict(shard.latency))
+                _merge_histograms(total.sizes, dict(shard.sizes))
+        return total
+    
+    def _path(self, pid):
+        """Archivo con los totales del worker pid"""
+        return os.path.join(self.directory, f'metrics-{pid}.json')
+    
+    def flush(self):
+        """Vuelca los totales de este proceso en el directorio compartido"""
+        if self.directory is None:
+            return
+        total = self.snapshot()
+        data = dumps({
+            'requests': [[list(key), value] for key, value in total.requests.items()],
+            'latency': [[list(key), values] for key, values in total.latency.items()],
+            'sizes': [[list(key), values] for key, values in total.sizes.items()],
+        })
+        path = self._path(os.getpid())
+        with open(path + '.tmp', 'wb') as f:
+            f.write(data)
+        os.replace(path + '.tmp', path)
+    
+    def _flush_loop(self):
+        """Bucle del hilo de volcado"""
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except OSError as e:
+                logger.error('No se pudieron volcar las métricas en %s: %s', self.directory, e)
+    
+    def collect(self):
+        """
+        Totales de todos los procesos
+        
+        Returns:
+            _Shard: Totales en vivo de este proceso más los volcados de
+                los demás workers
+        """
+        total = self.snapshot()
+        if self.directory is None:
+            return total
+        own = self._path(os.getpid())
+        for path in glob.glob(os.path.join(self.directory, 'metrics-*.json')):
+            if path == own:
+                continue
+            try:
+                with open(path, 'rb') as f:
+                    data = loads(f.read())
+            except (OSError, ValueError):
+                continue
+            _merge_counts(total.requests, {tuple(key): value for key, value in data['requests']})
+            _merge_histograms(total.latency, {tuple(key): values for key, values in data['latency']})
+            _merge_histograms(total.sizes, {tuple(key): values for key, values in data['sizes']})
+        return total
+    
+    def _histogram_lines(self, name, histograms, buckets):
+        """Líneas de un histograma en formato Prometheus"""
+        lines = []
+        for (blueprint, endpoint, method), values in sorted(histograms.items()):
+            base = [('blueprint', blueprint), ('endpoint', endpoint), ('method', method)]
+            cumulative = 0
+            for bound, count in zip(buckets, values):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{_labels(base + [("le", _format_le(bound))])}}} {cumulative}')
+            count = cumulative + values[len(buckets)]
+            lines.append(f'{name}_bucket{{{_labels(base + [("le", "+Inf")])}}} {count}')
+            lines.append(f'{name}_sum{{{_labels(base)}}} {values[-1]}')
+            lines.append(f'{name}_count{{{_labels(base)}}} {count}')
+        return lines
+    
+    def render(self):
+        """
+        Exposición en formato de texto de Prometheus
+        
+        Returns:
+            str: Métricas
+        """
+        total = self.collect()
+        lines = [
+            '# HELP http_requests_total Peticiones HTTP por endpoint, método y estado',
+            '# TYPE http_requests_total counter',
+        ]
+        for (blueprint, endpoint, method, status), count in sorted(total.requests.items()):
+            labels = _labels([
+                ('blueprint', blueprint), ('endpoint', endpoint),
+                ('method', method), ('status', status),
+            ])
+            lines.append(f'http_requests_total{{{labels}}} {count}')
+        
+        lines.append('# HELP http_request_duration_seconds Latencia de las peticiones HTTP')
+        lines.append('# TYPE http_request_duration_seconds histogram')
+        lines.extend(self._histogram_lines('http_request_duration_seconds', total.latency, self.latency_buckets))
+        
+        lines.append('# HELP http_response_size_bytes Tamaño del cuerpo de las respuestas HTTP')
+        lines.append('# TYPE http_response_size_bytes histogram')
+        lines.extend(self._histogram_lines('http_response_size_bytes', total.sizes, self.size_buckets))
+        return '\n'.join(lines) + '\n'
+    
+    def _metrics_view(self):
+        """GET /api/v1/metrics"""
+        return self.render(), 200, {'Content-Type': CONTENT_TYPE}
@@ -0,0 +1,107 @@
+"""
+Utils: Pagination
+Paginación por cursor (keyset) para los endpoints de listado
+"""
+
+import base64
+import binascii
+
+from config.settings import PAGINATION
+
+
+def encode_cursor(last_id):
+    """
+    Codifica el ID del último elemento como cursor opaco
+    
+    Args:
+        last_id: ID del último elemento de la página o None
+        
+    Returns:
+        str: Cursor o None si no hay más páginas
+    """
+    if last_id is None:
+        return None
+    return base64.urlsafe_b64encode(str(last_id).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    Decodifica un cursor generado por encode_cursor
+    
+    Args:
+        cursor: Cursor recibido en la query
+        
+    Returns:
+        int: ID del último elemento de la página anterior
+        
+    Raises:
+        ValueError: Si el cursor no es válido
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        return int(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError('Cursor inválido')
+
+
+def parse_page_args(args):
+    """
+    Lee los parámetros limit y cursor de la query
+    
+    Args:
+        args: request.args
+        
+    Returns:
+        tuple: (after, limit); limit es None si no se pidió paginación
+        
+    Raises:
+        ValueError: Si limit o cursor no son válidos
+    """
+    after = None
+    limit = None
+    
+    cursor = args.get('cursor')
+    if cursor:
+        after = decode_cursor(cursor)
+    
+    raw_limit = args.get('limit')
+    if raw_limit is not None:
+        try:
+            limit = int(raw_limit)
+        except ValueError:
+            raise ValueError('limit debe ser un número entero')
+        if limit < 1:
+            raise ValueError('limit debe ser mayor que 0')
+        limit = min(limit, PAGINATION['max_limit'])
+    elif after is not None:
+        limit = PAGINATION['default_limit']
+    
+    return after, limit
+
+
+def iter_pages(paginate, page_size=None, **filters):
+    """
+    Recorre una colección completa página a página
+    
+    Cada página se obtiene con una consulta por cursor independiente,
+    por lo que la memoria usada no depende del tamaño de la colección
+    y las modificaciones concurrentes no invalidan el recorrido. Las
+    páginas se piden sin total (with_total=False): calcularlo en cada
+    una haría el recorrido cuadrático.
+    
+    Args:
+        paginate: Método paginate del almacén (acepta with_total)
+        page_size: Elementos por página (por defecto PAGINATION['max_limit'])
+        **filters: Filtros aceptados por paginate
+        
+    Yields:
+        list: Elementos de cada página
+    """
+    page_size = page_size or PAGINATION['max_limit']
+    after = None
+    while True:
+        page, after, _ = paginate(after=after, limit=page_size, with_total=False, **filters)
+        if page:
+            yield page
+        if after is None:
+            return
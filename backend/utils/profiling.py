@@ -0,0 +1,254 @@
+"""
+Utils: Profiling
+Perfilado opcional de peticiones con cProfile
+
+Los perfiles se guardan como archivos pstats etiquetados con el endpoint
+y se pueden consultar agregados en el endpoint de administración.
+"""
+
+import cProfile
+import hashlib
+import hmac
+import os
+import pstats
+import random
+import re
+import threading
+import time
+
+from flask import g, jsonify, request
+
+from config.settings import DEFAULT_SECRET_KEY, PROFILING, SECRET_KEY
+
+_UNSAFE = re.compile(r'[^A-Za-z0-9_.-]')
+
+# Criterios de orden aceptados por el endpoint de administración
+SORT_KEYS = {'cumulative': 3, 'tottime': 2, 'calls': 1}
+
+# Máximo de funciones retornadas por el endpoint de administración
+MAX_TOP = 200
+
+
+def sign_token(secret=SECRET_KEY, timestamp=None):
+    """
+    Genera un token para el header de profiling
+    
+    Args:
+        secret: Clave de firma (SECRET_KEY)
+        timestamp: Momento de emisión (por defecto ahora)
+        
+    Returns:
+        str: Token 'timestamp:firma'
+    """
+    timestamp = str(int(timestamp if timestamp is not None else time.time()))
+    signature = hmac.new(secret.encode(), f'profile:{timestamp}'.encode(), hashlib.sha256).hexdigest()
+    return f'{timestamp}:{signature}'
+
+
+def verify_token(token, secret=SECRET_KEY, max_age=300, now=None):
+    """
+    Verifica un token firmado
+    
+    Args:
+        token: Valor del header
+        secret: Clave de firma
+        max_age: Antigüedad máxima en segundos
+        now: Momento actual (inyectable para pruebas)
+        
+    Returns:
+        bool: True si la firma es válida y no ha expirado
+    """
+    if not token or ':' not in token:
+        return False
+    timestamp, _ = token.split(':', 1)
+    if not timestamp.isdigit():
+        return False
+    now = now if now is not None else time.time()
+    if abs(now - int(timestamp)) > max_age:
+        return False
+    return hmac.compare_digest(token, sign_token(secret, int(timestamp)))
+
+
+class Profiler:
+    """
+    Perfilado por petición
+    
+    Se perfila una fracción aleatoria de las peticiones y cualquier
+    petición con un token firmado válido. cProfile solo admite un perfil
+    activo a la vez, así que si otra petición ya se está perfilando la
+    actual se atiende sin perfilar.
+    """
+    
+    def __init__(self, directory, sample_rate=0.0, header='X-Profile-Token', token_max_age=300,
+                 max_files=500, top=20, secret=SECRET_KEY):
+        """
+        Args:
+            directory: Carpeta de los archivos pstats
+            sample_rate: Fracción de peticiones perfiladas (0 a 1)
+            header: Header con el token firmado
+            token_max_age: Validez del token en segundos
+            max_files: Perfiles conservados (se eliminan los más antiguos)
+            top: Funciones retornadas por defecto en el endpoint
+            secret: Clave de firma de los tokens
+            
+        Raises:
+            ValueError: Si secret está vacío o es el valor por defecto
+        """
+        if not secret or secret == DEFAULT_SECRET_KEY:
+            raise ValueError('PROFILING requiere definir SECRET_KEY')
+        
+        self.directory = str(directory)
+        self.sample_rate = sample_rate
+        self.header = header
+        self.token_max_age = token_max_age
+        self.max_files = max_files
+        self.top = top
+        self.secret = secret
+        self._busy = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+    
+    @classmethod
+    def from_settings(cls, settings=PROFILING):
+        """Crea el perfilador a partir de PROFILING"""
+        return cls(
+            directory=settings['dir'],
+            sample_rate=settings.get('sample_rate', 0.0),
+            header=settings.get('header', 'X-Profile-Token'),
+            token_max_age=settings.get('token_max_age', 300),
+            max_files=settings.get('max_files', 500),
+            top=settings.get('top', 20),
+        )
+    
+    def init_app(self, app, path=PROFILING['path']):
+        """
+        Registra los hooks y el endpoint de administración
+        
+        Args:
+            app: Aplicación Flask
+            path: Ruta del endpoint de administración
+        """
+        app.before_request(self._before_request)
+        app.teardown_request(self._teardown_request)
+        app.add_url_rule(path, 'admin_profiles', self._profiles_view, methods=['GET'])
+    
+    def _authorized(self):
+        """Verifica el token firmado de la petición"""
+        return verify_token(request.headers.get(self.header), self.secret, self.token_max_age)
+    
+    # ==========================================
+    # Hooks
+    # ==========================================
+    
+    def _before_request(self):
+        if request.endpoint == 'admin_profiles':
+            return
+        if not (random.random() < self.sample_rate or
+                (self.header in request.headers and self._authorized())):
+            return
+        if not self._busy.acquire(blocking=False):
+            return
+        
+        profiler = cProfile.Profile()
+        g._profiler = profiler
+        profiler.enable()
+    
+    def _teardown_request(self, exc):
+        profiler = g.pop('_profiler', None)
+        if profiler is None:
+            return
+        profiler.disable()
+        self._busy.release()
+        self._save(profiler, request.endpoint or 'none')
+    
+    def _save(self, profiler, endpoint):
+        """Guarda el perfil y elimina los más antiguos"""
+        name = f'{time.time_ns()}-{os.getpid()}-{_UNSAFE.sub("_", endpoint)}.pstats'
+        profiler.dump_stats(os.path.join(self.directory, name))
+        
+        files = self._files()
+        for old in files[:max(0, len(files) - self.max_files)]:
+            try:
+                os.remove(os.path.join(self.directory, old))
+            except OSError:
+                pass
+    
+    def _files(self, endpoint=None):
+        """Archivos de perfil ordenados del más antiguo al más reciente"""
+        suffix = f'-{_UNSAFE.sub("_", endpoint)}.pstats' if endpoint else '.pstats'
+        return sorted(f for f in os.listdir(self.directory) if f.endswith(suffix))
+    
+    # ==========================================
+    # Consulta
+    # ==========================================
+    
+    def hot_functions(self, endpoint=None, top=None, sort='cumulative'):
+        """
+        Funciones con más tiempo en los perfiles guardados
+        
+        Args:
+            endpoint: Limitar a un endpoint (None para todos)
+            top: Número de funciones
+            sort: 'cumulative', 'tottime' o 'calls'
+            
+        Returns:
+            tuple: (número de perfiles agregados, lista de funciones)
+        """
+        files = self._files(endpoint)
+        if not files:
+            return 0, []
+        
+        stats = pstats.Stats(*(os.path.join(self.directory, f) for f in files))
+        column = SORT_KEYS[sort]
+        rows = sorted(stats.stats.items(), key=lambda item: item[1][column], reverse=True)
+        
+        functions = []
+        for (filename, line, name), (primitive, calls, tottime, cumulative, _) in rows[:top or self.top]:
+            functions.append({
+                'function': name,
+                'file': filename,
+                'line': line,
+                'calls': calls,
+                'primitive_calls': primitive,
+                'tottime_ms': round(tottime * 1000, 3),
+                'cumulative_ms': round(cumulative * 1000, 3),
+            })
+        return len(files), functions
+    
+    def _profiles_view(self):
+        """GET /api/v1/admin/profiles?endpoint=&top=&sort= (requiere token; top <= MAX_TOP)"""
+        if not self._authorized():
+            return jsonify({
+                'status': 'error',
+                'message': 'Token de profiling inválido'
+            }), 403
+        
+        sort = request.args.get('sort', 'cumulative')
+        if sort not in SORT_KEYS:
+            return jsonify({
+                'status': 'error',
+                'message': f'sort debe ser uno de: {", ".join(SORT_KEYS)}'
+            }), 400
+        
+        try:
+            top = int(request.args.get('top', self.top))
+        except ValueError:
+            return jsonify({
+                'status': 'error',
+                'message': 'top debe ser un número entero'
+            }), 400
+        if top < 1:
+            return jsonify({
+                'status': 'error',
+                'message': 'top debe ser mayor que 0'
+            }), 400
+        top = min(top, MAX_TOP)
+        
+        endpoint = request.args.get('endpoint')
+        profiles, functions = self.hot_functions(endpoint, top, sort)
+        return jsonify({
+            'status': 'success',
+            'endpoint': endpoint,
+            'profiles': profiles,
+            'sort': sort,
+            'data': functions
+        }), 200
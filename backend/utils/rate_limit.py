@@ -0,0 +1,220 @@
+"""
+Utils: Rate Limit
+Limitador de peticiones por cliente (token bucket) como middleware
+"""
+
+import math
+import threading
+import time
+
+from flask import jsonify, request
+
+from config.settings import CACHE, RATE_LIMIT
+from utils.cache import CacheUnavailable, RedisClient, RedisError
+
+# Token bucket atómico en Redis. Usa el reloj del servidor para que todos
+# los procesos vean el mismo tiempo. Retorna los segundos de espera (0 si
+# se permite) como texto, porque Redis trunca los números de Lua a enteros.
+_REDIS_HIT = """
+redis.replicate_commands()
+local calls = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local rate = calls / period
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = calls
+if state[1] then
+    tokens = math.min(calls, tonumber(state[1]) + (now - tonumber(state[2])) * rate)
+end
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(period))
+return tostring(wait)
+"""
+
+
+class RedisBuckets:
+    """
+    Buckets guardados en Redis, compartidos por todos los procesos
+    
+    Cada consulta es un único EVAL, así que la lectura y la actualización
+    del bucket son atómicas aunque varios workers atiendan al mismo
+    cliente. Si Redis no está disponible la petición se permite.
+    """
+    
+    def __init__(self, client, prefix='portafolio:ratelimit:'):
+        """
+        Args:
+            client: RedisClient
+            prefix: Prefijo de las claves de los buckets
+        """
+        self.client = client
+        self.prefix = prefix
+    
+    def hit(self, key, calls, period):
+        """
+        Consume un token del bucket
+        
+        Returns:
+            float: 0 si se permite, o segundos hasta el siguiente token
+        """
+        try:
+            reply = self.client.execute([('EVAL', _REDIS_HIT, 1, self.prefix + key, calls, period)])
+        except (CacheUnavailable, RedisError):
+            return 0.0
+        return float(reply[0])
+
+
+class _Stripe:
+    """Partición de buckets protegida por su propio lock"""
+    
+    __slots__ = ('lock', 'buckets', 'next_sweep')
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.buckets = {}
+        self.next_sweep = 0.0
+
+
+class RateLimiter:
+    """
+    Token bucket por cliente y regla
+    
+    Cada regla permite 'calls' peticiones por 'period' segundos, con
+    recarga continua. Los buckets se reparten en particiones (lock
+    striping) para que peticiones concurrentes de clientes distintos no
+    se serialicen en un único lock. Los buckets inactivos (ya recargados
+    por completo) se eliminan de forma periódica en cada partición.
+    
+    Estos buckets son del proceso: con varios workers cada uno aplica el
+    límite por su cuenta. Con storage (RedisBuckets) se comparten.
+    """
+    
+    def __init__(self, calls, period, routes=None, exempt=(), stripes=16,
+                 trust_proxy=False, storage=None, clock=time.monotonic):
+        """
+        Inicializa el limitador
+        
+        Args:
+            calls: Peticiones permitidas por periodo (regla por defecto)
+            period: Periodo en segundos (regla por defecto)
+            routes: Reglas por endpoint {'blueprint.funcion': {'calls', 'period'}}
+            exempt: Endpoints sin límite
+            stripes: Número de particiones de buckets
+            trust_proxy: Usar X-Forwarded-For para identificar al cliente
+            storage: Buckets compartidos (RedisBuckets) o None para usar
+                los del proceso
+            clock: Reloj monótono (inyectable para pruebas)
+        """
+        self.default_rule = ('default', calls, period)
+        self.rules = {
+            endpoint: (endpoint, rule['calls'], rule['period'])
+            for endpoint, rule in (routes or {}).items()
+        }
+        self.exempt = frozenset(exempt)
+        self.trust_proxy = trust_proxy
+        self.storage = storage
+        self.clock = clock
+        self._stripes = [_Stripe() for _ in range(stripes)]
+    
+    @classmethod
+    def from_settings(cls, settings=RATE_LIMIT):
+        """Crea el limitador a partir de RATE_LIMIT"""
+        storage = None
+        if settings.get('storage') == 'redis':
+            storage = RedisBuckets(RedisClient.from_settings(CACHE),
+                                   prefix=CACHE.get('prefix', 'portafolio:') + 'ratelimit:')
+        return cls(
+            calls=settings['calls'],
+            period=settings['period'],
+            routes=settings.get('routes'),
+            exempt=settings.get('exempt', ()),
+            stripes=settings.get('stripes', 16),
+            trust_proxy=settings.get('trust_proxy', False),
+            storage=storage,
+        )
+    
+    def init_app(self, app):
+        """
+        Registra el limitador como middleware de la app
+        
+        Args:
+            app: Aplicación Flask
+        """
+        app.before_request(self._before_request)
+    
+    def hit(self, client, rule):
+        """
+        Consume un token del bucket de un cliente
+        
+        Args:
+            client: Identificador del cliente
+            rule: Tupla (nombre, calls, period)
+            
+        Returns:
+            float: 0 si se permite, o segundos hasta el siguiente token
+        """
+        name, calls, period = rule
+        if self.storage is not None:
+            return self.storage.hit(f'{name}:{client}', calls, period)
+        
+        rate = calls / period
+        key = (client, name)
+        stripe = self._stripes[hash(key) % len(self._stripes)]
+        now = self.clock()
+        
+        with stripe.lock:
+            if now >= stripe.next_sweep:
+                self._sweep(stripe, now)
+            
+            bucket = stripe.buckets.get(key)
+            if bucket is None:
+                tokens = float(calls)
+            else:
+                tokens = min(float(calls), bucket[0] + (now - bucket[1]) * rate)
+            
+            if tokens >= 1.0:
+                stripe.buckets[key] = (tokens - 1.0, now, period)
+                return 0.0
+            
+            stripe.buckets[key] = (tokens, now, period)
+            return (1.0 - tokens) / rate
+    
+    def _sweep(self, stripe, now):
+        """Elimina los buckets que ya se recargaron por completo"""
+        idle = [key for key, (_, last, period) in stripe.buckets.items() if now - last >= period]
+        for key in idle:
+            del stripe.buckets[key]
+        stripe.next_sweep = now + self.default_rule[2]
+    
+    def _client_id(self):
+        """Identificador del cliente de la petición actual"""
+        if self.trust_proxy and request.access_route:
+            return request.access_route[0]
+        return request.remote_addr or 'unknown'
+    
+    def _before_request(self):
+        """Rechaza con 429 las peticiones que exceden el límite"""
+        endpoint = request.endpoint
+        if request.method == 'OPTIONS' or endpoint is None or endpoint in self.exempt:
+            return None
+        
+        rule = self.rules.get(endpoint, self.default_rule)
+        retry_after = self.hit(self._client_id(), rule)
+        if not retry_after:
+            return None
+        
+        response = jsonify({
+            'status': 'error',
+            'message': 'Demasiadas solicitudes, intenta de nuevo más tarde'
+        })
+        response.status_code = 429
+        response.headers['Retry-After'] = str(math.ceil(retry_after))
+        response.headers['X-RateLimit-Limit'] = str(rule[1])
+        return response
@@ -0,0 +1,157 @@
+"""
+Utils: Serialization
+Codificación JSON y armado de respuestas a partir de fragmentos cacheados
+
+Usa orjson (codificador en C) cuando está instalado y json de la
+biblioteca estándar en caso contrario. orjson solo representa enteros de
+64 bits: los valores que no admite se codifican y decodifican con json.
+"""
+
+import json
+import re
+from datetime import date, datetime
+
+from flask import Response, jsonify
+from flask.json.provider import DefaultJSONProvider
+
+from config.settings import API_RESPONSE
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depende del entorno
+    orjson = None
+
+# Nombre del codificador activo
+JSON_BACKEND = 'orjson' if orjson is not None else 'json'
+
+# Literal numérico de 19 o más dígitos: orjson podría convertirlo en float
+_LONG_NUMBER = re.compile(r'\d{19,}')
+_LONG_NUMBER_BYTES = re.compile(rb'\d{19,}')
+
+
+def _default(obj):
+    """Serializa los tipos que el codificador no conoce"""
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    raise TypeError(f'Objeto de tipo {type(obj).__name__} no es serializable a JSON')
+
+
+def dumps(obj, pretty=False):
+    """
+    Codifica un objeto a JSON en UTF-8
+    
+    Args:
+        obj: Objeto serializable (incluye Project, Message y datetime)
+        pretty: Indentar la salida
+        
+    Returns:
+        bytes: JSON codificado
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=_default, option=orjson.OPT_INDENT_2 if pretty else 0)
+        except TypeError:
+            # Enteros de más de 64 bits o claves no str; json los admite
+            pass
+    
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2, default=_default).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=_default).encode('utf-8')
+
+
+def loads(data):
+    """
+    Decodifica JSON
+    
+    Los documentos con números de 19 o más dígitos se decodifican con
+    json para no perder precisión en enteros grandes.
+    
+    Args:
+        data: str o bytes con JSON
+        
+    Returns:
+        object: Valor decodificado
+    """
+    if orjson is not None:
+        pattern = _LONG_NUMBER if isinstance(data, str) else _LONG_NUMBER_BYTES
+        if pattern.search(data) is None:
+            return orjson.loads(data)
+    return json.loads(data)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    Proveedor JSON de Flask basado en dumps/loads de este módulo
+    
+    Emite JSON compacto salvo que API_RESPONSE['pretty_print'] esté
+    activo (variable de entorno API_PRETTY_PRINT). Las llamadas con
+    argumentos de json (sort_keys, indent...) se delegan en json.
+    """
+    
+    pretty = API_RESPONSE['pretty_print']
+    mimetype = API_RESPONSE['content_type']
+    
+    def dumps(self, obj, **kwargs):
+        """Serializa a str"""
+        if kwargs:
+            kwargs.setdefault('default', _default)
+            return super().dumps(obj, **kwargs)
+        return dumps(obj, pretty=self.pretty).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        """Deserializa desde str o bytes"""
+        if kwargs:
+            return json.loads(s, **kwargs)
+        return loads(s)
+    
+    def response(self, *args, **kwargs):
+        """Construye una respuesta JSON sin pasar por str intermedio"""
+        obj = self._prepare_response_obj(args, kwargs)
+        body = dumps(obj, pretty=self.pretty) + (b'\n' if self.pretty else b'')
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+def splice_list(envelope, fragments):
+    """
+    Construye el cuerpo JSON de un listado a partir de fragmentos
+    
+    El sobre se codifica una vez y los elementos ya codificados se
+    concatenan en la clave 'data' sin volver a serializarlos.
+    
+    Args:
+        envelope: Diccionario con los metadatos de la respuesta
+        fragments: Lista de bytes JSON, uno por elemento
+        
+    Returns:
+        bytes: Cuerpo JSON completo
+    """
+    head = dumps(envelope)[:-1]
+    separator = b',' if len(head) > 1 else b''
+    return head + separator + b'"data":[' + b','.join(fragments) + b']}'
+
+
+def list_response(envelope, items, fields=None):
+    """
+    Respuesta JSON de un listado de modelos
+    
+    Sin fields se reutiliza el JSON memoizado de cada elemento; con
+    fields (o con pretty_print activo) se construyen los diccionarios.
+    
+    Args:
+        envelope: Diccionario con los metadatos de la respuesta
+        items: Modelos con to_dict y to_json_bytes
+        fields: Campos a incluir (None para todos)
+        
+    Returns:
+        Response: Respuesta JSON
+    """
+    if fields is None and not FastJSONProvider.pretty:
+        body = splice_list(envelope, [item.to_json_bytes() for item in items])
+        return Response(body, mimetype=FastJSONProvider.mimetype)
+    
+    envelope['data'] = [item.to_dict(fields) for item in items]
+    return jsonify(envelope)
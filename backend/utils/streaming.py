@@ -0,0 +1,82 @@
+"""
+Utils: Streaming
+Exportación en streaming con JSON delimitado por líneas (NDJSON)
+"""
+
+import zlib
+
+from flask import Response, request
+
+from utils.serialization import dumps
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+
+def ndjson_chunks(pages, fields=None):
+    """
+    Convierte páginas de modelos en bloques NDJSON
+    
+    Args:
+        pages: Iterador de listas de modelos
+        fields: Campos a incluir (None para todos)
+        
+    Yields:
+        bytes: Una línea JSON por registro, agrupadas por página
+    """
+    for page in pages:
+        if fields is None:
+            lines = [item.to_json_bytes() for item in page]
+        else:
+            lines = [dumps(item.to_dict(fields)) for item in page]
+        yield b'\n'.join(lines) + b'\n'
+
+
+def gzip_chunks(chunks, level=6):
+    """
+    Comprime un flujo de bloques como un único miembro gzip
+    
+    Cada bloque se vacía con Z_SYNC_FLUSH para que el cliente pueda
+    descomprimir los registros a medida que llegan.
+    
+    Args:
+        chunks: Iterador de bytes
+        level: Nivel de compresión
+        
+    Yields:
+        bytes: Bloques comprimidos
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def accepts_gzip():
+    """Indica si el cliente de la petición actual acepta gzip"""
+    return 'gzip' in request.accept_encodings
+
+
+def ndjson_response(pages, fields=None, filename=None):
+    """
+    Respuesta en streaming con un registro JSON por línea
+    
+    Se comprime con gzip cuando el cliente lo acepta en Accept-Encoding.
+    
+    Args:
+        pages: Iterador de listas de modelos
+        fields: Campos a incluir (None para todos)
+        filename: Nombre sugerido para la descarga
+        
+    Returns:
+        Response: Respuesta en streaming
+    """
+    chunks = ndjson_chunks(pages, fields)
+    headers = {'Vary': 'Accept-Encoding'}
+    if filename:
+        headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+    if accepts_gzip():
+        chunks = gzip_chunks(chunks)
+        headers['Content-Encoding'] = 'gzip'
+    return Response(chunks, mimetype=NDJSON_MIMETYPE, headers=headers)